@@ -0,0 +1,65 @@
+"""Measure command throughput of the Qt-free engine.
+
+Runs anywhere, PyQt6 is not needed:  python benchmarks/bench_engine.py [rounds]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import activity_log, command_history, utils  # noqa: E402
+from core.engine import OutputSink, ScriptInput, Session  # noqa: E402
+
+# One round: (command, answers it asks for)
+ROUND = [
+    ("fortune", []),
+    ("help", []),
+    ("note write benchmark note", []),
+    ("note read", []),
+    ("note delete 1", []),
+    ("calc x = 2 + 3 * 4", []),
+    ("calc x ** 2 / 7 + ans", []),
+    ("hack", []),
+    ("unknown", []),
+]
+
+
+class NullOutput(OutputSink):
+    def __init__(self):
+        self.lines = 0
+
+    def write_line(self, text, color="white", bold=False):
+        self.lines += 1
+        return self.lines - 1
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as root:
+        utils.USERS_FILE = os.path.join(root, "users.json")
+        activity_log.LOG_DIR = os.path.join(root, "logs")
+        command_history.COMMAND_HISTORY_DIR = os.path.join(root, "history")
+        store = utils.JournalStore(os.path.join(root, "users"))
+        store.create_user("bench", "bench")
+        output = NullOutput()
+        session = Session("bench", store.get_user("bench"), output, ScriptInput(iter([])))
+
+        commands = 0
+        start = time.perf_counter()
+        with session.writer.batch():
+            for _ in range(rounds):
+                for command, replies in ROUND:
+                    session.input.lines = iter(replies)
+                    session.execute(command)
+                    commands += 1
+        elapsed = time.perf_counter() - start
+        session.shutdown()
+        store.close()
+        print(f"{commands} commands in {elapsed:.3f} s = {commands / elapsed:,.0f} commands/sec, "
+              f"{output.lines} lines of output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure terminal output throughput of TerminalOutput against per-line inserts.
+
+Runs without a display:  QT_QPA_PLATFORM=offscreen python benchmarks/bench_output.py [lines]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QTextEdit  # noqa: E402
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor  # noqa: E402
+from core.output import TerminalOutput  # noqa: E402
+
+COLORS = ["white", "lime", "red", "yellow"]
+
+
+def generate(lines):
+    """The (text, color) lines both sides write: runs of 50 lines per color"""
+    for i in range(lines):
+        yield f"line {i}", COLORS[(i // 50) % 4]
+
+
+def per_line(view, lines):
+    # What print_line used to do for every line
+    for text, color in generate(lines):
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        cursor = view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text + "\n", fmt)
+        view.setTextCursor(cursor)
+        view.ensureCursorVisible()
+
+
+def buffered(view, lines):
+    out = TerminalOutput(view)
+    for i, (text, color) in enumerate(generate(lines)):
+        out.write_line(text, color)
+        if i % 1000 == 999:
+            QApplication.processEvents()  # let frames happen as in the running app
+    out.flush()
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    app = QApplication(sys.argv)  # noqa: F841
+    for name, func, count in (("per-line insert", per_line, min(lines, 20_000)), ("TerminalOutput", buffered, lines)):
+        view = QTextEdit()
+        view.setReadOnly(True)
+        view.show()
+        start = time.perf_counter()
+        func(view, count)
+        QApplication.processEvents()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>16}: {count} lines in {elapsed:.3f} s = {count / elapsed:,.0f} lines/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare the cost of one per-command save as the user base grows.
+
+Run from the repository root:  python benchmarks/bench_save.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import utils  # noqa: E402
+
+SIZES = [10, 100, 1000, 3000]
+SAVES = 20
+
+
+def make_users(count):
+    return {
+        f"user{i}": {
+            "password": "secret",
+            "language": 0,
+            "history": list(range(200)),
+            "notes": [f"note {n} for user {i}" for n in range(20)]
+        }
+        for i in range(count)
+    }
+
+
+def bench(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        utils.USERS_FILE = os.path.join(tmp, "users.json")
+        utils.USERS_DIR = os.path.join(tmp, "users")
+        users = make_users(count)
+        utils.save_users(users)
+
+        start = time.perf_counter()
+        for i in range(SAVES):
+            users["user0"]["history"].append(i)
+            utils.save_users(users)
+        full = (time.perf_counter() - start) / SAVES
+
+        store = utils.JournalStore()
+        start = time.perf_counter()
+        for i in range(SAVES):
+            store.append([{"op": "history", "user": "user0", "values": [i]}])
+        journal = (time.perf_counter() - start) / SAVES
+        store.close()
+
+        store = utils.SQLiteStore(os.path.join(tmp, "users.db"))
+        store.import_users(users)
+        start = time.perf_counter()
+        for i in range(SAVES):
+            store.append([{"op": "history", "user": "user0", "values": [i]}])
+        sqlite = (time.perf_counter() - start) / SAVES
+
+        start = time.perf_counter()
+        for i in range(SAVES):
+            store.get_user(f"user{i % count}")
+        login = (time.perf_counter() - start) / SAVES
+        store.close()
+    return full, journal, sqlite, login
+
+
+def main():
+    print(f"{'users':>8} {'full rewrite':>14} {'journal':>10} {'sqlite':>10} {'sqlite login':>14}")
+    for count in SIZES:
+        full, journal, sqlite, login = bench(count)
+        print(f"{count:>8} {full * 1e3:>11.3f} ms {journal * 1e3:>7.3f} ms "
+              f"{sqlite * 1e3:>7.3f} ms {login * 1e3:>11.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
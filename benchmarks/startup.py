@@ -0,0 +1,79 @@
+"""Measure how long the application takes to start.
+
+Two milestones, each from process launch:
+  login_window  the boot loader has finished warming up and drawn the login window
+  first_prompt  a terminal for a logged-in user has printed its welcome and takes
+                commands (started with --script, which skips the login screen)
+
+Runs from source and, for every --frozen executable given, from a PyInstaller
+build, on Qt's offscreen platform, each run in a fresh data directory:
+
+    python benchmarks/startup.py [--runs 5] [--frozen dist/main] [--frozen dist/main_fast/main_fast]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+MILESTONES = ["login_window", "first_prompt"]
+TIMEOUT = 60  # seconds a run may take before it is abandoned
+
+
+def launch(command, milestone, data_dir):
+    """Seconds from launch to the milestone in one run"""
+    probe = os.path.join(data_dir, "probe.txt")
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", TERMINALOS_STARTUP_PROBE=probe)
+    if milestone == "first_prompt":
+        script = os.path.join(data_dir, "quit.txt")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write("quit\n")
+        command = command + ["--script", script, "--user", "bench", "--password", "bench"]
+    start = time.time()
+    subprocess.run(command, cwd=data_dir, env=env, timeout=TIMEOUT,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with open(probe, encoding="utf-8") as f:
+        marks = dict(line.split() for line in f)
+    if milestone not in marks:
+        raise RuntimeError(f"{' '.join(command)} never reached {milestone}")
+    return float(marks[milestone]) - start
+
+
+def measure(command, milestone, runs):
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as data_dir:
+            times.append(launch(command, milestone, data_dir))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how long the application takes to start.")
+    parser.add_argument("--runs", type=int, default=5, help="launches per milestone (default 5)")
+    parser.add_argument("--frozen", action="append", default=[], metavar="EXE",
+                        help="a built executable to measure as well (repeatable)")
+    parser.add_argument("--no-source", action="store_true", help="only measure the --frozen builds")
+    args = parser.parse_args()
+
+    targets = [] if args.no_source else [("source", [sys.executable, os.path.abspath(os.path.join(ROOT, "main.py"))])]
+    targets += [(path, [os.path.abspath(path)]) for path in args.frozen]
+    if not targets:
+        parser.error("nothing to measure")
+
+    print(f"{'target':<32} {'milestone':<13} {'first':>8} {'median':>8} {'min':>8}  ({args.runs} runs)")
+    for name, command in targets:
+        for milestone in MILESTONES:
+            try:
+                times = measure(command, milestone, args.runs)
+            except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+                print(f"{name:<32} {milestone:<13} failed: {e}")
+                continue
+            print(f"{name:<32} {milestone:<13} {times[0] * 1000:>6.0f}ms {statistics.median(times) * 1000:>6.0f}ms "
+                  f"{min(times) * 1000:>6.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Hammer one user store from several processes and check that nothing is lost.
+
+Every worker appends calculator results and notes for a user of its own and
+for one user shared by all workers, and deletes a scratch note through a
+possibly stale view of the shared notes. At the end every result and every
+kept note must be present and every scratch note gone.
+
+Run from the repository root:  python benchmarks/stress_store.py [json|sqlite] [processes] [rounds]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import utils  # noqa: E402
+
+
+def open_store(backend, tmp):
+    utils.USERS_FILE = os.path.join(tmp, "users.json")
+    utils.USERS_DIR = os.path.join(tmp, "users")
+    utils.DB_FILE = os.path.join(tmp, "users.db")
+    return utils.SQLiteStore() if backend == "sqlite" else utils.JournalStore()
+
+
+def worker(backend, tmp, worker_id, rounds):
+    store = open_store(backend, tmp)
+    own = store.get_user(f"worker{worker_id}")
+    shared = store.get_user("shared")
+    own_writer = utils.UserDataWriter(own, debounce=0)
+    shared_writer = utils.UserDataWriter(shared, debounce=0.001)
+    for i in range(rounds):
+        own_writer.add_history([i])
+        shared_writer.add_history([f"{worker_id}-{i}"])
+        shared_writer.add_note(f"keep {worker_id}-{i}")
+        shared_writer.add_note(f"scratch {worker_id}-{i}")
+        shared_writer.flush()
+        shared_writer.delete_note(shared.notes.index(f"scratch {worker_id}-{i}"))
+    own_writer.close()
+    shared_writer.close()
+    store.close()
+
+
+def run(backend, processes, rounds):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = open_store(backend, tmp)
+        store.create_user("shared", "x")
+        for worker_id in range(processes):
+            store.create_user(f"worker{worker_id}", "x")
+
+        ctx = multiprocessing.get_context("spawn")
+        jobs = [ctx.Process(target=worker, args=(backend, tmp, worker_id, rounds)) for worker_id in range(processes)]
+        start = time.perf_counter()
+        for job in jobs:
+            job.start()
+        for job in jobs:
+            job.join()
+        elapsed = time.perf_counter() - start
+
+        lost = []
+        shared = store.get_user("shared")
+        for worker_id in range(processes):
+            if store.get_user(f"worker{worker_id}").history != list(range(rounds)):
+                lost.append(f"history of worker{worker_id}")
+            for i in range(rounds):
+                if f"{worker_id}-{i}" not in shared.history:
+                    lost.append(f"shared result {worker_id}-{i}")
+                if f"keep {worker_id}-{i}" not in shared.notes:
+                    lost.append(f"shared note keep {worker_id}-{i}")
+                if f"scratch {worker_id}-{i}" in shared.notes:
+                    lost.append(f"shared note delete scratch {worker_id}-{i}")
+        store.close()
+    return elapsed, lost
+
+
+def main():
+    backends = [sys.argv[1]] if len(sys.argv) > 1 else ["json", "sqlite"]
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    failed = False
+    for backend in backends:
+        elapsed, lost = run(backend, processes, rounds)
+        status = "OK" if not lost else f"LOST {len(lost)} update(s): {', '.join(lost[:5])}"
+        print(f"{backend:>6}: {processes} processes x {rounds} rounds in {elapsed:.2f} s - {status}")
+        failed = failed or bool(lost)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import atexit
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+
+from core.utils import BASE_DIR, FileLock, user_dir_name
+
+LOG_DIR = os.environ.get("TERMINALOS_LOG_DIR", os.path.join(BASE_DIR, "logs"))
+LOG_MAX_BYTES = 1024 * 1024  # size at which the current day's log rolls over
+BATCH_SIZE = 256  # lines written per batch at most
+INDEX_BLOCK_BYTES = 16 * 1024  # log bytes summarized by one index entry
+LOG_RETENTION_DAYS = int(os.environ.get("TERMINALOS_LOG_RETENTION_DAYS", "0"))  # 0 keeps logs forever
+
+_open_logs = set()
+
+
+class ActivityLog:
+    """Per-user activity log written in batches from a background thread.
+
+    log() only puts the entry on a queue. The writer thread keeps the current
+    file open and writes whatever has queued up in one go, so a burst of
+    commands costs one write instead of an open/write/close per line.
+
+    Entries are JSON lines, {"ts": <epoch seconds>, "event": ..., ...}, in
+    LOG_DIR/<user>/activity-YYYY-MM-DD.jsonl, rolling over to
+    activity-YYYY-MM-DD.1.jsonl, .2.jsonl, ... once they pass max_bytes.
+    Next to every log an .idx file summarizes each INDEX_BLOCK_BYTES block of
+    it (byte range, first and last timestamp, event types) so query() only
+    reads the blocks that can match.
+
+    Sessions of the same user share these files. Every batch is written
+    under a lock file in the user's log directory, and byte offsets are
+    taken from the file itself under that lock, so a block never spans
+    lines of another session. Logs are kept forever unless
+    TERMINALOS_LOG_RETENTION_DAYS is set; then logs of days more than that
+    many days ago are deleted when a new day's log is started.
+    """
+
+    def __init__(self, username, log_dir=None, max_bytes=LOG_MAX_BYTES):
+        self.username = username
+        self.directory = os.path.join(log_dir or LOG_DIR, user_dir_name(username))
+        self.max_bytes = max_bytes
+        self._queue = queue.Queue()
+        self._file = None
+        self._index = None
+        self._block = None
+        self._day = None
+        self._part = 0
+        self._size = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"log-{username}", daemon=True)
+        self._thread.start()
+        _open_logs.add(self)
+
+    def log(self, event, **fields):
+        if not self._closed:
+            self._queue.put(dict(fields, ts=round(time.time(), 3), event=event))
+
+    def _path(self, extension=".jsonl"):
+        suffix = f".{self._part}" if self._part else ""
+        return os.path.join(self.directory, f"activity-{self._day}{suffix}{extension}")
+
+    def _open(self, day):
+        # Called with the lock held
+        self._close_file()
+        if day != self._day:
+            self._day = day
+            self._part = 0
+            self._prune()
+        # Continue with the newest part of the day, which another session may have started
+        while os.path.exists(self._path()) and os.path.getsize(self._path()) >= self.max_bytes:
+            self._part += 1
+        # newline="\n" keeps byte offsets in the index exact on Windows too
+        self._file = open(self._path(), "a", encoding="utf-8", newline="\n")
+        self._index = open(self._path(".idx"), "a", encoding="utf-8", newline="\n")
+        self._size = os.path.getsize(self._path())
+
+    def _close_block(self):
+        block = self._block
+        self._block = None
+        if block is not None and block["end"] > block["offset"]:
+            block["events"] = sorted(block["events"])
+            self._index.write(json.dumps(block) + "\n")
+
+    def _prune(self):
+        if not LOG_RETENTION_DAYS:
+            return
+        oldest = time.strftime("%Y-%m-%d", time.localtime(time.time() - LOG_RETENTION_DAYS * 86400))
+        for name in os.listdir(self.directory):
+            match = _LOG_FILE.match(name)
+            if match and match.group(1) < oldest:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass  # still open in another session (Windows); the next day tries again
+
+    def _close_file(self):
+        if self._file is not None:
+            self._close_block()
+            self._file.close()
+            self._index.close()
+            self._file = self._index = None
+
+    def _lock(self):
+        os.makedirs(self.directory, exist_ok=True)
+        return FileLock(os.path.join(self.directory, "activity.lock"))
+
+    def _write(self, batch):
+        with self._lock():
+            if self._file is not None:
+                self._size = os.fstat(self._file.fileno()).st_size
+                if self._block is not None and self._block["end"] != self._size:
+                    self._close_block()  # another session wrote after it; start a new block
+            self._write_locked(batch)
+
+    def _write_locked(self, batch):
+        lines = []
+        for entry in batch:
+            day = time.strftime("%Y-%m-%d", time.localtime(entry["ts"]))
+            if self._file is None or day != self._day or self._size >= self.max_bytes:
+                if lines:
+                    self._file.write("".join(lines))
+                    lines = []
+                self._open(day)
+            if self._block is None:
+                self._block = {"offset": self._size, "end": self._size,
+                               "first": entry["ts"], "last": entry["ts"], "events": set()}
+            line = json.dumps(entry, ensure_ascii=False) + "\n"
+            lines.append(line)
+            self._size += len(line.encode("utf-8"))
+            self._block["end"] = self._size
+            self._block["last"] = entry["ts"]
+            self._block["events"].add(entry["event"])
+            if self._size - self._block["offset"] >= INDEX_BLOCK_BYTES:
+                self._file.write("".join(lines))
+                lines = []
+                self._close_block()
+        if lines:
+            self._file.write("".join(lines))
+        self._file.flush()
+        self._index.flush()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            entries = [item for item in batch if item is not None]
+            if entries:
+                self._write(entries)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                with self._lock():
+                    self._close_file()
+                return
+
+    def flush(self):
+        """Wait until everything logged so far is on disk"""
+        if not self._closed:
+            self._queue.join()
+
+    def query(self, **filters):
+        """query_log() over this user's logs, including entries still queued"""
+        self.flush()
+        return query_log(self.directory, **filters)
+
+    def close(self):
+        """Write out everything queued so far and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        _open_logs.discard(self)
+
+
+_LOG_NAME = re.compile(r"activity-(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.jsonl$")
+_LOG_FILE = re.compile(r"activity-(\d{4}-\d{2}-\d{2})(?:\.\d+)?\.(?:jsonl|idx)$")
+
+
+def _read_index(path):
+    blocks = []
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    blocks.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+    return blocks
+
+
+def query_log(directory, since=None, until=None, event=None, text=None, limit=50):
+    """Return the newest `limit` entries matching every given filter.
+
+    since/until are epoch seconds, event is an event type and text a
+    case-insensitive substring of the command. Whole files are skipped by the
+    date in their name and blocks inside a file by its index; only the part
+    of a log written after its last index entry is read unconditionally.
+    """
+    if not os.path.isdir(directory):
+        return []
+    first_day = time.strftime("%Y-%m-%d", time.localtime(since)) if since is not None else None
+    last_day = time.strftime("%Y-%m-%d", time.localtime(until)) if until is not None else None
+    logs = []
+    for name in os.listdir(directory):
+        match = _LOG_NAME.match(name)
+        if not match:
+            continue
+        day = match.group(1)
+        if (first_day and day < first_day) or (last_day and day > last_day):
+            continue
+        logs.append((day, int(match.group(2) or 0), name))
+    logs.sort()
+
+    text = text.lower() if text else None
+    results = deque(maxlen=limit)
+    for _, _, name in logs:
+        path = os.path.join(directory, name)
+        # Sessions sharing the log index their blocks in the order they close them
+        blocks = sorted(_read_index(path[:-len(".jsonl")] + ".idx"), key=lambda block: block["offset"])
+        ranges = []
+        indexed_end = 0
+        for block in blocks:
+            if block["offset"] > indexed_end:
+                # Not indexed (yet): a session's open block, or one that never got to index it
+                ranges.append((indexed_end, block["offset"]))
+            indexed_end = max(indexed_end, block["end"])
+            if ((since is None or block["last"] >= since)
+                    and (until is None or block["first"] <= until)
+                    and (event is None or event in block["events"])):
+                ranges.append((block["offset"], block["end"]))
+        ranges.append((indexed_end, None))  # not indexed yet
+        with open(path, "rb") as f:
+            for start, end in ranges:
+                f.seek(start)
+                data = f.read(end - start) if end is not None else f.read()
+                for line in data.splitlines():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn line at the tail of a log being written
+                    if since is not None and entry["ts"] < since:
+                        continue
+                    if until is not None and entry["ts"] > until:
+                        continue
+                    if event is not None and entry["event"] != event:
+                        continue
+                    if text is not None and text not in entry.get("command", "").lower():
+                        continue
+                    results.append(entry)
+    return list(results)
+
+
+def parse_time(value):
+    """Epoch seconds for "YYYY-MM-DD", "YYYY-MM-DDTHH:MM" or an age like 30m, 2h, 7d"""
+    match = re.fullmatch(r"(\d+)([smhd])", value)
+    if match:
+        seconds = {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+        return time.time() - int(match.group(1)) * seconds
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d"):
+        try:
+            return time.mktime(time.strptime(value, fmt))
+        except ValueError:
+            continue
+    raise ValueError(f"invalid time: {value}")
+
+
+@atexit.register
+def _close_all():
+    for activity_log in list(_open_logs):
+        activity_log.close()
@@ -0,0 +1,136 @@
+import time
+from abc import ABC, abstractmethod
+
+TICK_MS = 15  # resolution of the shared animation timer
+
+
+class Animation(ABC):
+    """A block of `height` terminal lines redrawn every `interval_ms`.
+
+    Subclasses implement frame(index) returning a list of (text, color, bold)
+    tuples, one per line.
+    """
+
+    height = 1
+    interval_ms = 100
+
+    @abstractmethod
+    def frame(self, index: int) -> list:
+        ...
+
+
+class FrameAnimation(Animation):
+    """Cycle through a fixed list of frames"""
+
+    def __init__(self, frames: list, interval_ms: int):
+        self.frames = frames
+        self.interval_ms = interval_ms
+        self.height = max(len(frame) for frame in frames)
+
+    def frame(self, index: int) -> list:
+        return self.frames[index % len(self.frames)]
+
+
+class Timeline:
+    """A declarative sequence of (delay_ms, text, style) steps.
+
+    Each step prints `text` `delay_ms` after the previous one. `style` is a
+    color name or a (color, bold) tuple.
+    """
+
+    def __init__(self, steps: list):
+        self.steps = []
+        for delay_ms, text, style in steps:
+            color, bold = (style, False) if isinstance(style, str) else style
+            self.steps.append((delay_ms, text, color, bold))
+
+
+class AnimationScheduler:
+    """Drive every running animation and timeline from one timer.
+
+    start() appends an animation's first frame to the end of the output and
+    remembers the line numbers it got. On each tick the animations that are
+    due compute their next frame and only the lines that differ from the
+    previous frame are rewritten, in place, through TerminalOutput.
+
+    play() runs a Timeline: every tick prints the steps that have come due.
+    Nothing blocks and no nested event loop runs, so input stays live, and
+    cancel_all() stops a timeline half way.
+
+    With quiet set (scripts run with --quiet) nothing is shown or scheduled.
+    """
+
+    def __init__(self, output, quiet: bool = False):
+        self.output = output
+        self.quiet = quiet
+        self._running = {}  # animation -> [line numbers, last frame, frame index, next due time]
+        self._timelines = {}  # timeline -> [next step, due time of that step]
+        from PyQt6.QtCore import QTimer  # the animations themselves don't need Qt
+
+        self._timer = QTimer()
+        self._timer.setInterval(TICK_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self, animation: Animation) -> Animation:
+        if self.quiet:
+            return animation
+        frame = animation.frame(0)
+        blank = ("", "white", False)
+        frame = list(frame) + [blank] * (animation.height - len(frame))
+        numbers = [self.output.write_line(*line) for line in frame]
+        due = time.monotonic() + animation.interval_ms / 1000
+        self._running[animation] = [numbers, frame, 0, due]
+        if not self._timer.isActive():
+            self._timer.start()
+        return animation
+
+    def play(self, timeline: Timeline) -> Timeline:
+        if timeline.steps and not self.quiet:
+            self._timelines[timeline] = [0, time.monotonic() + timeline.steps[0][0] / 1000]
+            self._tick()  # steps without a delay show up right away
+            if self._timelines and not self._timer.isActive():
+                self._timer.start()
+        return timeline
+
+    def is_running(self, job) -> bool:
+        return job in self._running or job in self._timelines
+
+    def cancel(self, job) -> None:
+        self._running.pop(job, None)
+        self._timelines.pop(job, None)
+        if not self._running and not self._timelines:
+            self._timer.stop()
+
+    def cancel_all(self) -> None:
+        self._running.clear()
+        self._timelines.clear()
+        self._timer.stop()
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        for timeline, state in list(self._timelines.items()):
+            step, due = state
+            while step < len(timeline.steps) and due <= now:
+                _, text, color, bold = timeline.steps[step]
+                self.output.write_line(text, color, bold)
+                step += 1
+                if step < len(timeline.steps):
+                    due += timeline.steps[step][0] / 1000
+            if step == len(timeline.steps):
+                self.cancel(timeline)
+            else:
+                state[:] = [step, due]
+        blank = ("", "white", False)
+        for animation, state in list(self._running.items()):
+            numbers, previous, index, due = state
+            if now < due:
+                continue
+            index += 1
+            frame = list(animation.frame(index))
+            frame += [blank] * (len(numbers) - len(frame))
+            for number, old, new in zip(numbers, previous, frame):
+                if old != new:
+                    self.output.replace_line(number, *new)
+            state[1:] = [frame, index, due + animation.interval_ms / 1000]
+            if state[3] < now:
+                state[3] = now + animation.interval_ms / 1000  # fell behind, don't try to catch up
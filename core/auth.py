@@ -1,17 +1,15 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout
 from PyQt6.QtCore import pyqtSignal, Qt
-from core.utils import load_users, save_users
+from core.utils import get_store
 
 class LoginRegisterScreen(QWidget):
-    login_success = pyqtSignal(str, dict)  # emit username and users dict on success
+    login_success = pyqtSignal(str, object)  # emit username and that user's UserRecord on success
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Login / Register")
         self.setFixedSize(400, 300)
 
-        self.users = load_users()
-
         layout = QVBoxLayout()
         self.info_label = QLabel("Please Login or Register")
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -39,12 +37,18 @@ class LoginRegisterScreen(QWidget):
         self.btn_login.clicked.connect(self.try_login)
         self.btn_register.clicked.connect(self.try_register)
 
+    @property
+    def store(self):
+        # Opened by the boot screen's warm-up, not when this screen is built
+        return get_store()
+
     def try_login(self):
         user = self.username_input.text().strip()
         pwd = self.password_input.text()
-        if user in self.users and self.users[user]['password'] == pwd:
+        record = self.store.get_user(user) if user else None
+        if record is not None and record.password == pwd:
             self.info_label.setText(f"Welcome back, {user}!")
-            self.login_success.emit(user, self.users)
+            self.login_success.emit(user, record)
         else:
             self.info_label.setText("Invalid username or password!")
             self.info_label.setStyleSheet("color: red; font-size: 16px;")
@@ -56,16 +60,10 @@ class LoginRegisterScreen(QWidget):
             self.info_label.setText("Please enter username and password.")
             self.info_label.setStyleSheet("color: red; font-size: 16px;")
             return
-        if user in self.users:
+        if self.store.get_profile(user) is not None:
             self.info_label.setText("Username already exists!")
             self.info_label.setStyleSheet("color: red; font-size: 16px;")
             return
-        self.users[user] = {
-            "password": pwd,
-            "language": 0,
-            "history": [],
-            "notes": []
-        }
-        save_users(self.users)
+        self.store.create_user(user, pwd)
         self.info_label.setText(f"User {user} registered! Please login.")
         self.info_label.setStyleSheet("color: green; font-size: 16px;")
@@ -0,0 +1,207 @@
+"""Arithmetic expressions for 'calc', evaluated safely and fast.
+
+An expression is parsed with ast and checked against a small whitelist:
+numbers, + - * / // % **, the functions and constants below, and
+variables. Nothing else (attributes, subscripts, strings, lambdas, ...)
+gets through, so evaluating it can't reach the rest of Python. A checked
+expression is compiled to bytecode once and kept in an LRU keyed by its
+text, so evaluating it again only runs the bytecode.
+
+"name = expr" assigns a variable; every result is also kept as `ans`.
+Integers are exact and unbounded; exponents that would build numbers too
+big to handle are refused.
+"""
+import ast
+import functools
+import math
+from collections import OrderedDict
+
+CACHE_SIZE = 1024  # compiled expressions kept
+MAX_POW_BITS = 100_000  # largest integer a ** may produce, in bits
+RANGE_LIMIT = 10_000_000  # points in one --range
+
+FUNCTIONS = {
+    "abs": abs, "round": round, "min": min, "max": max,
+    "sqrt": math.sqrt, "exp": math.exp, "log": math.log, "log2": math.log2, "log10": math.log10,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan, "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "floor": math.floor, "ceil": math.ceil, "hypot": math.hypot, "gcd": math.gcd,
+}
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau, "inf": math.inf}
+
+_BINARY = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY = (ast.UAdd, ast.USub)
+
+
+class CalcError(Exception):
+    pass
+
+
+def _pow(base, exponent):
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+        if exponent * abs(base).bit_length() > MAX_POW_BITS:
+            raise CalcError("result too large")
+    return base ** exponent
+
+
+def _check(node):
+    """Refuse anything outside the whitelist; turn a ** b into _pow(a, b).
+
+    A plain recursive walk: ast.NodeTransformer would cost more than parsing.
+    """
+    kind = type(node)
+    if kind is ast.Constant:
+        if type(node.value) not in (int, float):
+            raise CalcError(f"not a number: {node.value!r}")
+        return node
+    if kind is ast.Name:
+        if node.id in FUNCTIONS:
+            raise CalcError(f"{node.id} is a function: {node.id}(...)")
+        if node.id.startswith("_"):
+            raise CalcError(f"unknown variable: {node.id}")  # the namespace's own helpers
+        return node
+    if kind is ast.BinOp and isinstance(node.op, _BINARY):
+        node.left, node.right = _check(node.left), _check(node.right)
+        if isinstance(node.op, ast.Pow):
+            function = ast.copy_location(ast.Name("_pow", ast.Load()), node)
+            return ast.copy_location(ast.Call(function, [node.left, node.right], []), node)
+        return node
+    if kind is ast.UnaryOp and isinstance(node.op, _UNARY):
+        node.operand = _check(node.operand)
+        return node
+    if kind is ast.Call:
+        if type(node.func) is not ast.Name or node.func.id not in FUNCTIONS:
+            raise CalcError("unknown function" + (f": {node.func.id}" if type(node.func) is ast.Name else ""))
+        if node.keywords:
+            raise CalcError("functions take positional arguments only")
+        node.args = [_check(arg) for arg in node.args]
+        return node
+    raise CalcError(f"not allowed in an expression: {kind.__name__.lower()}")
+
+
+def parse(text: str):
+    """(variable assigned or None, compiled expression) for one line"""
+    try:
+        tree = ast.parse(text.strip(), "<calc>", "exec")
+    except SyntaxError as e:
+        raise CalcError(f"syntax error: {e.msg}") from None
+    if len(tree.body) != 1:
+        raise CalcError("one expression at a time")
+    statement = tree.body[0]
+    target = None
+    if isinstance(statement, ast.Assign):
+        if len(statement.targets) != 1 or not isinstance(statement.targets[0], ast.Name):
+            raise CalcError("only 'name = expression' can be assigned")
+        target = statement.targets[0].id
+        if target in FUNCTIONS or target in CONSTANTS or target.startswith("_"):
+            raise CalcError(f"'{target}' can't be assigned")
+    elif not isinstance(statement, ast.Expr):
+        raise CalcError("not an expression")
+    return target, compile(ast.Expression(_check(statement.value)), "<calc>", "eval")
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.15g}"
+    try:
+        return str(value)
+    except ValueError:  # more digits than int -> str converts; show it rounded
+        exponent = math.log10(abs(value))
+        return f"{'-' if value < 0 else ''}{10 ** (exponent % 1):.12f}e+{int(exponent)}"
+
+
+def history_value(value):
+    """The value as saved in the calculation history (JSON can't hold every int)"""
+    if isinstance(value, int) and value.bit_length() > 10_000:
+        return format_value(value)
+    return value
+
+
+class Calculator:
+    """One session's variables and compiled expressions"""
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # text -> (target, code)
+        self.variables = {}
+        self._namespace = {"__builtins__": {}, "_pow": _pow, **FUNCTIONS, **CONSTANTS}
+
+    def compile(self, text: str):
+        compiled = self._cache.get(text)
+        if compiled is not None:
+            self._cache.move_to_end(text)
+            return compiled
+        compiled = self._cache[text] = parse(text)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return compiled
+
+    def _run(self, code, namespace):
+        try:
+            return eval(code, namespace)
+        except NameError as e:
+            raise CalcError(f"unknown variable: {e.name}") from None
+        except ZeroDivisionError:
+            raise CalcError("division by zero") from None
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise CalcError(str(e)) from None
+
+    def evaluate(self, text: str):
+        """Evaluate one line, remembering its result as `ans` (and its variable)"""
+        target, code = self.compile(text)
+        value = self._run(code, self._namespace)
+        if type(value) not in (int, float):
+            raise CalcError(f"not a number: {value!r}")
+        self._set("ans", value)
+        if target is not None:
+            self._set(target, value)
+        return value
+
+    def _set(self, name: str, value) -> None:
+        self.variables[name] = value
+        self._namespace[name] = value
+
+    def evaluate_range(self, text: str, name: str, start: float, stop: float, step: float = 1):
+        """(points, values) of an expression over name = start, start + step, ... < stop.
+
+        With NumPy the whole range is one vectorized evaluation; without it,
+        or for what NumPy can't do elementwise, one evaluation per point.
+        """
+        target, code = self.compile(text)
+        if target is not None:
+            raise CalcError("a range takes an expression, not an assignment")
+        if step == 0 or (stop - start) / step <= 0:
+            raise CalcError("empty range")
+        count = math.ceil((stop - start) / step)
+        if count > RANGE_LIMIT:
+            raise CalcError(f"more than {RANGE_LIMIT} points")
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None:
+            points = start + step * numpy.arange(count, dtype=float)  # floats: int64 would wrap around
+            try:
+                with numpy.errstate(all="ignore"):  # nan/inf per element, like NumPy does
+                    values = self._run(code, {**self._namespace, **_numpy_functions(numpy), name: points})
+                return points, numpy.broadcast_to(values, points.shape)
+            except CalcError:
+                pass  # e.g. gcd, which takes integers; evaluate it point by point instead
+        points = [start + step * i for i in range(count)]
+        namespace = dict(self._namespace)
+        values = []
+        for point in points:
+            namespace[name] = point
+            values.append(self._run(code, namespace))
+        return points, values
+
+
+def _numpy_functions(numpy) -> dict:
+    return {
+        "abs": numpy.abs, "round": numpy.round,
+        "min": lambda *args: functools.reduce(numpy.minimum, args),
+        "max": lambda *args: functools.reduce(numpy.maximum, args),
+        "sqrt": numpy.sqrt, "exp": numpy.exp, "log": numpy.log, "log2": numpy.log2, "log10": numpy.log10,
+        "sin": numpy.sin, "cos": numpy.cos, "tan": numpy.tan, "asin": numpy.arcsin, "acos": numpy.arccos,
+        "atan": numpy.arctan, "floor": numpy.floor, "ceil": numpy.ceil, "hypot": numpy.hypot,
+        "_pow": numpy.power,
+    }
@@ -0,0 +1,221 @@
+"""Runs the code editor's snippets in separate, pre-started interpreters.
+
+A snippet never runs in the terminal's own process: an endless loop or a
+memory hog only takes its worker down. The pool keeps POOL_SIZE workers
+(core/code_worker.py) started and waiting, so a run only costs a message
+over a pipe; each worker runs one snippet and is replaced right away.
+Output streams back as the snippet prints it, input() is answered through
+CodeRun.send_input(), and a run is killed by CodeRun.stop() or when it
+exceeds RUN_TIMEOUT seconds. On POSIX a worker's address space is also
+limited to MEMORY_LIMIT_MB.
+
+Snippets are compiled here, once per distinct source: the pool keeps the
+last COMPILE_CACHE_SIZE code objects by source hash and sends them
+marshalled, so re-running unchanged code skips compilation.
+"""
+import base64
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QProcess, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from core.code_worker import FILENAME
+
+POOL_SIZE = 2  # idle workers kept started
+RUN_TIMEOUT = float(os.environ.get("TERMINALOS_CODE_TIMEOUT", "30"))  # seconds; 0 for none
+MEMORY_LIMIT_MB = int(os.environ.get("TERMINALOS_CODE_MEMORY_MB", "512"))  # 0 for none
+COMPILE_CACHE_SIZE = 64
+WORKER_ARGUMENT = "--code-worker"  # main.py runs core.code_worker with it (frozen builds)
+
+
+def worker_command() -> list:
+    if getattr(sys, "frozen", False):
+        return [sys.executable, WORKER_ARGUMENT]
+    return [sys.executable, "-u", os.path.join(os.path.dirname(os.path.abspath(__file__)), "code_worker.py")]
+
+
+class CompileCache:
+    """Marshalled code objects of snippets, by SHA-256 of their source"""
+
+    def __init__(self, size: int = COMPILE_CACHE_SIZE):
+        self.size = size
+        self._code = OrderedDict()
+
+    def get(self, source: str):
+        """(base64 of the marshalled code or None, seconds spent compiling or None if cached)
+
+        None for code that doesn't compile; the worker compiles it again and
+        reports the error like any other.
+        """
+        key = hashlib.sha256(source.encode("utf-8", "surrogatepass")).digest()
+        if key in self._code:
+            self._code.move_to_end(key)
+            return self._code[key], None
+        start = time.perf_counter()
+        try:
+            code = compile(source, FILENAME, "exec")
+        except (SyntaxError, ValueError):
+            return None, None
+        data = base64.b64encode(marshal.dumps(code)).decode("ascii")
+        elapsed = time.perf_counter() - start
+        self._code[key] = data
+        while len(self._code) > self.size:
+            self._code.popitem(last=False)
+        return data, elapsed
+
+
+class CodeRun:
+    """One snippet running in a worker.
+
+    on_output(text, is_error) gets output as it arrives, on_input(prompt)
+    is called when the snippet waits in input(), and on_finished(result)
+    once at the end with a dict of error, missing_module, wall and cpu
+    (error is set if the snippet failed, was stopped or timed out), plus
+    peak_memory and profile for profiled runs (see core.code_worker).
+    compile_time is how long compiling took, None if it came from the cache.
+    """
+
+    def __init__(self, process: QProcess, on_output, on_input, on_finished, timeout: float):
+        self.process = process
+        self.on_output = on_output
+        self.on_input = on_input
+        self.on_finished = on_finished
+        self.finished = False
+        self.compile_time = None
+        self.ended_by = None  # why the worker was killed
+        self.timer = None
+        if timeout:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(lambda: self._kill(f"Timed out after {timeout:g} s"))
+            self.timer.start(int(timeout * 1000))
+
+    def send_input(self, text: str) -> None:
+        if not self.finished:
+            self.process.write((json.dumps({"type": "input", "text": text}) + "\n").encode())
+
+    def stop(self) -> None:
+        self._kill("Stopped")
+
+    def _kill(self, reason: str) -> None:
+        if not self.finished:
+            self.ended_by = reason
+            self.process.kill()  # _exited follows from the event loop
+
+    def _message(self, message: dict) -> None:
+        kind = message.get("type")
+        if kind in ("out", "err"):
+            self.on_output(message["text"], kind == "err")
+        elif kind == "input":
+            self.on_input(message["prompt"])
+        elif kind == "done":
+            self._finish(message)
+
+    def _exited(self, exit_code: int) -> None:
+        error = self.ended_by or f"The worker exited unexpectedly (code {exit_code})"
+        self._finish({"error": error, "missing_module": None, "wall": None, "cpu": None})
+
+    def _finish(self, result: dict) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        if self.timer is not None:
+            self.timer.stop()
+        self.on_finished(result)
+
+
+class CodeRunnerPool(QObject):
+    def __init__(self, size: int = POOL_SIZE):
+        super().__init__()
+        self.size = size
+        self.idle = []
+        self.runs = {}  # QProcess -> the CodeRun it is running
+        self.pending = {}  # QProcess -> its unfinished last line of output
+        self.compiled = CompileCache()
+        self.closed = False
+
+    def _start_worker(self) -> QProcess:
+        process = QProcess(self)  # owned by the pool until deleteLater()
+        self.pending[process] = b""
+        process.readyReadStandardOutput.connect(lambda: self._read(process))
+        process.readyReadStandardError.connect(lambda: self._read_stray(process))
+        process.finished.connect(lambda exit_code, status: self._exited(process, exit_code))
+        process.errorOccurred.connect(
+            lambda error: error == QProcess.ProcessError.FailedToStart and self._exited(process, -1))
+        command = worker_command()
+        process.start(command[0], command[1:])
+        return process
+
+    def fill(self) -> None:
+        """Start workers until `size` are waiting"""
+        while not self.closed and len(self.idle) < self.size:
+            self.idle.append(self._start_worker())
+
+    def run(self, code: str, on_output, on_input, on_finished,
+            timeout: float = RUN_TIMEOUT, memory_mb: int = MEMORY_LIMIT_MB, profile: bool = False) -> CodeRun:
+        job = {"type": "run", "memory_mb": memory_mb, "profile": profile}
+        compiled, compile_time = self.compiled.get(code)
+        if compiled is not None:
+            job["compiled"] = compiled
+        else:
+            job["code"] = code
+        process = self.idle.pop(0) if self.idle else self._start_worker()
+        run = self.runs[process] = CodeRun(process, on_output, on_input, on_finished, timeout)
+        run.compile_time = compile_time
+        # Written straight away; the worker reads it as soon as it is up
+        process.write((json.dumps(job) + "\n").encode())
+        self.fill()
+        return run
+
+    def _read(self, process: QProcess) -> None:
+        *lines, self.pending[process] = (self.pending[process] + bytes(process.readAllStandardOutput())).split(b"\n")
+        run = self.runs.get(process)
+        for line in lines:
+            if run is None:
+                continue  # "ready" from a worker still in the pool
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            run._message(message)
+
+    def _read_stray(self, process: QProcess) -> None:
+        text = bytes(process.readAllStandardError()).decode(errors="replace")
+        run = self.runs.get(process)
+        if run is not None and text:
+            run.on_output(text, True)
+
+    def _exited(self, process: QProcess, exit_code: int) -> None:
+        self._read(process)
+        if process in self.idle:
+            self.idle.remove(process)  # died before it was used; the next run() starts another
+        self.pending.pop(process, None)
+        run = self.runs.pop(process, None)
+        if run is not None:
+            run._exited(exit_code)
+        process.deleteLater()
+
+    def close(self) -> None:
+        """Kill every worker, running or waiting"""
+        self.closed = True
+        for process in self.idle + list(self.runs):
+            process.kill()
+            process.waitForFinished(1000)
+
+
+_pool = None
+
+
+def get_pool() -> CodeRunnerPool:
+    """The pool shared by all editor windows, closed when the application quits"""
+    global _pool
+    if _pool is None:
+        _pool = CodeRunnerPool()
+        QApplication.instance().aboutToQuit.connect(_pool.close)
+    return _pool
@@ -0,0 +1,207 @@
+"""A separate interpreter that runs one snippet for the code editor.
+
+Started ahead of time by core.code_runner, it says it is ready and waits
+for its job; after the job it exits, so every run starts from a clean
+interpreter. It talks JSON, one object per line: the job and answers to
+input() arrive on stdin, and output, input() prompts and the final result
+go out on stdout. Runs as a plain script and imports nothing from core.
+
+    -> {"type": "ready"}
+    <- {"type": "run", "code": "...", "memory_mb": 512, "profile": false}
+       ("compiled": base64 of a marshalled code object may replace "code")
+    -> {"type": "out", "text": "..."}            (and "err")
+    -> {"type": "input", "prompt": "..."}
+    <- {"type": "input", "text": "..."}
+    -> {"type": "done", "error": null, "missing_module": null, "wall": 0.01, "cpu": 0.01}
+
+With "profile" the snippet runs under cProfile and tracemalloc, and "done"
+also carries "peak_memory" (bytes) and "profile": rows of [function,
+calls, own seconds, cumulative seconds], the PROFILE_ROWS with the most
+cumulative time.
+"""
+import base64
+import builtins
+import io
+import json
+import marshal
+import os
+import sys
+import time
+import traceback
+
+FILENAME = "<editor>"  # of the snippet, in tracebacks and the profile
+PROFILE_ROWS = 200
+_RUNNER_FUNCTIONS = {("~", 0, "<built-in method builtins.exec>"),
+                     ("~", 0, "<method 'disable' of '_lsprof.Profiler' objects>")}
+
+
+class _Channel:
+    def __init__(self):
+        # Private copies of the pipes; fd 1 then points at stderr, so output
+        # that bypasses sys.stdout (os.write, child processes) can't corrupt the protocol
+        self.out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        self.requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+        os.dup2(2, 1)
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        os.close(null)
+
+    def send(self, **message) -> None:
+        self.out.write(json.dumps(message) + "\n")
+        self.out.flush()
+
+    def receive(self):
+        line = self.requests.readline()
+        if not line:
+            raise EOFError("the editor went away")
+        return json.loads(line)
+
+
+class _Stream(io.TextIOBase):
+    """sys.stdout / sys.stderr for the snippet: forwards text a line at a time"""
+
+    def __init__(self, channel: _Channel, kind: str):
+        self.channel = channel
+        self.kind = kind
+        self.pending = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.pending.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.channel.send(type=self.kind, text="".join(self.pending))
+            self.pending = []
+
+
+class _Stdin(io.TextIOBase):
+    """sys.stdin for the snippet: every line read is asked of the editor"""
+
+    def __init__(self, ask):
+        self.ask = ask
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size=-1) -> str:
+        return self.ask("") + "\n"
+
+
+def _limit_memory(megabytes) -> None:
+    try:
+        import resource
+    except ImportError:
+        return  # not on Windows; the wall-clock timeout still applies
+    if megabytes:
+        limit = megabytes * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _user_traceback(error: BaseException) -> str:
+    # Drop the frames of this file, so the traceback starts in the snippet
+    tb = error.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename == __file__:
+        tb = tb.tb_next
+    return "".join(traceback.format_exception(type(error), error, tb))
+
+
+def _profile_rows(profiler) -> list:
+    import pstats
+
+    stats = pstats.Stats(profiler).stats
+    # This file's functions (forwarding output, exec() of the snippet), and
+    # whatever only they call, are the runner's cost, not the snippet's
+    runner = {function for function in stats if function[0] == __file__} | _RUNNER_FUNCTIONS
+    grown = True
+    while grown:
+        grown = False
+        for function, (*_, callers) in stats.items():
+            if (function not in runner and function[0] != FILENAME and callers
+                    and all(caller in runner for caller in callers)):
+                runner.add(function)
+                grown = True
+    rows = [[pstats.func_std_string(function), calls, round(own, 6), round(cumulative, 6)]
+            for function, (_, calls, own, cumulative, _) in stats.items() if function not in runner]
+    rows.sort(key=lambda row: -row[3])
+    return rows[:PROFILE_ROWS]
+
+
+def run(channel: _Channel, job: dict) -> None:
+    stdout, stderr = _Stream(channel, "out"), _Stream(channel, "err")
+
+    def ask(prompt=""):
+        stdout.write(str(prompt))
+        stdout.flush()
+        channel.send(type="input", prompt=str(prompt))
+        answer = channel.receive()
+        if answer.get("type") != "input":
+            raise EOFError("input cancelled")
+        return answer["text"]
+
+    sys.stdout, sys.stderr, sys.stdin = stdout, stderr, _Stdin(ask)
+    builtins.input = ask
+    error = missing = profiler = None
+    if job.get("profile"):
+        import cProfile
+        import tracemalloc
+
+        profiler = cProfile.Profile()
+        tracemalloc.start()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        _limit_memory(job.get("memory_mb"))
+        if "compiled" in job:
+            code = marshal.loads(base64.b64decode(job["compiled"]))
+        else:
+            code = compile(job["code"], FILENAME, "exec")
+        namespace = {"__name__": "__main__", "__builtins__": builtins}
+        if profiler is not None:
+            profiler.enable()
+        try:
+            exec(code, namespace)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = f"SystemExit: {e.code}"
+    except MemoryError:
+        error = f"MemoryError: the snippet went over its memory limit ({job.get('memory_mb')} MB)"
+    except BaseException as e:
+        stderr.write(_user_traceback(e))
+        error = traceback.format_exception_only(type(e), e)[-1].strip()
+        if isinstance(e, ModuleNotFoundError):
+            missing = e.name
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stdout.flush()
+    stderr.flush()
+    result = {"error": error, "missing_module": missing, "wall": wall, "cpu": cpu}
+    if profiler is not None:
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result["profile"] = _profile_rows(profiler)
+    channel.send(type="done", **result)
+
+
+def main() -> None:
+    channel = _Channel()
+    channel.send(type="ready")
+    try:
+        job = channel.receive()
+    except (EOFError, ValueError):
+        return  # the pool shut down before using this worker
+    if job.get("type") == "run":
+        run(channel, job)
+
+
+if __name__ == "__main__":
+    main()
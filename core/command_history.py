@@ -0,0 +1,253 @@
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from collections import OrderedDict
+
+from core.utils import DATA_DIR, FileLock, user_dir_name
+
+COMMAND_HISTORY_DIR = os.environ.get("TERMINALOS_HISTORY_DIR", os.path.join(DATA_DIR, "history"))
+COMMAND_HISTORY_LIMIT = int(os.environ.get("TERMINALOS_HISTORY_LIMIT", "10000"))  # commands kept per user
+
+
+_NONE = frozenset()
+_open_histories = set()
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CommandHistory:
+    """A user's entered commands, kept across sessions.
+
+    The file, COMMAND_HISTORY_DIR/<user>.jsonl, is append-only: one JSON
+    string per command. add() only queues the command for a writer thread,
+    which appends whatever has queued up in one go and rewrites the file
+    with the newest `limit` distinct commands once it has grown to twice
+    that. Nothing is read at login; preload() reads the file on a thread of
+    its own, and the first use waits for it (or reads it, if nobody asked
+    for a preload). Loading drops repeats: a command that is entered again
+    moves to the end.
+
+    search() finds the newest command containing a substring through a
+    trigram index, and a search that extends the previous one only narrows
+    down the previous matches. The index is built on a background thread
+    after loading (searches scan until it is ready) and never has entries
+    removed; a hit is only used if its command is still in the history.
+    """
+
+    def __init__(self, username, directory=None, limit=COMMAND_HISTORY_LIMIT):
+        directory = directory or COMMAND_HISTORY_DIR
+        self.path = os.path.join(directory, user_dir_name(username) + ".jsonl")
+        self.limit = limit
+        self._entries = None  # seq -> command, oldest first
+        self._pending = []  # commands added before loading finished
+        self._state_lock = threading.Lock()  # _entries, _pending
+        self._load_lock = threading.Lock()  # one load at a time
+        self._queue = queue.Queue()
+        self._writer = None
+        self._file_lines = None  # lines in the file, counted by the writer
+        self._seqs = {}  # command -> seq
+        self._next_seq = 0
+        self._index = None  # trigram -> seqs of the commands containing it
+        self._built = None  # (index, last seq in it) handed over by the indexing thread
+        self._list = None  # commands() snapshot
+        self._cache = (None, None)  # (query, matching seqs) of the last search
+
+    def _lock(self):
+        return FileLock(self.path + ".lock")
+
+    def preload(self):
+        """Read and index the history in the background, ahead of its first use"""
+        threading.Thread(target=self._load, name="history-load", daemon=True).start()
+
+    def _load(self):
+        with self._load_lock:
+            if self._entries is not None:
+                return
+            commands = []
+            if os.path.exists(self.path):
+                with self._lock():
+                    commands = _read_commands(self.path)
+            with self._state_lock:
+                self._entries = OrderedDict()
+                for command in commands + self._pending:
+                    self._insert(command)
+                self._pending = []
+                snapshot = list(self._entries.items())
+        threading.Thread(target=self._build_index, args=(snapshot,), name="history-index", daemon=True).start()
+
+    def _build_index(self, snapshot):
+        index = {}
+        for seq, command in snapshot:
+            _add_to_index(index, seq, command)
+        self._built = (index, snapshot[-1][0] if snapshot else -1)
+
+    def _insert(self, command):
+        old = self._seqs.pop(command, None)
+        if old is not None:
+            del self._entries[old]
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = command
+        self._seqs[command] = seq
+        if self._index is not None:
+            _add_to_index(self._index, seq, command)
+        while len(self._entries) > self.limit:
+            _, command = self._entries.popitem(last=False)
+            del self._seqs[command]
+
+    def add(self, command):
+        """Record an entered command, in memory and, from the writer thread, on disk"""
+        with self._state_lock:
+            if self._entries is None:
+                self._pending.append(command)
+            else:
+                self._insert(command)
+                self._list = None
+                self._cache = (None, None)
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name="history-writer", daemon=True)
+            self._writer.start()
+            _open_histories.add(self)
+        self._queue.put(command)
+
+    def _run(self):
+        while True:
+            commands = [self._queue.get()]
+            while True:
+                try:
+                    commands.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = commands[-1] is None
+            commands = [command for command in commands if command is not None]
+            if commands:
+                try:
+                    self._write(commands)
+                except OSError as e:
+                    print(f"Cannot save command history to {self.path}: {e}", file=sys.stderr)
+            for _ in range(len(commands) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, commands):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock():
+            if self._file_lines is None:
+                self._file_lines = len(_read_commands(self.path)) if os.path.exists(self.path) else 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(command, ensure_ascii=False) + "\n" for command in commands)
+            self._file_lines += len(commands)
+            if self._file_lines >= 2 * self.limit:
+                # Rewritten from the file, which other sessions of the user append to as well
+                kept = list(OrderedDict.fromkeys(reversed(_read_commands(self.path))))[:self.limit]
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(command, ensure_ascii=False) + "\n" for command in reversed(kept))
+                os.replace(tmp, self.path)
+                self._file_lines = len(kept)
+
+    def flush(self):
+        """Wait until every command added so far is on disk"""
+        self._queue.join()
+
+    def close(self):
+        """Write out the queued commands and stop the writer thread"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            _open_histories.discard(self)
+
+    def __len__(self):
+        self._load()
+        return len(self._entries)
+
+    def commands(self):
+        """All commands, oldest first"""
+        self._load()
+        if self._list is None:
+            self._list = list(self._entries.values())
+        return self._list
+
+    def _take_index(self):
+        if self._index is None and self._built is not None:
+            index, last = self._built
+            self._built = None
+            # Catch up with the commands entered while it was being built
+            for seq in reversed(self._entries):
+                if seq <= last:
+                    break
+                _add_to_index(index, seq, self._entries[seq])
+            self._index = index
+        return self._index
+
+    def _matches(self, query):
+        index = self._take_index()
+        last_query, last = self._cache
+        if last_query is not None and query.startswith(last_query):
+            # Narrow the previous matches down
+            seqs = set(last)
+            added = query[max(0, len(last_query) - 2):]
+        elif index is None:
+            seqs = set(self._entries)
+            added = ""
+        else:
+            seqs = None
+            added = query
+        if index is not None:
+            for trigram in sorted(_trigrams(added), key=lambda t: len(index.get(t, ()))):
+                posting = index.get(trigram, _NONE)
+                seqs = set(posting) if seqs is None else seqs & posting
+                if not seqs:
+                    break
+        entries = self._entries
+        seqs = {seq for seq in seqs if query in entries.get(seq, "").lower()}
+        self._cache = (query, seqs)
+        return seqs
+
+    def search(self, query, before=None):
+        """(seq, command) of the newest command containing query, older than seq `before`"""
+        self._load()
+        query = query.lower()
+        if not query:
+            return None
+        if len(query) < 3:
+            # Too short for the index; the newest match is usually close to the end
+            for seq in reversed(self._entries):
+                if (before is None or seq < before) and query in self._entries[seq].lower():
+                    return seq, self._entries[seq]
+            return None
+        seqs = self._matches(query)
+        seq = max((seq for seq in seqs if before is None or seq < before), default=None)
+        return None if seq is None else (seq, self._entries[seq])
+
+
+def _add_to_index(index, seq, command):
+    for trigram in _trigrams(command.lower()):
+        seqs = index.get(trigram)
+        if seqs is None:
+            seqs = index[trigram] = set()
+        seqs.add(seq)
+
+
+def _read_commands(path):
+    commands = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                commands.append(json.loads(line))
+            except ValueError:
+                continue  # torn line from a crash
+    return commands
+
+
+@atexit.register
+def _close_all():
+    for history in list(_open_histories):
+        history.close()
@@ -0,0 +1,114 @@
+"""Terminal commands, discovered from the modules of this package.
+
+Every command module declares its commands in a COMMANDS list of plain
+literals, for example
+
+    COMMANDS = [
+        {"name": "quit", "aliases": ["exit"], "handler": "quit_program",
+         "help": ("exit program", "izlaz iz programa")},
+        {"name": "pip_install", "args": "<package>", "handler": "pip_install",
+         "help": ("install Python package", "instaliraj Python paket")},
+    ]
+
+and implements each handler as a function handler(term, args) taking the
+terminal session and the rest of the command line. "args" is the usage of
+the command's arguments; a command without it takes none. "complete"
+feeds Tab completion of the arguments (see core.completion): a list of
+words, or "seen" for the words of arguments the command was run with before.
+"gui": True marks a command that opens windows of its own; it only runs
+in frontends that can show them.
+
+The registry reads the manifests with ast, without importing anything, and
+imports a module the first time one of its commands runs, so commands with
+heavy dependencies cost nothing until they are used. Where there is no
+source to read (a frozen build), the module is imported to get its list.
+"""
+import ast
+import importlib
+import importlib.util
+import os
+import pkgutil
+
+
+class Command:
+    """One registry entry; the handler is imported on first call"""
+
+    def __init__(self, module: str, name: str, handler: str, aliases=(), args=None, help=("", ""), complete=None, gui=False):
+        self.module = module
+        self.name = name
+        self.handler = handler
+        self.aliases = tuple(aliases)
+        self.args = args
+        self.help = tuple(help)
+        self.complete = complete
+        self.gui = gui
+        self._func = None
+
+    @property
+    def usage(self) -> str:
+        names = "/".join((self.name,) + self.aliases)
+        return f"{names} {self.args}" if self.args else names
+
+    def load(self):
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.module), self.handler)
+        return self._func
+
+    def __call__(self, term, args: str = ""):
+        return self.load()(term, args)
+
+
+def _read_manifest(module: str) -> list:
+    spec = importlib.util.find_spec(module)
+    origin = spec.origin if spec is not None else None
+    if origin and origin.endswith(".py") and os.path.isfile(origin):  # frozen builds report a .py that isn't there
+        with open(origin, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), origin)
+        for node in tree.body:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "COMMANDS"):
+                return ast.literal_eval(node.value)
+        return []
+    return getattr(importlib.import_module(module), "COMMANDS", [])
+
+
+class CommandRegistry:
+    """Name and alias lookup over the commands of a package"""
+
+    def __init__(self, package: str = __name__):
+        self.package = package
+        self._commands = None  # in declaration order
+        self._names = None  # name or alias -> Command
+
+    def _discover(self) -> None:
+        commands, names = [], {}
+        path = importlib.import_module(self.package).__path__
+        for info in sorted(pkgutil.iter_modules(path), key=lambda info: info.name):
+            module = f"{self.package}.{info.name}"
+            for entry in _read_manifest(module):
+                command = Command(module, **entry)
+                commands.append(command)
+                for name in (command.name,) + command.aliases:
+                    names[name] = command
+        self._commands, self._names = commands, names
+
+    def commands(self) -> list:
+        if self._commands is None:
+            self._discover()
+        return self._commands
+
+    def get(self, name: str):
+        if self._names is None:
+            self._discover()
+        return self._names.get(name.lower())
+
+    def split(self, line: str):
+        """(command or None, argument string) for a command line"""
+        name, _, args = line.strip().partition(" ")
+        return self.get(name), args.strip()
+
+    def help_lines(self, language: int) -> list:
+        return [f"{command.usage:<12} - {command.help[language]}" for command in self.commands()]
+
+
+registry = CommandRegistry()
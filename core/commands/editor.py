@@ -0,0 +1,168 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QLineEdit, QLabel,
+                             QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QTextCursor
+
+COMMANDS = [
+    {"name": "code", "handler": "code", "gui": True,
+     "help": ("open Python code editor and runner", "otvori Python uređivač koda i pokretač")},
+]
+
+STYLE = "background-color: black; color: white; font-family: Consolas, monospace; font-size: 14px;"
+BUTTON_STYLE = "background-color: #222; color: white; font-family: Consolas, monospace; font-size: 14px;"
+TABLE_STYLE = "background-color: black; color: white; font-family: Consolas, monospace; font-size: 12px;"
+
+
+def code(term, args: str) -> None:
+    """Open a Python code editor and runner"""
+    from core.code_runner import get_pool
+
+    term.print_info(term._lang("Opening Python code editor...", "Otvaranje Python uređivača koda..."))
+    pool = get_pool()
+    pool.fill()  # warm the workers while the user types
+
+    # Create a new window for the code editor
+    term.code_editor = QWidget()  # Keep a reference to the window on the terminal
+    term.code_editor.setWindowTitle("Python Code Editor")
+    term.code_editor.resize(800, 600)
+
+    layout = QVBoxLayout(term.code_editor)
+
+    # Code input area
+    code_input = QTextEdit()
+    code_input.setStyleSheet(STYLE)
+    layout.addWidget(code_input)
+
+    # Run, Profile and Stop buttons
+    buttons = QHBoxLayout()
+    run_button = QPushButton(term._lang("Run Code", "Pokreni kod"))
+    run_button.setStyleSheet(BUTTON_STYLE)
+    buttons.addWidget(run_button)
+    profile_button = QPushButton(term._lang("Profile", "Profiliši"))
+    profile_button.setStyleSheet(BUTTON_STYLE)
+    profile_button.setToolTip(term._lang("Run under cProfile and tracemalloc", "Pokreni uz cProfile i tracemalloc"))
+    buttons.addWidget(profile_button)
+    stop_button = QPushButton(term._lang("Stop", "Zaustavi"))
+    stop_button.setStyleSheet(BUTTON_STYLE)
+    stop_button.setEnabled(False)
+    buttons.addWidget(stop_button)
+    layout.addLayout(buttons)
+
+    # Output area
+    code_output = QTextEdit()
+    code_output.setReadOnly(True)
+    code_output.setStyleSheet(STYLE)
+    layout.addWidget(code_output)
+
+    # Answers to input(), enabled while the code waits for one
+    input_line = QLineEdit()
+    input_line.setStyleSheet(STYLE)
+    input_line.setPlaceholderText(term._lang("Input for the running code", "Unos za pokrenuti kod"))
+    input_line.setEnabled(False)
+    layout.addWidget(input_line)
+
+    # Profile results: totals and the hot functions, sortable by any column
+    profile_summary = QLabel()
+    profile_summary.setStyleSheet("color: lime; font-family: Consolas, monospace;")
+    profile_summary.hide()
+    layout.addWidget(profile_summary)
+    profile_table = QTableWidget(0, 4)
+    profile_table.setHorizontalHeaderLabels([
+        term._lang("Function", "Funkcija"), term._lang("Calls", "Pozivi"),
+        term._lang("Own s", "Sopstveno s"), term._lang("Cumulative s", "Ukupno s"),
+    ])
+    profile_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+    profile_table.verticalHeader().hide()
+    profile_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+    profile_table.setStyleSheet(TABLE_STYLE)
+    profile_table.hide()
+    layout.addWidget(profile_table)
+
+    state = {"run": None}
+
+    def write(text, error=False):
+        cursor = code_output.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        code_output.setTextCursor(cursor)
+        code_output.setTextColor(QColor("red" if error else "white"))
+        code_output.insertPlainText(text)
+        code_output.ensureCursorVisible()
+
+    def ask(prompt):
+        input_line.setEnabled(True)
+        input_line.setFocus()
+
+    def answer():
+        run = state["run"]
+        if run is not None:
+            text = input_line.text()
+            input_line.clear()
+            input_line.setEnabled(False)
+            write(text + "\n")
+            run.send_input(text)
+
+    def show_profile(result, compile_time):
+        compiled = (term._lang(f"compiled in {compile_time * 1000:.1f} ms", f"kompajlirano za {compile_time * 1000:.1f} ms")
+                    if compile_time is not None else term._lang("compiled code from cache", "kompajlirani kod iz keša"))
+        profile_summary.setText(term._lang(
+            f"Wall {result['wall']:.4f} s | CPU {result['cpu']:.4f} s | peak memory {result['peak_memory'] / 1024:.1f} KiB | {compiled}",
+            f"Ukupno {result['wall']:.4f} s | CPU {result['cpu']:.4f} s | najviše memorije {result['peak_memory'] / 1024:.1f} KiB | {compiled}"
+        ))
+        profile_table.setSortingEnabled(False)  # or rows move while they are filled in
+        profile_table.setRowCount(len(result["profile"]))
+        for row, values in enumerate(result["profile"]):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, value)  # numbers sort as numbers
+                profile_table.setItem(row, column, item)
+        profile_table.setSortingEnabled(True)
+        profile_table.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+        profile_summary.show()
+        profile_table.show()
+
+    def finished(result):
+        run = state["run"]
+        state["run"] = None
+        run_button.setEnabled(True)
+        profile_button.setEnabled(True)
+        stop_button.setEnabled(False)
+        input_line.setEnabled(False)
+        if result["missing_module"]:
+            missing_lib = result["missing_module"]
+            write(term._lang(
+                f"\nError: Missing library '{missing_lib}'. Try installing it with 'pip_install {missing_lib}'.\n",
+                f"\nGreška: Nedostaje biblioteka '{missing_lib}'. Pokušajte da je instalirate sa 'pip_install {missing_lib}'.\n"
+            ), error=True)
+        elif result["error"]:
+            write(term._lang(f"\nError: {result['error']}\n", f"\nGreška: {result['error']}\n"), error=True)
+        if result["wall"] is not None:
+            write(term._lang(f"\n[finished in {result['wall']:.3f} s, CPU {result['cpu']:.3f} s]\n",
+                             f"\n[završeno za {result['wall']:.3f} s, CPU {result['cpu']:.3f} s]\n"))
+        if "profile" in result:
+            show_profile(result, run.compile_time)
+
+    def run_code(profile=False):
+        """Run the Python code in a worker process, streaming its output"""
+        code_output.clear()
+        profile_summary.hide()
+        profile_table.hide()
+        run_button.setEnabled(False)
+        profile_button.setEnabled(False)
+        stop_button.setEnabled(True)
+        state["run"] = pool.run(code_input.toPlainText(), write, ask, finished, profile=profile)
+
+    def stop_code():
+        if state["run"] is not None:
+            state["run"].stop()
+
+    def close_event(event):
+        stop_code()
+        event.accept()
+
+    run_button.clicked.connect(lambda: run_code())
+    profile_button.clicked.connect(lambda: run_code(profile=True))
+    stop_button.clicked.connect(stop_code)
+    input_line.returnPressed.connect(answer)
+    term.code_editor.closeEvent = close_event
+    term.code_editor.setLayout(layout)
+    term.code_editor.show()
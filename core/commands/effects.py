@@ -0,0 +1,94 @@
+from core.animation import FrameAnimation, Timeline
+
+COMMANDS = [
+    {"name": "neofetch", "handler": "neofetch",
+     "help": ("show logo animation", "prikaz logo animacije")},
+    {"name": "ascii_anim", "handler": "ascii_anim",
+     "help": ("simple ASCII animation", "jednostavna ASCII animacija")},
+    {"name": "hack", "handler": "hack",
+     "help": ("simple matrix hack animation", "jednostavna matrica animacija")},
+    {"name": "hackfbi", "handler": "hackfbi",
+     "help": ("hack FBI (just for fun)", "hakuj FBI (samo za zabavu)")},
+    {"name": "color", "handler": "color",
+     "help": ("show green text", "prikaži zeleni tekst")},
+    {"name": "colora", "handler": "colora",
+     "help": ("show red text", "prikaži crveni tekst")},
+    {"name": "cquit", "handler": "cquit",
+     "help": ("reset text color", "resetuj boju teksta")},
+]
+
+# --- ASCII art for the neofetch animation ---
+LOGO = [
+    "   ******   ",
+    " *        * ",
+    "*  ****   * ",
+    "* *       * ",
+    "* *       * ",
+    "*  ****   * ",
+    " *        * ",
+    "   ******   "
+]
+
+
+# --- Neofetch animation ---
+def neofetch(term, args: str) -> None:
+    # One frame per highlighted line; only the two lines that change are redrawn
+    frames = [
+        [(line, "cyan", True) if i == lit else (line, "grey", False) for i, line in enumerate(LOGO)]
+        for lit in range(len(LOGO))
+    ]
+    term.animations.start(FrameAnimation(frames, interval_ms=150))
+
+
+# --- Simple ASCII animation ---
+def ascii_anim(term, args: str) -> None:
+    frames = [
+        "(>^_^)>",
+        "<(^_^<)",
+        "^(^_^)^",
+        "v(^_^)v",
+        "(^_^)"
+    ]
+    term.animations.start(FrameAnimation([[(frame, "cyan", True)] for frame in frames], interval_ms=300))
+
+
+# --- Effects (played by the animation scheduler, the next command cancels them) ---
+def hackfbi(term, args: str) -> None:
+    steps = [(0 if i == 0 else 1000, f"Hacking FBI... {i+1}/10", ("red", True)) for i in range(10)]
+    steps += [
+        (1000, "Text color reset to default.", "white"),
+        (0, term._lang("FBI hacked successfully!", "FBI uspešno hakovan!"), "lime"),
+    ]
+    term.animations.play(Timeline(steps))
+
+
+def color(term, args: str) -> None:
+    term.animations.play(Timeline([
+        (0, "This is green text.", ("green", True)),
+        (0, "Text color reset to default.", "white"),
+        (0, term._lang("Color demonstration complete.", "Demonstracija boja završena."), "lime"),
+    ]))
+
+
+def colora(term, args: str) -> None:
+    term.animations.play(Timeline([
+        (0, "This is red text.", ("red", True)),
+        (0, "Text color reset to default.", "white"),
+        (0, term._lang("Red color demonstration complete.", "Demonstracija crvene boje završena."), "lime"),
+    ]))
+
+
+def cquit(term, args: str) -> None:
+    term.animations.play(Timeline([
+        (0, "Text color reset to default.", "white"),
+        (0, term._lang("Color reset complete.", "Boja resetovana."), "lime"),
+    ]))
+
+
+def hack(term, args: str) -> None:
+    steps = [(0 if i == 0 else 100, f"Matrix hack... {i+1}/10", ("green", True)) for i in range(10)]
+    steps += [
+        (100, "Text color reset to default.", "white"),
+        (0, term._lang("Matrix hack complete!", "Matrix hack završen!"), "lime"),
+    ]
+    term.animations.play(Timeline(steps))
@@ -0,0 +1,144 @@
+import random
+
+COMMANDS = [
+    {"name": "ascii", "args": "[--font NAME] [--width N] [--list-fonts] [text]", "handler": "ascii_text",
+     "complete": ["--font", "--width", "--list-fonts"],
+     "help": ("generate ASCII text art", "generiši ASCII tekst")},
+    {"name": "password", "handler": "password",
+     "help": ("generate random password", "generiše slučajnu lozinku")},
+    {"name": "random_joke", "handler": "random_joke",
+     "help": ("show random joke", "prikaz nasumičnog šala")},
+    {"name": "fortune", "handler": "fortune",
+     "help": ("show a fortune cookie message", "prikaži poruku iz fortune cookie")},
+]
+
+
+# --- ASCII Text generator (pyfiglet, rendered by core.figlet) ---
+def ascii_text(term, args: str) -> None:
+    """ascii [--font NAME] [--width N] [--list-fonts] [text]"""
+    from core.figlet import DEFAULT_FONT, DEFAULT_WIDTH, get_renderer
+
+    renderer = get_renderer()
+    font, width, words = DEFAULT_FONT, DEFAULT_WIDTH, []
+    list_fonts = False
+    parts = args.split()
+    error = None
+    try:
+        while parts:
+            part = parts.pop(0)
+            if part == "--font":
+                font = parts.pop(0)
+            elif part == "--width":
+                width = int(parts.pop(0))
+            elif part == "--list-fonts":
+                list_fonts = True
+            else:
+                words.append(part)
+    except IndexError:
+        error = term._lang(f"missing value for {part}", f"nedostaje vrednost za {part}")
+    except ValueError as e:
+        error = e
+    if error is not None:
+        term.print_error(term._lang(
+            f"Invalid arguments ({error}). Usage: ascii [--font NAME] [--width N] [--list-fonts] [text]",
+            f"Neispravni argumenti ({error}). Upotreba: ascii [--font IME] [--width N] [--list-fonts] [tekst]"
+        ))
+        return
+
+    try:
+        fonts = renderer.fonts()
+    except ImportError:
+        term.print_error(term._lang("ASCII art needs pyfiglet (pip_install pyfiglet).",
+                                    "ASCII umetnost zahteva pyfiglet (pip_install pyfiglet)."))
+        return
+    if list_fonts:
+        term.print_info(term._lang(f"{len(fonts)} fonts:", f"{len(fonts)} fontova:"))
+        column = max(len(name) for name in fonts) + 2
+        per_line = max(1, 80 // column)
+        for i in range(0, len(fonts), per_line):
+            term.print_line("".join(name.ljust(column) for name in fonts[i:i + per_line]).rstrip())
+        return
+    if font not in fonts:
+        term.print_error(term._lang(f"Unknown font '{font}'. See: ascii --list-fonts",
+                                    f"Nepoznat font '{font}'. Pogledajte: ascii --list-fonts"))
+        return
+
+    text = " ".join(words)
+    if not text:
+        text, ok = term.ask_text("ASCII Text", term._lang("Enter text to convert to ASCII art:", "Unesite tekst za ASCII umetnost:"))
+        if not ok or not text.strip():
+            term.print_info(term._lang("ASCII generation cancelled.", "Generisanje ASCII umetnosti otkazano."))
+            return
+
+    def show(future):
+        try:
+            ascii_art = future.result()
+        except Exception as e:
+            term.print_error(term._lang(f"Error generating ASCII art: {e}", f"Greška prilikom generisanja ASCII umetnosti: {e}"))
+            return
+        term.print_info(term._lang("Generated ASCII art:", "Generisana ASCII umetnost:"))
+        for line in ascii_art.splitlines():
+            term.print_line(line, color="yellow")
+
+    # Rendered on the figlet worker; a cached banner is shown right away
+    term.when_done(renderer.submit(text, font, width), show)
+
+
+# --- Password generator ---
+def password(term, args: str) -> None:
+    charset = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+    length, ok = term.ask_int(
+        "Input",
+        term._lang("Enter password length (1-100):", "Unesite dužinu lozinke (1-100):"),
+        minimum=1, maximum=100
+    )
+    if not ok:
+        term.print_info(term._lang("Password generation cancelled.", "Generisanje lozinke otkazano."))
+        return
+    if length <= 0 or length > 100:
+        term.print_error(term._lang("Invalid length!", "Nevažeća dužina!"))
+        return
+    password = ''.join(random.choice(charset) for _ in range(length))
+    term.print_info(term._lang(f"Generated password: {password}", f"Generisana lozinka: {password}"))
+
+
+# --- Random joke (icanhazdadjoke.com, prefetched by core.net) ---
+def random_joke(term, args: str) -> None:
+    from core.net import get_joke_feed
+
+    feed = get_joke_feed()
+    joke = feed.take()
+    if joke is not None:
+        term.print_info(joke)
+        return
+
+    def show(future):
+        try:
+            term.print_info(future.result())
+        except Exception as e:
+            joke = feed.cached()
+            if joke is None:
+                term.print_error(term._lang(f"Error fetching joke: {e}", f"Greška prilikom preuzimanja šale: {e}"))
+                return
+            term.print_info(joke)
+            term.print_line(term._lang("(offline, from the joke cache)", "(van mreže, iz keša šala)"), color="grey")
+
+    term.when_done(feed.fetch(), show)
+
+
+# --- Fortune cookie messages ---
+def fortune(term, args: str) -> None:
+    fortunes_en = [
+        "You will have a pleasant surprise.",
+        "A thrilling time is in your immediate future.",
+        "Your hard work will soon pay off.",
+        "New opportunities are around the corner."
+    ]
+    fortunes_sr = [
+        "Čeka vas prijatno iznenađenje.",
+        "Uskoro vas očekuje uzbudljivo vreme.",
+        "Vaš trud će uskoro biti nagrađen.",
+        "Nove prilike su iza ugla."
+    ]
+    fortune = random.choice(fortunes_en if term.language == 0 else fortunes_sr)
+    term.print_info(f"Fortune: {fortune}")
@@ -0,0 +1,96 @@
+COMMANDS = [
+    {"name": "note", "args": "[read|write|delete [n]]", "handler": "note_manager",
+     "complete": ["read", "write", "delete"],
+     "help": ("simple note manager", "menadžer beleški")},
+]
+
+
+# --- Notes Manager ---
+def note_manager(term, args: str) -> None:
+    if args:
+        choice, _, rest = args.partition(" ")
+        choice = choice.lower()
+        if choice == "read":
+            _note_read(term)
+        elif choice == "write":
+            _note_write(term, rest.strip())
+        elif choice == "delete" and rest.strip():
+            try:
+                _delete(term, int(rest) - 1)
+            except ValueError:
+                term.print_error(term._lang("Invalid note number.", "Nevažeći broj beleške."))
+        elif choice == "delete":
+            _note_delete(term)
+        else:
+            term.print_error(term._lang("Unknown option.", "Nepoznata opcija."))
+        return
+
+    prompt = term._lang(
+        "Note Manager: (write/read/delete/exit)",
+        "Menadžer beleški: (write/read/delete/exit)"
+    )
+
+    while True:
+        choice, ok = term.ask_text("Notes", prompt)
+        if not ok:
+            break
+        choice = choice.lower()
+
+        if choice == "write":
+            _note_write(term)
+        elif choice == "read":
+            _note_read(term)
+        elif choice == "delete":
+            _note_delete(term)
+        elif choice == "exit":
+            term.print_info(term._lang("Exiting notes manager.", "Izlazim iz menadžera beleški."))
+            break
+        else:
+            term.print_error(term._lang("Unknown option.", "Nepoznata opcija."))
+
+
+def _note_write(term, note: str = "") -> None:
+    ok = True
+    if not note:
+        note, ok = term.ask_multiline("Write Note", term._lang("Enter note text:", "Unesite tekst beleške:"))
+    if ok and note.strip():
+        term.writer.add_note(note.strip())
+        # Note numbers offered by Tab after "note delete"
+        term.completer.words("note", "delete").insert(str(len(term.notes)))
+        term.print_info(term._lang("Note saved.", "Beleška sačuvana."))
+    else:
+        term.print_info(term._lang("No note saved.", "Beleška nije sačuvana."))
+
+
+def _note_read(term) -> None:
+    if not term.notes:
+        term.print_info(term._lang("No notes available.", "Nema dostupnih beleški."))
+        return
+    term.print_info(term._lang("Your notes:", "Vaše beleške:"))
+    for i, note in enumerate(term.notes, start=1):
+        term.print_line(f"{i}) {note}")
+
+
+def _note_delete(term) -> None:
+    if not term.notes:
+        term.print_info(term._lang("No notes to delete.", "Nema beleški za brisanje."))
+        return
+    index, ok = term.ask_int(
+        "Delete Note",
+        term._lang(f"Enter note number to delete (1-{len(term.notes)}):",
+                   f"Unesite broj beleške za brisanje (1-{len(term.notes)}):"),
+        minimum=1, maximum=len(term.notes)
+    )
+    if ok:
+        _delete(term, index - 1)
+    else:
+        term.print_info(term._lang("Delete cancelled.", "Brisanje otkazano."))
+
+
+def _delete(term, index: int) -> None:
+    if not 0 <= index < len(term.notes):
+        term.print_error(term._lang("Invalid note number.", "Nevažeći broj beleške."))
+        return
+    deleted = term.writer.delete_note(index)
+    term.completer.words("note", "delete").remove(str(len(term.notes) + 1))
+    term.print_info(term._lang(f"Deleted note: {deleted}", f"Obrisana beleška: {deleted}"))
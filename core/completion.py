@@ -0,0 +1,162 @@
+class _Node:
+    __slots__ = ("children", "terminal", "count")
+
+    def __init__(self):
+        self.children = {}
+        self.terminal = False
+        self.count = 0  # words ending at or below this node
+
+
+class Trie:
+    """Prefix tree of words with incremental insert and remove"""
+
+    def __init__(self, words=()):
+        self._root = _Node()
+        for word in words:
+            self.insert(word)
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def _find(self, prefix: str):
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and node.terminal
+
+    def insert(self, word: str) -> bool:
+        if word in self:
+            return False
+        node = self._root
+        node.count += 1
+        for char in word:
+            node = node.children.setdefault(char, _Node())
+            node.count += 1
+        node.terminal = True
+        return True
+
+    def remove(self, word: str) -> bool:
+        if word not in self:
+            return False
+        node = self._root
+        node.count -= 1
+        for char in word:
+            child = node.children[char]
+            child.count -= 1
+            if child.count == 0:
+                del node.children[char]  # drops the rest of the branch too
+                return True
+            node = child
+        node.terminal = False
+        return True
+
+    def complete(self, prefix: str, limit: int = 100) -> list:
+        """Up to `limit` words starting with prefix, in sorted order"""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        words = []
+        stack = [(prefix, node)]
+        while stack and len(words) < limit:
+            word, node = stack.pop()
+            if node.terminal:
+                words.append(word)
+            for char in sorted(node.children, reverse=True):
+                stack.append((word + char, node.children[char]))
+        return words
+
+    def common_prefix(self, prefix: str) -> str:
+        """The longest extension of prefix shared by every word that starts with it"""
+        node = self._find(prefix)
+        if node is None:
+            return prefix
+        while not node.terminal and len(node.children) == 1:
+            char, node = next(iter(node.children.items()))
+            prefix += char
+        return prefix
+
+
+class Completer:
+    """Tab completion for command lines.
+
+    Command names come from the registry. Arguments are completed from a
+    trie per (command, preceding words) context: a command's manifest can
+    give a fixed word list ("complete": [...]) or "seen" to offer the words
+    of arguments it was run with before, in any position, and the session can provide contexts of its own
+    (note indices), filled on first use. Every trie is updated in place as
+    things change, so a Tab press only walks the prefix.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._commands = None
+        self._arguments = {}
+        self._providers = {}
+
+    def _command_trie(self) -> Trie:
+        if self._commands is None:
+            self._commands = Trie()
+            for command in self.registry.commands():
+                for name in (command.name,) + command.aliases:
+                    self._commands.insert(name)
+                if isinstance(command.complete, list):
+                    trie = self.words(command.name)
+                    for word in command.complete:
+                        trie.insert(word)
+        return self._commands
+
+    def provide(self, words, command: str, *context: str) -> None:
+        """Fill a context from words() the first time it is completed"""
+        self._providers[(command,) + context] = words
+
+    def _trie(self, key: tuple, create: bool):
+        trie = self._arguments.get(key)
+        if trie is None and (create or key in self._providers):
+            provider = self._providers.pop(key, None)
+            trie = self._arguments[key] = Trie(str(word) for word in provider()) if provider else Trie()
+        return trie
+
+    def words(self, command: str, *context: str) -> Trie:
+        """The trie of arguments offered after `command *context`"""
+        return self._trie((command,) + context, create=True)
+
+    def observe(self, command, args: str) -> None:
+        """Remember the arguments of a command that was run"""
+        if command.complete == "seen":
+            trie = self.words(command.name)
+            for word in args.split():
+                trie.insert(word)
+
+    def complete(self, line: str):
+        """(completed line, candidates) for the text left of the cursor"""
+        commands = self._command_trie()
+        words = line.split(" ")
+        prefix = words[-1]
+        if len(words) == 1:
+            trie = commands
+        else:
+            command = self.registry.get(words[0])
+            if command is None:
+                return line, []
+            if command.complete == "seen":
+                trie = self._trie((command.name,), create=False)  # any word seen, wherever it was
+            else:
+                context = tuple(word for word in words[1:-1] if word)
+                trie = self._trie((command.name,) + context, create=False)
+                if trie is None:
+                    trie = self._trie((command.name,), create=False)
+            if trie is None:
+                return line, []
+        candidates = trie.complete(prefix)
+        if not candidates:
+            return line, []
+        head = line[:len(line) - len(prefix)]
+        if len(candidates) == 1:
+            return head + candidates[0] + " ", candidates
+        return head + trie.common_prefix(prefix), candidates
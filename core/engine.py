@@ -0,0 +1,378 @@
+"""The command engine, independent of any UI toolkit.
+
+A Session owns one logged-in user's state (record, writer, activity log,
+command history, completion) and runs command lines through the registry.
+Frontends connect it to the world through an OutputSink, where printed
+lines go, and an InputProvider, which answers the questions commands ask.
+The Qt terminal (core.terminal) and the console (core.headless) are two
+such frontends. Nothing here imports PyQt6.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from core.activity_log import ActivityLog
+from core.command_history import CommandHistory
+from core.commands import registry
+from core.completion import Completer
+from core.figlet import get_renderer
+from core.processes import BlockingProcesses
+from core.utils import UserDataWriter
+
+SCRIPT_DEPTH = 8  # how deeply 'source' may nest
+BACKGROUND_WAIT = 10  # seconds wait_background() waits at most
+INT_MIN, INT_MAX = -2147483647, 2147483647
+
+
+class OutputSink(ABC):
+    """Where a session's lines go"""
+
+    @abstractmethod
+    def write_line(self, text: str, color: str = "white", bold: bool = False) -> int:
+        """Append a line (or several, separated by newlines); returns the last one's number"""
+
+    def replace_line(self, number: int, text: str, color: str = "white", bold: bool = False) -> None:
+        """Change an earlier line, if the sink can"""
+
+    def clear(self) -> None:
+        """Drop everything written so far"""
+
+    def flush(self) -> None:
+        """Make everything written so far visible"""
+
+
+class InputProvider(ABC):
+    """Answers to the questions commands ask; every method returns (value, ok)"""
+
+    @abstractmethod
+    def get_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        ...
+
+    @abstractmethod
+    def get_int(self, title: str, prompt: str, minimum: int = INT_MIN, maximum: int = INT_MAX) -> tuple[int, bool]:
+        ...
+
+    def get_multiline_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        return self.get_text(title, prompt)
+
+
+class ScriptInput(InputProvider):
+    """Answers taken from the lines of a script that follow the command asking"""
+
+    def __init__(self, lines):
+        self.lines = lines  # iterator shared with the loop running the script
+
+    def get_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        line = next(self.lines, None)
+        return ("", False) if line is None else (line, True)
+
+    def get_int(self, title: str, prompt: str, minimum: int = INT_MIN, maximum: int = INT_MAX) -> tuple[int, bool]:
+        line = next(self.lines, None)
+        try:
+            value = int(line)
+        except (TypeError, ValueError):
+            return 0, False
+        return value, minimum <= value <= maximum
+
+    def get_multiline_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        """Lines up to an empty one"""
+        lines = []
+        for line in self.lines:
+            if not line:
+                break
+            lines.append(line)
+        return "\n".join(lines), bool(lines)
+
+
+class ImmediateAnimations:
+    """Animation driver for frontends without a timer: timelines print all
+    their steps at once and animations show their first frame. With quiet
+    set, like the session's, nothing is printed."""
+
+    def __init__(self, output: OutputSink, quiet: bool = False):
+        self.output = output
+        self.quiet = quiet
+
+    def start(self, animation):
+        if not self.quiet:
+            for line in animation.frame(0):
+                self.output.write_line(*line)
+        return animation
+
+    def play(self, timeline):
+        if not self.quiet:
+            for _, text, color, bold in timeline.steps:
+                self.output.write_line(text, color, bold)
+        return timeline
+
+    def is_running(self, job) -> bool:
+        return False
+
+    def cancel(self, job) -> None:
+        pass
+
+    def cancel_all(self) -> None:
+        pass
+
+
+class Session:
+    """One user's terminal session: what every command gets as `term`.
+
+    A frontend may replace `animations` with a timer-driven scheduler (given
+    the session's quiet flag, as animations write to the output directly) and
+    `processes` with a runner that doesn't block (see core.processes), set
+    `status_line` to something with add/remove/has/clear for live widgets,
+    set `gui` when commands that open windows can run, `on_close` to be
+    called when the user logs out or quits, and `post` to a function that
+    runs a callable on its UI thread, so work finished in the background is
+    delivered there instead of waited for.
+    """
+
+    def __init__(self, username: str, record, output: OutputSink, input: InputProvider, quiet: bool = False):
+        self.username = username
+        self.record = record  # history and notes are loaded on first use
+        self.language = record.language  # 0 - English, 1 - Serbian
+        self.output = output
+        self.input = input
+        self.quiet = quiet  # drop output instead of writing it (scripts run with --quiet)
+        self.activity_log = ActivityLog(username)
+        self.writer = UserDataWriter(record, on_write=lambda records: self._log("save"),
+                                     on_error=lambda error: self._log("save_failed", error=repr(error)))
+        self.command_history = CommandHistory(username)  # read on first use
+        self.completer = Completer(registry)
+        self.completer.provide(lambda: range(1, len(self.notes) + 1), "note", "delete")
+        self.completer.provide(lambda: self._used_arguments("pip_install"), "pip_install")
+        self.completer.provide(self._fonts, "ascii", "--font")
+        self.animations = ImmediateAnimations(output, quiet=quiet)
+        self.processes = BlockingProcesses()
+        self.status_line = None
+        self.gui = False
+        self.on_close = None
+        self.post = None
+        self.ended = False
+        self._background = set()  # futures handed to when_done() that haven't finished
+        self._post_lock = threading.RLock()  # shutdown() never unhooks `post` while a worker posts
+        self.script_depth = 0
+
+    def start(self) -> None:
+        """Greet the user"""
+        self.print_ascii_banner()
+        self.print_info(self._lang("Welcome, {user}!", "Dobrodošli, {user}!", user=self.username))
+        self.print_info(self._lang("Type 'help' for commands.", "Ukucajte 'help' za komande."))
+        self._log("login")
+
+    def lang(self, en_text: str, sr_text: str, **kwargs) -> str:
+        """Return language-dependent text with optional formatting"""
+        text = en_text if self.language == 0 else sr_text
+        if kwargs:
+            return text.format(**kwargs)
+        return text
+
+    _lang = lang  # the name the command modules use
+
+    def _log(self, event: str, **fields) -> None:
+        """Queue a log entry; the activity log writes it in the background"""
+        self.activity_log.log(event, **fields)
+
+    # --- Output ---
+    def print_line(self, text: str, color: str = "white", bold: bool = False) -> None:
+        if not self.quiet:
+            self.output.write_line(text, color, bold)
+
+    def print_prompt(self, text: str) -> None:
+        self.print_line(f"> {text}", color="#00FFFF", bold=True)
+
+    def print_error(self, text: str) -> None:
+        self.print_line(text, color="red", bold=True)
+
+    def print_info(self, text: str) -> None:
+        self.print_line(text, color="lime", bold=False)
+
+    def print_ascii_banner(self) -> None:
+        banner = [
+            r"| \ | |/ _ \ \   / / \    |___ /| || |  ",
+            r"|  \| | | | \ \ / / _ \     |_ \| || |_ ",
+            r"| |\  | |_| |\ V / ___ \   ___) |__   _|",
+            r"|_| \_|\___/  \_/_/   \_\ |____/   |_|",
+        ]
+        for line in banner:
+            self.print_line(line, color="#00FFFF", bold=True)
+
+    # --- Input ---
+    def ask_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        return self.input.get_text(title, prompt)
+
+    def ask_int(self, title: str, prompt: str, minimum: int = INT_MIN, maximum: int = INT_MAX) -> tuple[int, bool]:
+        return self.input.get_int(title, prompt, minimum, maximum)
+
+    def ask_multiline(self, title: str, prompt: str) -> tuple[str, bool]:
+        return self.input.get_multiline_text(title, prompt)
+
+    # --- Background work ---
+    def when_done(self, future, callback) -> None:
+        """Call callback(future) once the future finishes, on the UI thread.
+
+        Without `post` the session waits for it instead. The callback is
+        dropped if the session has ended by then, and nothing is posted
+        after shutdown(), which cancels the futures that haven't started.
+        """
+        def deliver():
+            if not self.ended:
+                callback(future)
+
+        if self.post is None:
+            future.exception()  # wait
+            deliver()
+            return
+        with self._post_lock:
+            self._background.add(future)
+        future.add_done_callback(lambda _: self._done(future, deliver))
+
+    def wait_background(self, timeout: float = BACKGROUND_WAIT) -> None:
+        """Wait for work handed to when_done() that is still running (after shutdown() nothing is delivered)"""
+        from concurrent.futures import wait
+
+        with self._post_lock:
+            background = list(self._background)
+        wait(background, timeout)
+
+    def _done(self, future, deliver) -> None:
+        # On the worker thread, possibly after the UI that `post` reaches is gone
+        with self._post_lock:
+            self._background.discard(future)
+            if not self.ended and self.post is not None:
+                self.post(deliver)
+
+    # --- Commands ---
+    def execute(self, cmd: str, echo: bool = True) -> None:
+        """Run one command line as if it had been typed"""
+        self.animations.cancel_all()
+
+        if echo:
+            self.print_prompt(cmd)
+        self._log("command", command=cmd)
+        self.run_command(cmd)
+
+    def run_command(self, cmd: str) -> None:
+        """Look the command up in the registry and run it (commands live in core/commands/)"""
+        command, args = registry.split(cmd)
+        if command is None:
+            self.print_error(self._lang(
+                "Unknown command. Type 'help' for available commands.",
+                "Nepoznata komanda. Ukucajte 'help' za dostupne komande."
+            ))
+            return
+        if command.gui and not self.gui:
+            self.print_error(self._lang(f"'{command.name}' needs the graphical terminal.",
+                                        f"'{command.name}' zahteva grafički terminal."))
+            return
+        if args and not command.args:
+            self.print_error(self._lang(f"'{command.name}' takes no arguments.", f"'{command.name}' nema argumente."))
+            return
+        if command.args and command.args.startswith("<") and not args:
+            self.print_error(self._lang(f"Usage: {command.usage}", f"Upotreba: {command.usage}"))
+            return
+        try:
+            command(self, args)
+        except Exception as e:
+            self.print_error(f"Internal error: {e}")
+        self.completer.observe(command, args)
+
+    def run_script(self, path: str) -> tuple[int, float]:
+        """Execute every line of a file; returns (commands run, seconds taken).
+
+        Blank lines and lines starting with # are skipped, and the script
+        stops early if one of its commands ends the session. A command that
+        asks something gets the next lines of the script as its answers, so
+        a recorded session replays without prompting. User data changes are
+        saved once, after the last command.
+        """
+        if self.script_depth >= SCRIPT_DEPTH:
+            raise RecursionError(f"scripts nested more than {SCRIPT_DEPTH} deep")
+        with open(path, "r", encoding="utf-8") as f:
+            lines = iter([line.strip() for line in f])
+        count = 0
+        start = time.perf_counter()
+        interactive = self.input
+        self.input = ScriptInput(lines)
+        self.script_depth += 1
+        try:
+            with self.writer.batch():
+                for line in lines:
+                    if self.ended:
+                        break
+                    if line and not line.startswith("#"):
+                        self.execute(line)
+                        count += 1
+        finally:
+            self.script_depth -= 1
+            self.input = interactive
+        return count, time.perf_counter() - start
+
+    def _used_arguments(self, name: str) -> list:
+        """Words of the arguments `name` was run with in earlier sessions, each once"""
+        command = registry.get(name)
+        used = {}
+        for line in self.command_history.commands():
+            found, args = registry.split(line)
+            if found is command:
+                used.update(dict.fromkeys(args.split()))
+        return list(used)
+
+    # --- User data ---
+    def _fonts(self) -> list:
+        try:
+            return get_renderer().fonts()
+        except ImportError:
+            return []  # pyfiglet is not installed; 'ascii' says so when run
+
+    @property
+    def history(self) -> list:
+        return self.record.history
+
+    @property
+    def notes(self) -> list:
+        return self.record.notes
+
+    def _set_language(self, lang_id: int) -> None:
+        self.language = lang_id
+        self.writer.set_language(lang_id)
+        self.print_info(self._lang("Language set to English.", "Jezik postavljen na srpski."))
+
+    def stop_time(self) -> None:
+        if self.status_line is not None:
+            self.status_line.remove("clock")
+        self.print_info(self._lang("Clock stopped.", "Časovnik zaustavljen."))
+
+    # --- Ending the session ---
+    def shutdown(self) -> None:
+        """Flush unsaved user data and the activity log; safe to call more than once"""
+        from core import net
+
+        with self._post_lock:
+            self.ended = True
+            self.post = None
+            background = list(self._background)
+        for future in background:
+            future.cancel()  # running ones finish, but nothing is posted for them
+        net.close()  # prefetches and pooled connections
+        self.animations.cancel_all()
+        self.processes.cancel_all()
+        if self.status_line is not None:
+            self.status_line.clear()
+        self.writer.close()
+        self.command_history.close()
+        self.activity_log.close()
+
+    def _end(self, event: str, en_text: str, sr_text: str) -> None:
+        self._log(event)
+        self.shutdown()
+        self.print_info(self._lang(en_text, sr_text))
+        if self.on_close is not None:
+            self.on_close()
+
+    def logout(self) -> None:
+        self._end("logout", "Logging out...", "Odjavljivanje...")
+
+    def quit_program(self) -> None:
+        self._end("exit", "Exiting program...", "Izlaz iz programa...")
@@ -0,0 +1,100 @@
+"""ASCII art rendering with pyfiglet, cached and off the calling thread.
+
+Parsing a figlet font file is the slow part of figlet_format(), and it used
+to happen on every call. FigletRenderer keeps one parsed pyfiglet.Figlet
+per font, remembers the last CACHE_SIZE renderings keyed by
+(text, font, width), and renders on a single worker thread so a slow font
+never blocks the UI. The list of installed fonts is read once.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_FONT = "standard"
+DEFAULT_WIDTH = 80
+CACHE_SIZE = 128  # renderings kept
+
+
+class FigletRenderer:
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # (text, font, width) -> rendered text
+        self._lock = threading.Lock()
+        self._figlets = {}  # font -> Figlet, only touched on the worker thread
+        self._fonts = None
+        # One worker: renders of the same font never race over its Figlet
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="figlet")
+
+    def fonts(self) -> list:
+        """Installed font names, sorted; read once"""
+        if self._fonts is None:
+            import pyfiglet
+
+            self._fonts = sorted(pyfiglet.FigletFont.getFonts())
+        return self._fonts
+
+    def has_font(self, font: str) -> bool:
+        return font in self.fonts()
+
+    def _figlet(self, font: str):
+        figlet = self._figlets.get(font)
+        if figlet is None:
+            import pyfiglet
+
+            figlet = self._figlets[font] = pyfiglet.Figlet(font=font)
+        return figlet
+
+    def cached(self, text: str, font: str = DEFAULT_FONT, width: int = DEFAULT_WIDTH):
+        """The rendering if it is in the cache, else None"""
+        key = (text, font, width)
+        with self._lock:
+            art = self._cache.get(key)
+            if art is not None:
+                self._cache.move_to_end(key)
+            return art
+
+    def _render(self, text: str, font: str, width: int) -> str:
+        art = self.cached(text, font, width)
+        if art is not None:
+            return art  # rendered while this one was queued
+        figlet = self._figlet(font)
+        figlet.width = width
+        art = figlet.renderText(text)
+        with self._lock:
+            self._cache[(text, font, width)] = art
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return art
+
+    def submit(self, text: str, font: str = DEFAULT_FONT, width: int = DEFAULT_WIDTH) -> Future:
+        """A future for the rendering; already done when it was cached"""
+        art = self.cached(text, font, width)
+        if art is not None:
+            future = Future()
+            future.set_result(art)
+            return future
+        return self._executor.submit(self._render, text, font, width)
+
+    def render(self, text: str, font: str = DEFAULT_FONT, width: int = DEFAULT_WIDTH) -> str:
+        return self.submit(text, font, width).result()
+
+    def preload(self, fonts=(DEFAULT_FONT,)) -> Future:
+        """Parse fonts (and index the font list) ahead of the first render"""
+        def load():
+            self.fonts()
+            for font in fonts:
+                self._figlet(font)
+        return self._executor.submit(load)
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> FigletRenderer:
+    """The process-wide renderer"""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = FigletRenderer()
+    return _renderer
@@ -0,0 +1,106 @@
+"""Console frontend: runs a Session over stdin/stdout, without Qt"""
+import sys
+
+from core.engine import INT_MAX, INT_MIN, InputProvider, OutputSink, Session
+from core.processes import script_exit_code
+
+# Terminal colors for the color names commands use
+ANSI_COLORS = {
+    "red": "31", "green": "32", "lime": "92", "yellow": "93", "cyan": "96",
+    "#00FFFF": "96", "grey": "90", "white": "37",
+}
+
+
+class ConsoleOutput(OutputSink):
+    """Write lines to a stream, in color when it is a terminal"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.color = self.stream.isatty()
+        self.lines = 0
+
+    def write_line(self, text: str, color: str = "white", bold: bool = False) -> int:
+        if self.color:
+            code = ANSI_COLORS.get(color, "37")
+            text = f"\033[{'1;' if bold else ''}{code}m{text}\033[0m"
+        self.stream.write(text + "\n")
+        self.lines += text.count("\n") + 1
+        return self.lines - 1
+
+    def clear(self) -> None:
+        if self.color:
+            self.stream.write("\033[2J\033[H")
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class ConsoleInput(InputProvider):
+    """Ask questions on the console; end of input cancels"""
+
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+
+    def _read(self, prompt: str):
+        self.stdout.write(f"{prompt} ")
+        self.stdout.flush()
+        line = self.stdin.readline()
+        return line.rstrip("\n") if line else None
+
+    def get_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        line = self._read(prompt)
+        return ("", False) if line is None else (line, True)
+
+    def get_int(self, title: str, prompt: str, minimum: int = INT_MIN, maximum: int = INT_MAX) -> tuple[int, bool]:
+        while True:
+            line = self._read(prompt)
+            if line is None:
+                return 0, False
+            try:
+                value = int(line)
+            except ValueError:
+                continue
+            if minimum <= value <= maximum:
+                return value, True
+
+    def get_multiline_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        """Lines up to an empty one"""
+        lines = []
+        line = self._read(f"{prompt} (end with an empty line)")
+        while line:
+            lines.append(line)
+            line = self._read("...")
+        if line is None and not lines:
+            return "", False
+        return "\n".join(lines), True
+
+
+def run(username: str, record, script: str = None, quiet: bool = False) -> int:
+    """Run a console session: the script if one is given, else commands read from stdin"""
+    output = ConsoleOutput()
+    session = Session(username, record, output, ConsoleInput(), quiet=quiet)
+    try:
+        if script:
+            count, seconds = session.run_script(script)
+            output.flush()
+            rate = count / seconds if seconds else 0
+            print(f"Ran {count} commands in {seconds:.3f}s ({rate:.0f} commands/s).")
+            return script_exit_code(session.processes)
+        session.start()
+        interactive = sys.stdin.isatty()
+        while not session.ended:
+            if interactive:
+                sys.stdout.write("> ")
+                sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                break
+            line = line.strip()
+            if line:
+                session.command_history.add(line)
+                session.execute(line, echo=not interactive)
+            output.flush()
+        return 0
+    finally:
+        session.shutdown()
@@ -0,0 +1,49 @@
+"""Startup diagnostic: how long importing each module takes.
+
+Runs a fresh interpreter with -X importtime, importing what the chosen
+startup path imports, and summarizes its report.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What each startup path imports before its first window or prompt
+STARTUP_MODULES = {
+    "gui": ["PyQt6.QtWidgets", "core.loader"],
+    "headless": ["core.headless"],
+}
+
+
+def measure(modules: list) -> list:
+    """[(name, depth, self_us, cumulative_us)] in import order"""
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return entries
+
+
+def report(path: str = "gui", top: int = 25) -> str:
+    modules = STARTUP_MODULES[path]
+    if getattr(sys, "frozen", False):
+        return "The import report needs a Python interpreter; run it from source."
+    entries = measure(modules)
+    total = sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+    lines = [f"Import time for the {path} startup path ({', '.join(modules)}): {total / 1000:.1f} ms",
+             f"{'cumulative':>12} {'self':>9}  module"]
+    for name, depth, own, cumulative in sorted(entries, key=lambda entry: -entry[3])[:top]:
+        lines.append(f"{cumulative / 1000:>10.1f}ms {own / 1000:>7.1f}ms  {name}")
+    return "\n".join(lines)
@@ -0,0 +1,91 @@
+"""The pip_install queue.
+
+One pip runs at a time, through Session.processes, with its output
+streamed into the terminal. Packages requested while it runs wait in a
+queue and are installed together by the next single pip invocation.
+
+On machines without internet access, point TERMINALOS_PIP_FIND_LINKS at
+one or more wheel directories (separated like PATH), and set
+TERMINALOS_PIP_NO_INDEX=1 so pip does not try PyPI at all.
+"""
+import importlib
+import os
+import sys
+from collections import deque
+
+PIP_FIND_LINKS = [path for path in os.environ.get("TERMINALOS_PIP_FIND_LINKS", "").split(os.pathsep) if path]
+PIP_NO_INDEX = os.environ.get("TERMINALOS_PIP_NO_INDEX", "") not in ("", "0")
+
+
+def pip_command(packages: list) -> list:
+    argv = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--progress-bar", "off"]
+    for path in PIP_FIND_LINKS:
+        argv += ["--find-links", path]
+    if PIP_NO_INDEX:
+        argv.append("--no-index")
+    return argv + packages
+
+
+class PipInstaller:
+    def __init__(self, term):
+        self.term = term
+        self.queue = deque()
+        self.running = None  # packages of the pip that is running
+        self.job = None
+
+    def install(self, packages: list) -> None:
+        busy = set(self.running or ()) | set(self.queue)
+        new = [package for package in dict.fromkeys(packages) if package not in busy]
+        self.queue.extend(new)
+        if not new:
+            self.term.print_info(self.term.lang(f"Already installing: {' '.join(packages)}",
+                                                f"Već se instalira: {' '.join(packages)}"))
+            return
+        if self.running is not None:
+            self.term.print_info(self.term.lang(
+                f"Queued: {' '.join(new)} (after {' '.join(self.running)})",
+                f"Na čekanju: {' '.join(new)} (posle {' '.join(self.running)})"))
+            return
+        self._next()
+
+    def cancel(self) -> bool:
+        """Stop the running pip and drop the queue; False if nothing was running"""
+        self.queue.clear()
+        if self.running is None:
+            return False
+        self.term.processes.cancel(self.job)
+        return True
+
+    def _next(self) -> None:
+        if not self.queue or self.term.ended:
+            return
+        self.running = list(self.queue)
+        self.queue.clear()
+        self.term.print_info(self.term.lang(f"Installing: {' '.join(self.running)} ...",
+                                            f"Instaliram: {' '.join(self.running)} ..."))
+        job = self.term.processes.start(pip_command(self.running), self._output, self._finished)
+        if self.running is not None:  # unless a blocking runner has already finished it
+            self.job = job
+
+    def _output(self, line: str, error: bool) -> None:
+        if self.term.ended or not line.strip():
+            return
+        if error:
+            self.term.print_error(line)
+        else:
+            self.term.print_line(line)
+
+    def _finished(self, exit_code: int, cancelled: bool) -> None:
+        packages, self.running, self.job = " ".join(self.running), None, None
+        if self.term.ended:
+            return
+        if cancelled:
+            self.term.print_info(self.term.lang(f"Installation of {packages} cancelled.",
+                                                f"Instalacija {packages} otkazana."))
+        elif exit_code == 0:
+            importlib.invalidate_caches()  # so the new packages import without a restart
+            self.term.print_info(self.term.lang(f"Installed: {packages}", f"Instalirano: {packages}"))
+        else:
+            self.term.print_error(self.term.lang(f"pip failed for {packages} (exit code {exit_code}).",
+                                                 f"pip nije uspeo za {packages} (izlazni kod {exit_code})."))
+        self._next()
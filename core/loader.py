@@ -1,8 +1,59 @@
 from PyQt6.QtWidgets import QWidget, QStackedWidget, QVBoxLayout, QLabel, QProgressBar
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from core.auth import LoginRegisterScreen
-from core.terminal import TerminalScreen
+from core import startup_probe
 from PyQt6.QtGui import QFont
+import importlib
+
+
+def _import_command_modules():
+    from core.commands import registry
+
+    for module in sorted({command.module for command in registry.commands()}):
+        importlib.import_module(module)
+
+
+def _open_store():
+    from core.utils import get_store
+
+    get_store()
+
+
+def _load_fonts():
+    from core.figlet import get_renderer
+
+    get_renderer().preload().result()
+
+
+# Work done while the loading screen is up, in order: (label, function)
+WARMUP_TASKS = [
+    ("Opening user data", _open_store),
+    ("Indexing commands", lambda: importlib.import_module("core.commands").registry.commands()),
+    ("Loading terminal", lambda: importlib.import_module("core.terminal")),
+    ("Loading commands", _import_command_modules),
+    ("Loading fonts", _load_fonts),
+]
+
+
+class WarmUp(QThread):
+    """Run the warm-up tasks off the GUI thread, reporting each one as it finishes"""
+    task_done = pyqtSignal(int, int, str)  # tasks done, tasks in total, label of the next task
+
+    def __init__(self, tasks=None):
+        super().__init__()
+        self.tasks = tasks if tasks is not None else WARMUP_TASKS
+        self.errors = []
+
+    def run(self):
+        total = len(self.tasks)
+        for done, (label, task) in enumerate(self.tasks, start=1):
+            try:
+                task()
+            except Exception as e:
+                # Only a head start; whatever failed here fails again, visibly, when it is used
+                self.errors.append((label, e))
+            following = self.tasks[done][0] if done < total else ""
+            self.task_done.emit(done, total, following)
 
 class LoadingScreen(QWidget):
     loading_done = pyqtSignal()
@@ -45,21 +96,22 @@ class LoadingScreen(QWidget):
         layout.addWidget(self.progress)
         self.setLayout(layout)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.advance_progress)
-        self.value = 0
+        self.warmup = WarmUp()
+        self.warmup.task_done.connect(self.advance_progress)
 
     def start(self):
-        self.value = 0
-        self.progress.setValue(self.value)
+        self.progress.setValue(0)
+        if self.warmup.tasks:
+            self.label.setText(self.warmup.tasks[0][0] + "...")
         self.show()
-        self.timer.start(25)
-
-    def advance_progress(self):
-        self.value += 3
-        self.progress.setValue(self.value)
-        if self.value >= 100:
-            self.timer.stop()
+        self.warmup.start()
+
+    def advance_progress(self, done, total, following):
+        self.progress.setValue(done * 100 // total)
+        if following:
+            self.label.setText(following + "...")
+        if done == total:
+            self.warmup.wait()
             self.loading_done.emit()
             self.close()
 
@@ -84,10 +136,22 @@ class BootLoader(QStackedWidget):
     def show_login(self):
         self.show()
         self.setCurrentWidget(self.login_screen)
+        if startup_probe.enabled():
+            QTimer.singleShot(0, self._probe_login)  # after the window has been drawn
+
+    def _probe_login(self):
+        startup_probe.mark("login_window")
+        self.close()
+
+    def closeEvent(self, event):
+        if self.terminal_screen is not None:
+            self.terminal_screen.shutdown()
+        super().closeEvent(event)
+
+    def on_login_success(self, username, record):
+        from core.terminal import TerminalScreen  # usually imported already by the warm-up
 
-    def on_login_success(self, username, users):
-        from core.utils import save_users
-        self.terminal_screen = TerminalScreen(username, users)
+        self.terminal_screen = TerminalScreen(username, record)
         self.addWidget(self.terminal_screen)
         self.setCurrentWidget(self.terminal_screen)
         self.login_screen.hide()
@@ -0,0 +1,41 @@
+"""Copy the users of the JSON store (data/users/) into the SQLite store.
+
+Every user's profile, history and notes are read from its shard, so
+everything saved so far is migrated. An old single-file data/users.json
+is imported into the shards first, as the JSON store does on first use.
+
+Usage: python -m core.migrate [users directory] [users.db]
+"""
+import sys
+from core import utils
+
+
+def migrate(users_dir=None, db_path=None):
+    source = utils.JournalStore(users_dir)
+    store = utils.SQLiteStore(db_path)
+    imported, existing = 0, []
+    for name in sorted(source.usernames()):
+        if store.get_profile(name) is not None:
+            existing.append(name)
+            continue
+        profile = source.get_profile(name)
+        store.import_users({name: {"password": profile["password"], "language": profile.get("language", 0),
+                                   "history": source.load_history(name), "notes": source.load_notes(name)}})
+        imported += 1
+    source.close()
+    store.close()
+    return imported, existing
+
+
+def main():
+    users_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    db_path = sys.argv[2] if len(sys.argv) > 2 else None
+    imported, skipped = migrate(users_dir, db_path)
+    print(f"Imported {imported} user(s) into {db_path or utils.DB_FILE}.")
+    if skipped:
+        print(f"Skipped {len(skipped)} user(s) that already exist: {', '.join(skipped)}")
+    print("Set TERMINALOS_STORE=sqlite to use the SQLite store.")
+
+
+if __name__ == "__main__":
+    main()
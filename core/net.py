@@ -0,0 +1,195 @@
+"""HTTP for commands, kept off the UI thread.
+
+All requests go through one pooled requests.Session (keep-alive, so a
+repeat request skips the TCP and TLS handshakes) and run on a small worker
+pool; callers get a Future and hand it to Session.when_done().
+
+JokeFeed keeps a few jokes fetched ahead of time so 'random_joke' answers
+at once, refills in the background as they are used, and remembers every
+joke it has seen on disk to fall back on when the network is down. Nothing
+is fetched before the first 'random_joke': that one waits for its joke,
+and the queue fills up behind it. close() cancels what hasn't started when
+a session ends; the next use starts over. Point TERMINALOS_JOKE_URL at a
+local server to test without the internet.
+"""
+import json
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from core.utils import DATA_DIR, write_json_atomic
+
+JOKE_URL = os.environ.get("TERMINALOS_JOKE_URL", "https://icanhazdadjoke.com/")
+JOKE_CACHE_FILE = os.path.join(DATA_DIR, "jokes.json")
+JOKE_CACHE_SIZE = 500  # jokes remembered for offline use
+PREFETCH = 5  # jokes kept ready
+TIMEOUT = 5  # seconds
+WORKERS = 4
+USER_AGENT = "BetterC Terminal"
+
+
+class HttpClient:
+    """One requests.Session shared by all commands, used from worker threads"""
+
+    def __init__(self, workers=WORKERS):
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+
+    @property
+    def session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+                self._session.headers["User-Agent"] = USER_AGENT
+        return self._session
+
+    def get_json(self, url: str, timeout: float = TIMEOUT):
+        """Fetch and decode a JSON document (blocking; run it on the pool)"""
+        response = self.session.get(url, headers={"Accept": "application/json"}, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def submit(self, function, *args):
+        return self._executor.submit(function, *args)
+
+    def close(self) -> None:
+        """Close the pooled connections; the next request opens a new session"""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+class JokeFeed:
+    def __init__(self, client: HttpClient, url=JOKE_URL, cache_file=JOKE_CACHE_FILE, prefetch=PREFETCH):
+        self.client = client
+        self.url = url
+        self.cache_file = cache_file
+        self.prefetch = prefetch
+        self._ready = deque()
+        self._lock = threading.Lock()
+        self._pending = 0  # fetches in flight
+        self._prefetches = set()  # their futures
+        self._seen = None  # the on-disk cache, read on first use
+        self.closed = False
+
+    def _fetch(self) -> str:
+        joke = self.client.get_json(self.url).get("joke")
+        if not joke:
+            raise ValueError("no joke in the response")
+        self._remember(joke)
+        return joke
+
+    def _prefetched(self, future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._prefetches.discard(future)
+            if not future.cancelled() and future.exception() is None:
+                self._ready.append(future.result())
+
+    def refill(self) -> None:
+        """Start fetches until `prefetch` jokes are ready or on their way"""
+        with self._lock:
+            if self.closed:
+                return
+            missing = self.prefetch - len(self._ready) - self._pending
+            self._pending += max(missing, 0)
+        for _ in range(missing):
+            future = self.client.submit(self._fetch)
+            with self._lock:
+                self._prefetches.add(future)
+            future.add_done_callback(self._prefetched)
+
+    def take(self):
+        """A prefetched joke (and a refill started behind it), or None if none is ready"""
+        with self._lock:
+            joke = self._ready.popleft() if self._ready else None
+        if joke is not None:
+            self.refill()
+        return joke
+
+    def fetch(self):
+        """A Future for a joke fetched now; the queue refills once one arrives"""
+        future = self.client.submit(self._fetch)
+        future.add_done_callback(self._fetched)
+        return future
+
+    def _fetched(self, future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.refill()  # the network is back
+
+    def close(self) -> None:
+        """Cancel the prefetches that haven't started and start no more"""
+        with self._lock:
+            self.closed = True
+            prefetches = list(self._prefetches)
+        for future in prefetches:
+            future.cancel()
+
+    # --- Offline cache ---
+    def _load_seen(self) -> list:
+        if self._seen is None:
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    self._seen = json.load(f)
+            except (OSError, ValueError):
+                self._seen = []
+        return self._seen
+
+    def _remember(self, joke: str) -> None:
+        with self._lock:
+            seen = self._load_seen()
+            if joke in seen:
+                return
+            seen.append(joke)
+            del seen[:-JOKE_CACHE_SIZE]
+            try:
+                os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+                write_json_atomic(self.cache_file, seen)
+            except OSError:
+                pass  # only a fallback; the joke is still shown
+
+    def cached(self):
+        """A joke seen before, or None"""
+        with self._lock:
+            seen = self._load_seen()
+            return random.choice(seen) if seen else None
+
+
+_client = None
+_feed = None
+_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    global _client
+    with _lock:
+        if _client is None:
+            _client = HttpClient()
+    return _client
+
+
+def get_joke_feed() -> JokeFeed:
+    global _feed
+    client = get_client()
+    with _lock:
+        if _feed is None:
+            _feed = JokeFeed(client)
+    return _feed
+
+
+def close() -> None:
+    """Close the joke feed and the HTTP connections, if they were started"""
+    global _feed
+    with _lock:
+        feed, _feed = _feed, None
+        client = _client
+    if feed is not None:
+        feed.close()
+    if client is not None:
+        client.close()
@@ -0,0 +1,229 @@
+import os
+
+from PyQt6.QtWidgets import QTextEdit
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor, QFont
+
+from core.engine import OutputSink
+
+FRAME_MS = 16  # pending output is drawn at most once per frame
+SCROLLBACK_LINES = int(os.environ.get("TERMINALOS_SCROLLBACK", "10000"))  # lines kept in memory
+VIEW_LINES = 300  # lines kept in the QTextEdit document at a time
+PAGE_LINES = 100  # lines paged in when scrolling past either end of the view
+
+
+class Scrollback:
+    """Ring buffer of (text, color, bold) lines with absolute line numbers.
+
+    Line numbers keep counting up when old lines fall off, so a number
+    handed out by append() always refers to the same line or to nothing.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._lines = [None] * self.capacity
+        self.start = 0  # number of the oldest line still kept
+        self.end = 0  # number the next line will get
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def append(self, line: tuple) -> int:
+        self._lines[self.end % self.capacity] = line
+        self.end += 1
+        if self.end - self.start > self.capacity:
+            self.start += 1
+        return self.end - 1
+
+    def __getitem__(self, number: int) -> tuple:
+        if not self.start <= number < self.end:
+            raise IndexError(number)
+        return self._lines[number % self.capacity]
+
+    def __setitem__(self, number: int, line: tuple) -> None:
+        if not self.start <= number < self.end:
+            raise IndexError(number)
+        self._lines[number % self.capacity] = line
+
+    def clear(self) -> None:
+        self._lines = [None] * self.capacity
+        self.start = self.end
+
+
+class TerminalOutput(OutputSink):
+    """Frame-coalesced, bounded writer for the terminal's QTextEdit.
+
+    Lines go into a Scrollback ring buffer of SCROLLBACK_LINES; the document
+    only ever holds a window of about VIEW_LINES of them. Once per frame the
+    lines written since the last frame are inserted through a single cursor
+    in one edit block, runs of lines with the same style become one
+    insertText() call, the view scrolls once and the oldest lines are dropped
+    from the top of the window. Char formats are cached per (color, bold).
+
+    Scrolling to the top of the window pages older lines in from the
+    buffer, and scrolling back down pages newer ones in until the window
+    follows the output again.
+    """
+
+    def __init__(self, view: QTextEdit, scrollback: int = SCROLLBACK_LINES):
+        self.view = view
+        self.view.document().setUndoRedoEnabled(False)
+        self.lines = Scrollback(scrollback)
+        self.view_start = 0  # number of the first line in the document
+        self.view_end = 0  # number after the last line in the document
+        self._following = True
+        self._busy = False
+        self._formats = {}
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.flush)
+        self.view.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+    def _format(self, color: str, bold: bool) -> QTextCharFormat:
+        fmt = self._formats.get((color, bold))
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            if bold:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            self._formats[(color, bold)] = fmt
+        return fmt
+
+    def write_line(self, text: str, color: str = "white", bold: bool = False) -> int:
+        """Queue a line (or several, separated by newlines) and return the last one's number"""
+        for part in text.split("\n"):
+            number = self.lines.append((part, color, bold))
+        if self._following and not self._timer.isActive():
+            self._timer.start()
+        return number
+
+    def replace_line(self, number: int, text: str, color: str = "white", bold: bool = False) -> None:
+        """Change a line in place; if it is in the view its block is redrawn right away"""
+        try:
+            self.lines[number] = (text, color, bold)
+        except IndexError:
+            return  # cleared or fallen out of the scrollback
+        if self.view_start <= number < self.view_end:
+            self._busy = True
+            cursor = QTextCursor(self.view.document().findBlockByNumber(number - self.view_start))
+            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(text, self._format(color, bold))
+            self._busy = False
+
+    def _insert(self, cursor: QTextCursor, start: int, end: int) -> None:
+        run, style = [], None
+        for number in range(start, end):
+            text, color, bold = self.lines[number]
+            if (color, bold) != style and run:
+                cursor.insertText("".join(run), self._format(*style))
+                run = []
+            style = (color, bold)
+            run.append(text + "\n")
+        if run:
+            cursor.insertText("".join(run), self._format(*style))
+
+    def _remove_top(self, cursor: QTextCursor, count: int) -> None:
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor, count)
+        cursor.removeSelectedText()
+        self.view_start += count
+
+    def _remove_bottom(self, cursor: QTextCursor, count: int) -> None:
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.movePosition(QTextCursor.MoveOperation.PreviousBlock, QTextCursor.MoveMode.KeepAnchor, count)
+        cursor.removeSelectedText()
+        self.view_end -= count
+
+    def flush(self) -> None:
+        """Draw everything queued so far"""
+        self._timer.stop()
+        if not self._following or self.view_end == self.lines.end:
+            return
+        self._busy = True
+        start = max(self.view_end, self.lines.end - VIEW_LINES, self.lines.start)
+        if start > self.view_end:
+            # Everything in the window would scroll out anyway
+            self.view.clear()
+            self.view_start = start
+        cursor = QTextCursor(self.view.document())
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._insert(cursor, start, self.lines.end)
+        self.view_end = self.lines.end
+        if self.view_end - self.view_start > VIEW_LINES:
+            self._remove_top(cursor, self.view_end - self.view_start - VIEW_LINES)
+        cursor.endEditBlock()
+        scrollbar = self.view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+        self._busy = False
+
+    def _on_scroll(self, value: int) -> None:
+        if self._busy:
+            return
+        scrollbar = self.view.verticalScrollBar()
+        if value == scrollbar.minimum() and self.view_start > self.lines.start:
+            self._page_up()
+        elif value == scrollbar.maximum() and self.view_end < self.lines.end:
+            # While following, the view only got here by a resize or a shorter
+            # status line; the pending lines are simply drawn
+            if self._following:
+                self.flush()
+            else:
+                self._page_down()
+
+    def _page_up(self) -> None:
+        self._busy = True
+        document = self.view.document()
+        count = min(PAGE_LINES, self.view_start - self.lines.start)
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        self.view_start -= count
+        self._insert(cursor, self.view_start, self.view_start + count)
+        if self.view_end - self.view_start > VIEW_LINES:
+            self._remove_bottom(cursor, self.view_end - self.view_start - VIEW_LINES)
+        cursor.endEditBlock()
+        self._following = self.view_end == self.lines.end
+        # Keep the line that was at the top where it was
+        top = document.documentLayout().blockBoundingRect(document.findBlockByNumber(count)).top()
+        self.view.verticalScrollBar().setValue(int(top))
+        self._busy = False
+
+    def _page_down(self) -> None:
+        if self.view_end < self.lines.start:
+            # The buffer has moved on past the window, go back to the tail
+            self._following = True
+            self.flush()
+            return
+        self._busy = True
+        document = self.view.document()
+        count = min(PAGE_LINES, self.lines.end - self.view_end)
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._insert(cursor, self.view_end, self.view_end + count)
+        self.view_end += count
+        if self.view_end - self.view_start > VIEW_LINES:
+            self._remove_top(cursor, self.view_end - self.view_start - VIEW_LINES)
+        cursor.endEditBlock()
+        self._following = self.view_end == self.lines.end
+        scrollbar = self.view.verticalScrollBar()
+        if self._following:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            # Keep the line that was at the bottom in sight
+            block = document.findBlockByNumber(max(0, self.view_end - self.view_start - count - 1))
+            rect = document.documentLayout().blockBoundingRect(block)
+            scrollbar.setValue(int(rect.bottom()) - self.view.viewport().height())
+        self._busy = False
+
+    def clear(self) -> None:
+        """Drop all output, queued or drawn"""
+        self._timer.stop()
+        self.lines.clear()
+        self.view_start = self.view_end = self.lines.end
+        self._following = True
+        self._busy = True
+        self.view.clear()
+        self._busy = False
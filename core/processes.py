@@ -0,0 +1,115 @@
+"""Child processes whose output streams into the terminal.
+
+Session.processes starts them: start(argv, on_output, on_finished) calls
+on_output(line, is_error) for every line the process prints and then
+on_finished(exit_code, cancelled). BlockingProcesses, the default, does
+that before start() returns; the Qt terminal swaps in QtProcesses, which
+runs them as QProcess jobs and calls back from the event loop. Both count
+the processes that failed (exited non-zero or could not start) in
+`failed`, so a script run can report them in its exit code.
+"""
+import subprocess
+import sys
+
+
+def script_exit_code(processes) -> int:
+    """Exit code of a script run: 1, with a note on stderr, if a process it started failed"""
+    if processes.failed:
+        print(f"{processes.failed} process(es) started by the script failed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+class BlockingProcesses:
+    """Run each process to the end, streaming its output as it comes (stderr merged into stdout)"""
+
+    def __init__(self):
+        self.failed = 0
+
+    def start(self, argv: list, on_output, on_finished):
+        try:
+            process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       text=True, errors="replace", bufsize=1)
+        except OSError as e:
+            self.failed += 1
+            on_output(str(e), True)
+            on_finished(-1, False)
+            return None
+        with process.stdout:
+            for line in process.stdout:
+                on_output(line.rstrip("\r\n"), False)
+        exit_code = process.wait()
+        if exit_code != 0:
+            self.failed += 1
+        on_finished(exit_code, False)
+        return process
+
+    def is_running(self, job) -> bool:
+        return False
+
+    def cancel(self, job) -> None:
+        pass
+
+    def cancel_all(self) -> None:
+        pass
+
+
+class QtProcesses:
+    """Run processes as QProcess jobs; output arrives through the event loop"""
+
+    def __init__(self):
+        from PyQt6.QtCore import QProcess  # the engine itself never imports Qt
+
+        self._QProcess = QProcess
+        self._jobs = {}  # QProcess -> cancelled
+        self.failed = 0
+
+    def start(self, argv: list, on_output, on_finished):
+        process = self._QProcess()
+        pending = {False: b"", True: b""}  # the unfinished last line of stdout and stderr
+
+        def read(error, flush=False):
+            data = process.readAllStandardError() if error else process.readAllStandardOutput()
+            *lines, pending[error] = (pending[error] + bytes(data)).split(b"\n")
+            if flush and pending[error]:
+                lines.append(pending[error])
+                pending[error] = b""
+            for line in lines:
+                on_output(line.decode(errors="replace").rstrip("\r"), error)
+
+        def finished(exit_code, exit_status):
+            read(False, flush=True)
+            read(True, flush=True)
+            cancelled = self._jobs.pop(process, False)
+            if exit_code != 0 and not cancelled:
+                self.failed += 1
+            on_finished(exit_code, cancelled)
+
+        def failed(error):
+            if error == self._QProcess.ProcessError.FailedToStart:
+                self._jobs.pop(process, None)
+                self.failed += 1
+                on_output(process.errorString(), True)
+                on_finished(-1, False)
+
+        process.readyReadStandardOutput.connect(lambda: read(False))
+        process.readyReadStandardError.connect(lambda: read(True))
+        process.finished.connect(finished)
+        process.errorOccurred.connect(failed)
+        self._jobs[process] = False
+        process.start(argv[0], argv[1:])
+        return process
+
+    def is_running(self, job) -> bool:
+        return job in self._jobs
+
+    def cancel(self, job) -> None:
+        if job in self._jobs:
+            self._jobs[job] = True
+            job.kill()  # finished() follows from the event loop
+
+    def cancel_all(self) -> None:
+        """Kill every job and wait for it, so none outlives its QProcess"""
+        for job in list(self._jobs):
+            self.cancel(job)
+            job.waitForFinished(1000)
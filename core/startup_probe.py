@@ -0,0 +1,20 @@
+"""Startup milestones for benchmarks/startup.py.
+
+When TERMINALOS_STARTUP_PROBE names a file, each milestone appends
+"<name> <unix time>" to it, and the application closes itself once the
+login window has been drawn. Without the variable nothing happens.
+"""
+import os
+import time
+
+PROBE_FILE = os.environ.get("TERMINALOS_STARTUP_PROBE")
+
+
+def enabled() -> bool:
+    return bool(PROBE_FILE)
+
+
+def mark(name: str) -> None:
+    if PROBE_FILE:
+        with open(PROBE_FILE, "a", encoding="utf-8") as f:
+            f.write(f"{name} {time.time():.6f}\n")
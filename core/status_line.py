@@ -0,0 +1,47 @@
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import QTimer
+
+REFRESH_MS = 1000
+
+
+class StatusLine(QLabel):
+    """A line under the terminal output that live widgets update in place.
+
+    A widget is a name and a function returning its current text. All of
+    them are refreshed by one shared timer that only runs while at least one
+    widget is shown, and the label is only touched when the text changed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._widgets = {}
+        self._timer = QTimer()
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def add(self, name: str, render) -> None:
+        self._widgets[name] = render
+        self.refresh()
+        self.show()
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, name: str) -> None:
+        self._widgets.pop(name, None)
+        if not self._widgets:
+            self._timer.stop()
+            self.hide()
+        self.refresh()
+
+    def has(self, name: str) -> bool:
+        return name in self._widgets
+
+    def clear(self) -> None:
+        for name in list(self._widgets):
+            self.remove(name)
+
+    def refresh(self) -> None:
+        text = "   |   ".join(render() for render in self._widgets.values())
+        if text != self.text():
+            self.setText(text)
@@ -1,65 +1,70 @@
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton,
-    QInputDialog, QMessageBox, QApplication
-)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor, QFont, QKeyEvent
-from core.utils import save_users
-import random
-import time
-import pyfiglet  # za ASCII art generisanje (pip install pyfiglet)
-import requests  # <-- dodato za joke API
-import subprocess
-import sys
-import webbrowser
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton, QInputDialog
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtGui import QKeyEvent
+from core.engine import InputProvider, Session, INT_MIN, INT_MAX
+from core.output import TerminalOutput
+from core.animation import AnimationScheduler
+from core.processes import QtProcesses
+from core.status_line import StatusLine
+
+
+class DialogInput(InputProvider):
+    """Ask with modal QInputDialogs over the terminal window"""
+
+    def __init__(self, parent: QWidget):
+        self.parent = parent
+
+    def get_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        return QInputDialog.getText(self.parent, title, prompt)
+
+    def get_int(self, title: str, prompt: str, minimum: int = INT_MIN, maximum: int = INT_MAX) -> tuple[int, bool]:
+        return QInputDialog.getInt(self.parent, title, prompt, min=minimum, max=maximum)
+
+    def get_multiline_text(self, title: str, prompt: str) -> tuple[str, bool]:
+        return QInputDialog.getMultiLineText(self.parent, title, prompt)
+
+
+class _Poster(QObject):
+    """Run callables on the GUI thread, whichever thread posts them"""
+    posted = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.posted.connect(lambda function: function())
 
 
 class TerminalScreen(QWidget):
-    def __init__(self, username: str, users: dict):
+    """The Qt frontend of a Session: output view, status line and command input"""
+
+    def __init__(self, username: str, record, quiet: bool = False):
         super().__init__()
 
-        # --- User and session data ---
         self.username = username
-        self.users = users
-        self.data = self.users.get(username, {})
-        self.language = self.data.get("language", 0)  # 0 - English, 1 - Serbian
-        self.history = self.data.get("history", [])
-        self.notes = self.data.get("notes", [])
-
-        # --- Command and UI state ---
-        self.command_history = []
-        self.history_index = -1
-        self.neofetch_anim_running = False
-        self.current_line = 0
-        self.ascii_anim_running = False
-        self.ascii_anim_index = 0
+
+        # --- Command line state ---
+        self.history_index = None  # position while browsing with Up/Down
+        self.search = None  # Ctrl+R state: query, matched entry and the text before searching
 
         self.setWindowTitle(f"BetterC Terminal - {self.username}")
         self.resize(800, 600)
 
-        # --- ASCII arts for neofetch animation ---
-        self.ascii_art = [
-            "   ******   ",
-            " *        * ",
-            "*  ****   * ",
-            "* *       * ",
-            "* *       * ",
-            "*  ****   * ",
-            " *        * ",
-            "   ******   "
-        ]
-
         # --- Setup UI ---
         self._setup_ui()
 
-        # --- Initial banner and welcome ---
-        self.print_ascii_banner()
-        self.print_info(self._lang("Welcome, {user}!", "Dobrodošli, {user}!", user=self.username))
-        self.print_info(self._lang("Type 'help' for commands.", "Ukucajte 'help' za komande."))
+        # --- Session (everything that isn't a widget lives there) ---
+        self.session = Session(username, record, self.out, DialogInput(self), quiet=quiet)
+        self.session.animations = AnimationScheduler(self.out, quiet=quiet)
+        self.session.processes = QtProcesses()
+        self.session.status_line = self.status_line
+        self.session.gui = True
+        self.session.on_close = self.close
+        self.poster = _Poster()
+        self.session.post = self.poster.posted.emit
+        self.btn_send.setText(self.session.lang("Send", "Pošalji"))
+        self.session.command_history.preload()  # ready for Up and Ctrl+R without reading it on this thread
 
-        # --- Activity log file ---
-        self._log_file_path = f"{self.username}_activity.log"
-        self._log(f"User {self.username} logged in.")
+        # --- Initial banner and welcome ---
+        self.session.start()
 
     def _setup_ui(self) -> None:
         """Initialize UI widgets and layout"""
@@ -72,6 +77,14 @@ class TerminalScreen(QWidget):
             "background-color: black; color: white; font-family: Consolas, monospace; font-size: 14px;"
         )
         self.layout.addWidget(self.output)
+        self.out = TerminalOutput(self.output)
+
+        # Status line (live widgets such as the clock, updated in place)
+        self.status_line = StatusLine()
+        self.status_line.setStyleSheet(
+            "background-color: black; color: yellow; font-weight: bold; font-family: Consolas, monospace; font-size: 14px;"
+        )
+        self.layout.addWidget(self.status_line)
 
         # Input QLineEdit (command input)
         self.input = QLineEdit()
@@ -83,7 +96,7 @@ class TerminalScreen(QWidget):
         self.layout.addWidget(self.input)
 
         # Send button
-        self.btn_send = QPushButton(self._lang("Send", "Pošalji"))
+        self.btn_send = QPushButton()
         self.btn_send.setStyleSheet(
             "background-color: #222; color: white; font-family: Consolas, monospace; font-size: 14px;"
         )
@@ -92,654 +105,120 @@ class TerminalScreen(QWidget):
 
         self.setLayout(self.layout)
 
-    def _lang(self, en_text: str, sr_text: str, **kwargs) -> str:
-        """Return language-dependent text with optional formatting"""
-        text = en_text if self.language == 0 else sr_text
-        if kwargs:
-            return text.format(**kwargs)
-        return text
-
-    def _log(self, message: str) -> None:
-        """Append log message to file with timestamp"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        with open(self._log_file_path, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-
     def eventFilter(self, obj, event) -> bool:
-        """Handle Up/Down keys to navigate command history"""
+        """Handle Up/Down keys to navigate command history, Ctrl+R to search it and Tab to complete"""
         if obj == self.input and event.type() == QKeyEvent.Type.KeyPress:
-            if event.key() == Qt.Key.Key_Up:
-                if self.command_history and self.history_index > 0:
-                    self.history_index -= 1
-                    self.input.setText(self.command_history[self.history_index])
+            if self.search is not None:
+                return self._search_key(event)
+            if event.key() == Qt.Key.Key_R and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                self.search = {"query": "", "match": None, "text": self.input.text()}
+                self._show_search()
+                return True
+            elif event.key() == Qt.Key.Key_Tab:
+                self.complete_input()
+                return True
+            elif event.key() == Qt.Key.Key_Up:
+                commands = self.session.command_history.commands()
+                index = len(commands) if self.history_index is None else self.history_index
+                if index > 0:
+                    self.history_index = index - 1
+                    self.input.setText(commands[self.history_index])
                 return True
             elif event.key() == Qt.Key.Key_Down:
-                if self.command_history and self.history_index < len(self.command_history) - 1:
+                if self.history_index is None:
+                    return True
+                commands = self.session.command_history.commands()
+                if self.history_index < len(commands) - 1:
                     self.history_index += 1
-                    self.input.setText(self.command_history[self.history_index])
+                    self.input.setText(commands[self.history_index])
                 else:
-                    self.history_index = len(self.command_history)
+                    self.history_index = None
                     self.input.clear()
                 return True
         return super().eventFilter(obj, event)
 
-    def print_line(self, text: str, color: str = "white", bold: bool = False) -> None:
-        """Print text with optional color and bold style"""
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        if bold:
-            fmt.setFontWeight(QFont.Weight.Bold)
-
-        cursor = self.output.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(text + "\n", fmt)
-        self.output.setTextCursor(cursor)
-        self.output.ensureCursorVisible()
-
-    def print_prompt(self, text: str) -> None:
-        self.print_line(f"> {text}", color="#00FFFF", bold=True)
-
-    def print_error(self, text: str) -> None:
-        self.print_line(text, color="red", bold=True)
-
-    def print_info(self, text: str) -> None:
-        self.print_line(text, color="lime", bold=False)
-    def dos_attack(self) -> None:
-        """Perform a simple DoS attack (for educational purposes only)."""
-        target, ok = QInputDialog.getText(self, "DDoS Attack", self._lang("Enter target IP or URL:", "Unesite ciljnu IP adresu ili URL:"))
-        if not ok or not target.strip():
-            self.print_info(self._lang("DoS attack cancelled.", "DoS napad otkazan."))
-            return
-
-        try:
-            num_requests, ok = QInputDialog.getInt(self, "DDoS Attack", self._lang("Enter number of requests:", "Unesite broj zahteva:"))
-            if not ok or num_requests <= 0:
-                self.print_info(self._lang("DoS attack cancelled.", "DoS napad otkazan."))
-                return
-
-            self.print_info(self._lang(f"Starting DoS attack on {target}...", f"Pokrećem DoS napad na {target}..."))
-            for i in range(num_requests):
-                try:
-                    response = requests.get(f"http://{target}", timeout=5)
-                    self.print_info(self._lang(f"Request {i+1}/{num_requests} sent. Status code: {response.status_code}",
-                                               f"Zahtev {i+1}/{num_requests} poslat. Statusni kod: {response.status_code}"))
-                except Exception as e:
-                    self.print_error(self._lang(f"Request {i+1} failed: {e}", f"Zahtev {i+1} nije uspeo: {e}"))
-                    break
-
-            self.print_info(self._lang("DoS attack completed.", "DoS napad završen."))
-        except Exception as e:
-            self.print_error(self._lang(f"Error: {e}", f"Greška: {e}"))
-    def print_ascii_banner(self) -> None:
-        banner = [
-            "| \ | |/ _ \ \   / / \    |___ /| || |  ", 
-            "|  \| | | | \ \ / / _ \     |_ \| || |_ ", 
-            "| |\  | |_| |\ V / ___ \   ___) |__   _|", 
-            "|_| \_|\___/  \_/_/   \_\ |____/   |_|",   
-        ]
-        for line in banner:
-            self.print_line(line, color="#00FFFF", bold=True)
+    # --- Reverse-incremental history search (Ctrl+R) ---
+    def _search_key(self, event) -> bool:
+        key = event.key()
+        ctrl = event.modifiers() & Qt.KeyboardModifier.ControlModifier
+        search = self.search
+        if ctrl and key == Qt.Key.Key_R:
+            # Next older match
+            if search["match"] is not None:
+                search["match"] = self.session.command_history.search(search["query"], before=search["match"][0]) or search["match"]
+        elif key == Qt.Key.Key_Escape or (ctrl and key == Qt.Key.Key_G):
+            self.input.setText(search["text"])
+            self._end_search()
+            return True
+        elif key == Qt.Key.Key_Backspace:
+            search["query"] = search["query"][:-1]
+            search["match"] = self.session.command_history.search(search["query"])
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._end_search()
+            return False  # run the match
+        elif event.text() and event.text().isprintable() and not ctrl:
+            return self._search_type(event.text())
+        else:
+            # Any other key takes the match for editing
+            self._end_search()
+            return False
+        self._show_search()
+        return True
+
+    def _search_type(self, text: str) -> bool:
+        search = self.search
+        search["query"] += text
+        match = search["match"]
+        if match is None or search["query"].lower() not in match[1].lower():
+            search["match"] = self.session.command_history.search(search["query"])
+        self._show_search()
+        return True
+
+    def _show_search(self) -> None:
+        search = self.search
+        if search["match"] is not None:
+            self.input.setText(search["match"][1])
+        failed = "" if search["match"] or not search["query"] else self.session.lang("failing ", "neuspešna ")
+        label = self.session.lang(f"({failed}reverse-i-search)`{search['query']}'", f"({failed}pretraga unazad)`{search['query']}'")
+        self.status_line.add("search", lambda: label)
+
+    def _end_search(self) -> None:
+        self.search = None
+        self.status_line.remove("search")
+
+    def complete_input(self) -> None:
+        """Complete the word left of the cursor; list the choices if it is ambiguous"""
+        text = self.input.text()
+        position = self.input.cursorPosition()
+        completed, candidates = self.session.completer.complete(text[:position])
+        if completed != text[:position]:
+            self.input.setText(completed + text[position:])
+            self.input.setCursorPosition(len(completed))
+        elif len(candidates) > 1:
+            self.session.print_info("  ".join(candidates))
 
     def process_command(self) -> None:
         cmd = self.input.text().strip()
         if not cmd:
+            if self.status_line.has("clock"):
+                self.session.stop_time()
             return
-        self.command_history.append(cmd)
-        self.history_index = len(self.command_history)
+        self.session.command_history.add(cmd)
+        self.history_index = None
         self.input.clear()
+        self.session.execute(cmd)
 
-        cmd_lower = cmd.lower()
-        if self.neofetch_anim_running or self.ascii_anim_running:
-            self.neofetch_anim_running = False
-            self.ascii_anim_running = False
-
-        self.print_prompt(cmd)
-        self._log(f"Command entered: {cmd}")
-
-        # Add your new commands here!
-        commands = {
-            "help": self.show_help,
-            "neofetch": self.start_neofetch_animation,
-            "ascii": self.generate_ascii_text,
-            "ascii_anim": self.start_ascii_animation,
-            "en": lambda: self._set_language(0),
-            "sr": lambda: self._set_language(1),
-            "password": self.generate_password,
-            "calc": self.run_calculator,
-            "time": self.show_time,
-            "note": self.note_manager,
-            "logout": self.logout,
-            "quit": self.quit_program,
-            "exit": self.quit_program,
-            "clear": self.clear_output,
-            "random_joke": self.random_joke,
-            "fortune": self.show_fortune,
-            "color": self.color,         
-            "colora": self.colora,       
-            "cquit": self.cquit,        
-            "hack": self.hack,           
-            "hackfbi": self.hackfbi,     
-            "dos_attack": self.dos_attack,
-            "search": self.search,  # Fixed search command
-            "wiki": self.wiki,        # Added wiki command
-            "youtube": self.youtube,  # Added youtube command
-            "code": self.code  # New code editor command
-        }
-
-        func = commands.get(cmd_lower)
-        if func:
-            func()
-        else:
-            # pip_install and other dynamic commands
-            self.handle_command(cmd_lower)
-
-        self.save_user_data()
-
-    def _set_language(self, lang_id: int) -> None:
-        self.language = lang_id
-        self.print_info(self._lang("Language set to English.", "Jezik postavljen na srpski."))
-
-    def save_user_data(self) -> None:
-        self.users[self.username]["language"] = self.language
-        self.users[self.username]["history"] = self.history[-1000:]
-        self.users[self.username]["notes"] = self.notes
-        save_users(self.users)
-        self._log("User data saved.")
-
-    def show_help(self) -> None:
-        if self.language == 0:
-            cmds = [
-                "calc         - calculator",
-                "time         - live clock",
-                "neofetch     - show logo animation",
-                "ascii        - generate ASCII text art",
-                "ascii_anim   - simple ASCII animation",
-                "password     - generate random password",
-                "note         - simple note manager",
-                "clear        - clear terminal output",
-                "random_joke  - show random joke",
-                "fortune      - show a fortune cookie message",
-                "logout       - logout current user",
-                "en           - set English language",
-                "sr           - set Serbian language",
-                "pip_install <package> - install Python package",
-                "hackfbi      - hack FBI (just for fun)",
-                "color        - show green text",
-                "colora       - show red text",
-                "cquit        - reset text color",
-                "hack         - simple matrix hack animation",
-                "search <text> - search on Google",
-                "dods_attack <target> - perform a simple DoS attack (for educational purposes only)",
-                "wiki        - search on Wikipedia",
-                "youtube     - search on YouTube",
-                "code - open Python code editor and runner",
-                "quit/exit    - exit program"
-            ]
-        else:
-            cmds = [
-                "calc         - kalkulator",
-                "time         - živ časovnik",
-                "neofetch     - prikaz logo animacije",
-                "ascii        - generiši ASCII tekst",
-                "ascii_anim   - jednostavna ASCII animacija",
-                "password     - generiše slučajnu lozinku",
-                "note         - menadžer beleški",
-                "clear        - očisti terminal",
-                "random_joke  - prikaz nasumičnog šala",
-                "fortune      - prikaži poruku iz fortune cookie",
-                "logout       - odjava korisnika",
-                "en           - postavi engleski jezik",
-                "sr           - postavi srpski jezik",
-                "pip_install <package> - instaliraj Python paket",
-                "search <text> - pretraga na Google",
-                "hackfbi      - hakuj FBI (samo za zabavu)",
-                "color        - prikaži zeleni tekst",
-                "colora       - prikaži crveni tekst",
-                "cquit        - resetuj boju teksta",
-                "hack         - jednostavna matrica animacija",
-                "dods_attack <target> - izvrši jednostavan DoS napad (samo u edukativne svrhe)",
-                "wiki        - pretraga na Wikipediji",
-                "youtube     - pretraga na YouTube-u",
-                "code - otvori Python uređivač koda i pokretač",
-                "quit/exit    - izlaz iz programa"
-            ]
-        self.print_info("=== Commands ===" if self.language == 0 else "=== Komande ===")
-        for c in cmds:
-            self.print_info(c)
-
-    # --- Neofetch animation ---
-    def start_neofetch_animation(self) -> None:
-        if self.neofetch_anim_running:
-            self.print_info(self._lang("Animation already running.", "Animacija je već pokrenuta."))
-            return
-        self.neofetch_anim_running = True
-        self.current_line = 0
-        self.output.clear()
-        self.animate_ascii_light()
-
-    def animate_ascii_light(self) -> None:
-        if not self.neofetch_anim_running:
-            return
-        self.output.clear()
-        fmt_normal = QTextCharFormat()
-        fmt_normal.setForeground(QColor("grey"))
-        fmt_bright = QTextCharFormat()
-        fmt_bright.setForeground(QColor("cyan"))
-        fmt_bright.setFontWeight(QFont.Weight.Bold)
-
-        cursor = self.output.textCursor()
-        for i, line in enumerate(self.ascii_art):
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            if i == self.current_line:
-                cursor.insertText(line + "\n", fmt_bright)
-            else:
-                cursor.insertText(line + "\n", fmt_normal)
-
-        self.current_line = (self.current_line + 1) % len(self.ascii_art)
-        QTimer.singleShot(150, self.animate_ascii_light)
-    def youtube(self) -> None:
-        text, ok = QInputDialog.getText(self, "YouTube Search", self._lang("Enter term to search on YouTube:", "Unesite pojam za pretragu na YouTube-u:"))
-        if not ok or not text.strip():
-            self.print_info(self._lang("YouTube search cancelled.", "Pretraga na YouTube-u otkazana."))
-            return
-
-        self.print_info(self._lang(f"Searching YouTube for: {text}", f"Tražim na YouTube-u: {text}"))
-        webbrowser.open(f"https://www.youtube.com/results?search_query={text.replace(' ', '+')}")
-    # --- ASCII Text generator (pyfiglet) ---
-    def generate_ascii_text(self) -> None:
-        text, ok = QInputDialog.getText(self, "ASCII Text", self._lang("Enter text to convert to ASCII art:", "Unesite tekst za ASCII umetnost:"))
-        if not ok or not text.strip():
-            self.print_info(self._lang("ASCII generation cancelled.", "Generisanje ASCII umetnosti otkazano."))
-            return
-
-        try:
-            ascii_art = pyfiglet.figlet_format(text)
-            self.print_info(self._lang("Generated ASCII art:", "Generisana ASCII umetnost:"))
-            for line in ascii_art.splitlines():
-                self.print_line(line, color="yellow")
-        except Exception as e:
-            self.print_error(self._lang(f"Error generating ASCII art: {e}", f"Greška prilikom generisanja ASCII umetnosti: {e}"))
-    def wiki(self) -> None:
-        text, ok = QInputDialog.getText(self, "Wikipedia Search", self._lang("Enter term to search on Wikipedia:", "Unesite pojam za pretragu na Wikipediji:"))
-        if not ok or not text.strip():
-            self.print_info(self._lang("Wikipedia search cancelled.", "Pretraga na Wikipediji otkazana."))
-            return
-
-        self.print_info(self._lang(f"Searching Wikipedia for: {text}", f"Tražim na Wikipediji: {text}"))
-        webbrowser.open(f"https://en.wikipedia.org/wiki/{text.replace(' ', '_')}")
-    def hackfbi(self) -> None:
-        for i in range(10):
-            self.print_line(f"Hacking FBI... {i+1}/10", color="red", bold=True)
-            QApplication.processEvents()
-            time.sleep(1) 
-        self.print_line("Text color reset to default.", color="white", bold=False)
-        self.print_info(self._lang("FBI hacked successfully!", "FBI uspešno hakovan!"))
-    def color (self) -> None:
-        self.print_line("This is green text.", color="green", bold=True)
-        self.print_line("Text color reset to default.", color="white", bold=False)
-        self.print_info(self._lang("Color demonstration complete.", "Demonstracija boja završena."))
-
-        
-    def colora(self):
-        self.print_line("This is red text.", color="red", bold=True)
-        self.print_line("Text color reset to default.", color="white", bold=False)
-        self.print_info(self._lang("Red color demonstration complete.", "Demonstracija crvene boje završena."))
-
-    def cquit(self):
-        self.print_line("Text color reset to default.", color="white", bold=False)
-        self.print_info(self._lang("Color reset complete.", "Boja resetovana."))
-
-    def hack(self):
-        for i in range(10):
-            self.print_line(f"Matrix hack... {i+1}/10", color="green", bold=True)
-            QApplication.processEvents()
-            time.sleep(0.1)
-        self.print_line("Text color reset to default.", color="white", bold=False)
-        self.print_info(self._lang("Matrix hack complete!", "Matrix hack završen!"))
-    # --- Simple ASCII animation ---
-    def start_ascii_animation(self) -> None:
-        if self.ascii_anim_running:
-            self.print_info(self._lang("ASCII animation already running.", "ASCII animacija je već pokrenuta."))
-            return
-
-        self.ascii_anim_frames = [
-            "(>^_^)>",
-            "<(^_^<)",
-            "^(^_^)^",
-            "v(^_^)v",
-            "(^_^)"
-        ]
-        self.ascii_anim_running = True
-        self.ascii_anim_index = 0
-        self.output.clear()
-        self.animate_ascii_frames()
-    def search(self) -> None:
-        """Search for a term on Google."""
-        text, ok = QInputDialog.getText(self, "Search", self._lang("Enter text to search:", "Unesite tekst za pretragu:"))
-        if not ok or not text.strip():
-            self.print_info(self._lang("Search cancelled.", "Pretraga otkazana."))
-            return
-
-        self.print_info(self._lang(f"Searching for: {text}", f"Tražim: {text}"))
-        # Open the search query in the default web browser
-        webbrowser.open(f"https://www.google.com/search?q={text}")
-
-    def animate_ascii_frames(self) -> None:
-        if not self.ascii_anim_running:
-            return
-        self.output.clear()
-        frame = self.ascii_anim_frames[self.ascii_anim_index]
-        self.print_line(frame, color="cyan", bold=True)
-        self.ascii_anim_index = (self.ascii_anim_index + 1) % len(self.ascii_anim_frames)
-        QTimer.singleShot(300, self.animate_ascii_frames)
-
-    # --- Password generator ---
-    def generate_password(self) -> None:
-        charset = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
-        length, ok = self.get_input_number(
-            self._lang("Enter password length (1-100):", "Unesite dužinu lozinke (1-100):")
-        )
-        if not ok:
-            self.print_info(self._lang("Password generation cancelled.", "Generisanje lozinke otkazano."))
-            return
-        if length <= 0 or length > 100:
-            self.print_error(self._lang("Invalid length!", "Nevažeća dužina!"))
-            return
-        password = ''.join(random.choice(charset) for _ in range(length))
-        self.print_info(self._lang(f"Generated password: {password}", f"Generisana lozinka: {password}"))
-
-    def get_input_number(self, prompt: str) -> tuple[int, bool]:
-        return QInputDialog.getInt(self, "Input", prompt, min=1, max=100)
-
-    # --- Calculator ---
-    def run_calculator(self) -> None:
-        self.print_info(self._lang("Entering calculator mode.", "Ulazim u režim kalkulatora."))
-        while True:
-            opts = {
-                'en': "Options: n(+) m(-) e(*) d(/) h(history) q(quit)",
-                'sr': "Opcije: n(+) m(-) e(*) d(/) h(istorija) q(izlaz)"
-            }
-            option, ok = QInputDialog.getText(self, "Calculator", opts['en'] if self.language == 0 else opts['sr'])
-            if not ok:
-                break
-            option = option.lower()
-            if option == 'q':
-                self.print_info(self._lang("Leaving calculator...", "Izlazim iz kalkulatora..."))
-                break
-            elif option == 'h':
-                if len(self.history) == 0:
-                    self.print_info(self._lang("No history saved yet.", "Još uvek nema sačuvane istorije."))
-                else:
-                    self.print_info(self._lang("Calculation History:", "Istorija kalkulacija:"))
-                    for i, val in enumerate(self.history[-10:], start=1):
-                        self.print_line(f"{i}) {val}")
-                continue
-            elif option not in ['n', 'm', 'e', 'd']:
-                self.print_error(self._lang("Invalid option! Try again.", "Nevažeća opcija! Pokušajte ponovo."))
-                continue
-
-            a, ok1 = QInputDialog.getInt(self, "Calculator", self._lang("Enter first number:", "Unesite prvi broj:"))
-            if not ok1:
-                break
-            b, ok2 = QInputDialog.getInt(self, "Calculator", self._lang("Enter second number:", "Unesite drugi broj:"))
-            if not ok2:
-                break
-
-            try:
-                if option == 'n':  # addition
-                    result = a + b
-                    self.print_info(self._lang(f"Sum: {result}", f"Zbir: {result}"))
-                elif option == 'm':  # subtraction
-                    result = a - b
-                    self.print_info(self._lang(f"Result: {result}", f"Rezultat: {result}"))
-                elif option == 'e':  # multiplication
-                    result = a * b
-                    self.print_info(self._lang(f"Product: {result}", f"Proizvod: {result}"))
-                elif option == 'd':  # division
-                    if b == 0:
-                        self.print_error(self._lang("Error: Division by zero!", "Greška: Deljenje nulom!"))
-                        continue
-                    result = a // b
-                    self.print_info(self._lang(f"Quotient: {result}", f"Količnik: {result}"))
-                else:
-                    continue
-
-                self.history.append(result)
-            except Exception as e:
-                self.print_error(self._lang(f"Calculation error: {e}", f"Greška prilikom računanja: {e}"))
-
-    # --- Live clock ---
-    def show_time(self) -> None:
-        self.print_info(self._lang("Press Enter to stop the clock.", "Pritisnite Enter za zaustavljanje časovnika."))
-
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
-
-        # Reconnect returnPressed for stopping time only once
-        self.input.returnPressed.disconnect()
-        self.input.returnPressed.connect(self.stop_time)
-
-    def update_time(self) -> None:
-        current_time = time.strftime("%H:%M:%S")
-        self.print_line(current_time, color="yellow", bold=True)
-
-    def stop_time(self) -> None:
-        if hasattr(self, "timer"):
-            self.timer.stop()
-            self.print_info(self._lang("Clock stopped.", "Časovnik zaustavljen."))
-            self.input.returnPressed.disconnect()
-            self.input.returnPressed.connect(self.process_command)
-
-    # --- Notes Manager ---
-    def note_manager(self) -> None:
-        prompt = self._lang(
-            "Note Manager: (write/read/delete/exit)",
-            "Menadžer beleški: (write/read/delete/exit)"
-        )
-
-        while True:
-            choice, ok = QInputDialog.getText(self, "Notes", prompt)
-            if not ok:
-                break
-            choice = choice.lower()
-
-            if choice == "write":
-                self._note_write()
-            elif choice == "read":
-                self._note_read()
-            elif choice == "delete":
-                self._note_delete()
-            elif choice == "exit":
-                self.print_info(self._lang("Exiting notes manager.", "Izlazim iz menadžera beleški."))
-                break
-            else:
-                self.print_error(self._lang("Unknown option.", "Nepoznata opcija."))
-
-    def _note_write(self) -> None:
-        note, ok = QInputDialog.getMultiLineText(self, "Write Note", self._lang("Enter note text:", "Unesite tekst beleške:"))
-        if ok and note.strip():
-            self.notes.append(note.strip())
-            self.print_info(self._lang("Note saved.", "Beleška sačuvana."))
-        else:
-            self.print_info(self._lang("No note saved.", "Beleška nije sačuvana."))
-
-    def _note_read(self) -> None:
-        if not self.notes:
-            self.print_info(self._lang("No notes available.", "Nema dostupnih beleški."))
-            return
-        self.print_info(self._lang("Your notes:", "Vaše beleške:"))
-        for i, note in enumerate(self.notes, start=1):
-            self.print_line(f"{i}) {note}")
-
-    def _note_delete(self) -> None:
-        if not self.notes:
-            self.print_info(self._lang("No notes to delete.", "Nema beleški za brisanje."))
-            return
-        index, ok = QInputDialog.getInt(
-            self, "Delete Note",
-            self._lang(f"Enter note number to delete (1-{len(self.notes)}):",
-                       f"Unesite broj beleške za brisanje (1-{len(self.notes)}):"),
-            min=1, max=len(self.notes)
-        )
-        if ok:
-            deleted = self.notes.pop(index - 1)
-            self.print_info(self._lang(f"Deleted note: {deleted}", f"Obrisana beleška: {deleted}"))
-        else:
-            self.print_info(self._lang("Delete cancelled.", "Brisanje otkazano."))
-
-    # --- Logout ---
-    def logout(self) -> None:
-        self._log(f"User {self.username} logged out.")
-        self.print_info(self._lang("Logging out...", "Odjavljivanje..."))
-        self.close()
-
-    # --- Quit program ---
-    def quit_program(self) -> None:
-        self._log(f"User {self.username} exited program.")
-        self.print_info(self._lang("Exiting program...", "Izlaz iz programa..."))
-        self.close()
-
-    # --- Clear terminal output ---
-    def clear_output(self) -> None:
-        self.output.clear()
-        self.print_info(self._lang("Terminal cleared.", "Terminal očišćen."))
-
-    # --- Random joke (fetch from icanhazdadjoke.com API) ---
-    def random_joke(self) -> None:
-        try:
-            headers = {'Accept': 'application/json', 'User-Agent': 'BetterC Terminal'}
-            response = requests.get("https://icanhazdadjoke.com/", headers=headers, timeout=5)
-            if response.status_code == 200:
-                joke_json = response.json()
-                joke = joke_json.get("joke", None)
-                if joke:
-                    self.print_info(joke)
-                else:
-                    self.print_info(self._lang("No joke found.", "Nema pronađene šale."))
-            else:
-                self.print_info(self._lang("Failed to fetch joke.", "Nije uspelo preuzimanje šale."))
-        except Exception as e:
-            self.print_error(self._lang(f"Error fetching joke: {e}", f"Greška prilikom preuzimanja šale: {e}"))
-
-    # --- Fortune cookie messages ---
-    def show_fortune(self) -> None:
-        fortunes_en = [
-            "You will have a pleasant surprise.",
-            "A thrilling time is in your immediate future.",
-            "Your hard work will soon pay off.",
-            "New opportunities are around the corner."
-        ]
-        fortunes_sr = [
-            "Čeka vas prijatno iznenađenje.",
-            "Uskoro vas očekuje uzbudljivo vreme.",
-            "Vaš trud će uskoro biti nagrađen.",
-            "Nove prilike su iza ugla."
-        ]
-        fortune = random.choice(fortunes_en if self.language == 0 else fortunes_sr)
-        self.print_info(f"Fortune: {fortune}")
-
-    def handle_command(self, cmd):
-        try:
-            if cmd.startswith("pip_install "):
-                package = cmd.split(" ", 1)[1]
-                self.print_info(f"Installing package: {package} ...")
-                try:
-                    result = subprocess.run(
-                        [sys.executable, "-m", "pip", "install", package],
-                        capture_output=True, text=True
-                    )
-                    self.print_info(result.stdout)
-                    if result.stderr:
-                        self.print_error(result.stderr)
-                except Exception as e:
-                    self.print_error(f"Error: {e}")
-            elif cmd == "help":
-                self.show_help()
-            else:
-                self.print_error(self._lang(
-                    "Unknown command. Type 'help' for available commands.",
-                    "Nepoznata komanda. Ukucajte 'help' za dostupne komande."
-                ))
-        except Exception as e:
-            self.print_error(f"Internal error: {e}")
-
-    def code(self) -> None:
-        """Open a Python code editor and runner"""
-        self.print_info(self._lang("Opening Python code editor...", "Otvaranje Python uređivača koda..."))
-
-        # Create a new window for the code editor
-        self.code_editor = QWidget()  # Use self to keep a reference to the window
-        self.code_editor.setWindowTitle("Python Code Editor")
-        self.code_editor.resize(800, 600)
-
-        layout = QVBoxLayout(self.code_editor)
-
-        # Code input area
-        code_input = QTextEdit()
-        code_input.setStyleSheet(
-            "background-color: black; color: white; font-family: Consolas, monospace; font-size: 14px;"
-        )
-        layout.addWidget(code_input)
-
-        # Run button
-        run_button = QPushButton(self._lang("Run Code", "Pokreni kod"))
-        run_button.setStyleSheet(
-            "background-color: #222; color: white; font-family: Consolas, monospace; font-size: 14px;"
-        )
-        layout.addWidget(run_button)
-
-        # Output area
-        code_output = QTextEdit()
-        code_output.setReadOnly(True)
-        code_output.setStyleSheet(
-            "background-color: black; color: white; font-family: Consolas, monospace; font-size: 14px;"
-        )
-        layout.addWidget(code_output)
-
-        def run_code():
-            """Run the Python code and display the output"""
-            code = code_input.toPlainText()
-
-            try:
-                # Redirect stdout to capture print statements
-                import io
-                import contextlib
-
-                output_buffer = io.StringIO()
-
-                # Custom input function to simulate user input
-                def custom_input(prompt=""):
-                    code_output.append(prompt)  # Display the prompt in the output area
-                    QApplication.processEvents()  # Process GUI events to update the output area
-                    while True:
-                        # Wait for user input in the GUI
-                        user_input, ok = QInputDialog.getText(self.code_editor, "Input", prompt)
-                        if ok:
-                            return user_input
-                        else:
-                            raise KeyboardInterrupt("Input canceled by user")
-
-                # Redirect stdout and override input()
-                with contextlib.redirect_stdout(output_buffer):
-                    exec_globals = {"input": custom_input}  # Override input() in the exec environment
-                    exec(code, exec_globals)
-
-                # Get the captured output and display it
-                output = output_buffer.getvalue()
-                code_output.setPlainText(self._lang(f"Output:\n{output}", f"Izlaz:\n{output}"))
-            except ModuleNotFoundError as e:
-                # Handle missing libraries
-                missing_lib = str(e).split("'")[1]
-                code_output.setPlainText(self._lang(
-                    f"Error: Missing library '{missing_lib}'. Try installing it with 'pip install {missing_lib}'.",
-                    f"Greška: Nedostaje biblioteka '{missing_lib}'. Pokušajte da je instalirate sa 'pip install {missing_lib}' in the BetterC OS."
-                ))
-            except Exception as e:
-                code_output.setPlainText(self._lang(f"Error: {e}", f"Greška: {e}"))
-        run_button.clicked.connect(run_code)
-        self.code_editor.setLayout(layout)
-        self.code_editor.show()
+    def run_script(self, path: str) -> tuple[int, float]:
+        return self.session.run_script(path)
 
+    @property
+    def ended(self) -> bool:
+        return self.session.ended
 
+    def shutdown(self) -> None:
+        """Flush unsaved user data and the activity log; safe to call more than once"""
+        self.session.shutdown()
 
+    def closeEvent(self, event) -> None:
+        self.shutdown()
+        super().closeEvent(event)
@@ -1,15 +1,710 @@
+import hashlib
 import json
 import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# data/ and logs/ live next to main.py (or the frozen executable), wherever the process was started
+BASE_DIR = os.path.dirname(sys.executable if getattr(sys, "frozen", False)
+                           else os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+USERS_FILE = os.path.join(DATA_DIR, "users.json")
+USERS_DIR = os.path.join(DATA_DIR, "users")
+DB_FILE = os.path.join(DATA_DIR, "users.db")
+STORE_BACKEND = os.environ.get("TERMINALOS_STORE", "json")  # "json" or "sqlite"
+HISTORY_LIMIT = 1000  # calculator results kept per user
+COMPACT_THRESHOLD = 500  # journal lines beyond what they fold down to before a background compaction
+WRITE_DEBOUNCE = 0.5  # seconds a burst of changes is collected before one write
+RETRY_DELAY = 5  # seconds before a write that failed is tried again
+
+
+def _read_journal(path):
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # torn write at the tail, everything after it is garbage
+    return records
 
-USERS_FILE = "data/users.json"
 
 def load_users():
+    """The old single-file users.json, imported by JournalStore on first use"""
     if not os.path.exists(USERS_FILE):
         return {}
     with open(USERS_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
+
 def save_users(users):
     os.makedirs(os.path.dirname(USERS_FILE), exist_ok=True)
-    with open(USERS_FILE, "w", encoding="utf-8") as f:
+    tmp_path = USERS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(users, f, indent=4, ensure_ascii=False)
+    os.replace(tmp_path, USERS_FILE)
+
+
+def write_json_atomic(path, data):
+    """Replace a JSON file in one step, so a reader never sees it half written"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def delete_note(notes, index, text=None):
+    """Delete a note by position, or by text if another session has moved it"""
+    if 0 <= index < len(notes) and (text is None or notes[index] == text):
+        notes.pop(index)
+    elif text is not None and text in notes:
+        notes.remove(text)
+
+
+def _fold_notes(ops, notes=None):
+    notes = [] if notes is None else notes
+    for op in ops:
+        if op["op"] in ("add", "note_add"):
+            notes.append(op["text"])
+        elif op["op"] in ("delete", "note_delete"):
+            delete_note(notes, op["index"], op.get("text"))
+    return notes
+
+
+class FileLock:
+    """Exclusive lock on a file, shared between processes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        if os.name == "nt":
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10 seconds, keep waiting
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if os.name == "nt":
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+def user_dir_name(username):
+    """Filesystem-safe shard name for a username"""
+    slug = "".join(c if c.isalnum() or c in "-_" else "_" for c in username)[:40]
+    # The digest keeps names apart that only differ in case or in characters
+    # that had to be replaced above.
+    digest = hashlib.sha1(username.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}"
+
+
+class UserRecord:
+    """One user's data. History and notes are read from the store on first use."""
+
+    def __init__(self, store, username, profile):
+        self.store = store
+        self.username = username
+        self.password = profile["password"]
+        self.language = profile.get("language", 0)
+        self.version = profile.get("version", 0)
+        self._history = None
+        self._notes = None
+
+    @property
+    def history(self):
+        if self._history is None:
+            self._history = self.store.load_history(self.username)
+        return self._history
+
+    @property
+    def notes(self):
+        if self._notes is None:
+            self._notes = self.store.load_notes(self.username)
+        return self._notes
+
+    def refresh(self, pending_history=(), pending_note_ops=()):
+        """Re-read what is loaded from the store and replay unsaved changes on top"""
+        if self._history is not None:
+            history = self.store.load_history(self.username) + list(pending_history)
+            self._history = history[-HISTORY_LIMIT:]
+        if self._notes is not None:
+            self._notes = _fold_notes(pending_note_ops, self.store.load_notes(self.username))
+
+
+class UserStore(ABC):
+    """Storage backend interface for user accounts and their data.
+
+    Changes are described as delta records, {"op": ..., "user": ..., ...},
+    with op one of create, language, history, note_add and note_delete.
+    """
+
+    @abstractmethod
+    def get_profile(self, username):
+        """Return {"password": ..., "language": ..., "version": ...} or None if there is no such user"""
+
+    @abstractmethod
+    def load_history(self, username):
+        ...
+
+    @abstractmethod
+    def load_notes(self, username):
+        ...
+
+    def get_user(self, username):
+        """Return a lazily loaded UserRecord or None if the user does not exist"""
+        profile = self.get_profile(username)
+        if profile is None:
+            return None
+        return UserRecord(self, username, profile)
+
+    def create_user(self, username, password):
+        self.append([{"op": "create", "user": username, "password": password, "language": 0}])
+
+    @abstractmethod
+    def append(self, records):
+        """Persist a batch of delta records.
+
+        Returns {username: (old_version, new_version)} for every user that was
+        written. The version of a user goes up by one with every batch, so a
+        session whose last known version differs from old_version knows that
+        another session changed the user in between.
+        """
+
+    def import_users(self, users):
+        """Bulk load a users dict as produced by load_users()"""
+        records = []
+        for name, data in users.items():
+            records.append({"op": "create", "user": name, "password": data["password"],
+                            "language": data.get("language", 0)})
+            if data.get("history"):
+                records.append({"op": "history", "user": name, "values": data["history"]})
+            for note in data.get("notes", []):
+                records.append({"op": "note_add", "user": name, "text": note})
+        self.append(records)
+
+    def close(self):
+        pass
+
+
+class JournalStore(UserStore):
+    """Per-user shards of append-only journals under USERS_DIR.
+
+    Every user has a directory of its own: profile.json holds the password
+    and language, history.jsonl and notes.jsonl are append-only journals that
+    are only read when a session first needs them. A save therefore costs one
+    small append to the files of the user that changed, whatever the size of
+    the rest of the installation. A journal whose file holds COMPACT_THRESHOLD
+    more lines than it folds down to (superseded history, deleted notes) is
+    folded back into a plain list on a background thread. The line count
+    comes from the file itself: it is taken whenever a journal is read and
+    kept up to date by every append made under the lock.
+
+    Several TerminalOS processes may share the directory. Each user has a
+    lock file next to its shard, and every write re-reads the shard under
+    that lock, so sessions of different users never wait for each other and
+    sessions of the same user append to, rather than overwrite, each other's
+    changes.
+
+    The old single-file data/users.json is imported on first use.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or USERS_DIR
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self._lines = {}  # journal path -> (lines in the file, entries they fold down to)
+        self._compactors = []
+        os.makedirs(os.path.dirname(os.path.abspath(self.root)), exist_ok=True)
+        with FileLock(os.path.abspath(self.root) + ".lock"):
+            if not os.path.isdir(self.root):
+                os.makedirs(self.root)
+                if os.path.exists(USERS_FILE):
+                    self.import_users(load_users())
+
+    def _user_dir(self, username):
+        return os.path.join(self.root, user_dir_name(username))
+
+    @contextmanager
+    def _lock(self, username):
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault(username, threading.Lock())
+        with thread_lock, FileLock(self._user_dir(username) + ".lock"):
+            yield
+
+    def _read_profile(self, username):
+        path = os.path.join(self._user_dir(username), "profile.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+        return profile if profile.get("username") == username else None
+
+    def get_profile(self, username):
+        return self._read_profile(username)
+
+    def usernames(self):
+        """Every user that has a shard, in no particular order"""
+        names = []
+        for entry in os.scandir(self.root):
+            path = os.path.join(entry.path, "profile.json")
+            if entry.is_dir() and os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    names.append(json.load(f)["username"])
+        return names
+
+    def load_history(self, username):
+        with self._lock(username):
+            return self._read_user_journal(username, "history.jsonl")
+
+    def load_notes(self, username):
+        with self._lock(username):
+            return self._read_user_journal(username, "notes.jsonl")
+
+    def _read_user_journal(self, username, name):
+        # Called with the user's lock held
+        path = os.path.join(self._user_dir(username), name)
+        entries = _read_journal(path)
+        folded = _fold_notes(entries) if name == "notes.jsonl" else entries[-HISTORY_LIMIT:]
+        self._count_lines(username, path, len(entries), len(folded))
+        return folded
+
+    def append(self, records):
+        versions = {}
+        if not records:
+            return versions
+        by_user = {}
+        for record in records:
+            by_user.setdefault(record["user"], []).append(record)
+        for username, user_records in by_user.items():
+            with self._lock(username):
+                version = self._append_user(username, user_records)
+            if version is not None:
+                versions[username] = version
+        return versions
+
+    def _append_user(self, username, records):
+        # Called with the user's lock held. The profile is read back from disk
+        # so that the version and language written by other processes survive.
+        user_dir = self._user_dir(username)
+        profile = self._read_profile(username)
+        old_version = profile.get("version", 0) if profile else 0
+        history, note_ops = [], []
+        for record in records:
+            op = record["op"]
+            if op == "create":
+                if profile is not None:
+                    continue  # lost a registration race; like SQLite's INSERT OR IGNORE, keep what is there
+                os.makedirs(user_dir, exist_ok=True)
+                profile = {"username": username, "password": record["password"],
+                           "language": record.get("language", 0), "version": old_version}
+                # A new account starts with empty journals, even if a half-deleted shard left some
+                for name in ("history.jsonl", "notes.jsonl"):
+                    if os.path.exists(os.path.join(user_dir, name)):
+                        os.remove(os.path.join(user_dir, name))
+                history, note_ops = [], []
+            elif profile is None:
+                continue
+            elif op == "language":
+                profile["language"] = record["value"]
+            elif op == "history":
+                history.extend(record["values"])
+            elif op == "note_add":
+                note_ops.append({"op": "add", "text": record["text"]})
+            elif op == "note_delete":
+                note_ops.append({"op": "delete", "index": record["index"], "text": record.get("text")})
+        if profile is None:
+            return None
+        for name, entries in (("history.jsonl", history[-HISTORY_LIMIT:]), ("notes.jsonl", note_ops)):
+            if entries:
+                self._append_journal(username, os.path.join(user_dir, name), entries)
+        profile["version"] = old_version + 1
+        write_json_atomic(os.path.join(user_dir, "profile.json"), profile)
+        return old_version, old_version + 1
+
+    def _append_journal(self, username, path, entries):
+        # Called with the user's lock held
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+        counted = self._lines.get(path)
+        if counted is None:
+            return  # not read by this process yet; counted when it is
+        lines, folded = counted
+        if path.endswith("notes.jsonl"):
+            folded = max(0, folded + sum(1 if entry["op"] == "add" else -1 for entry in entries))
+        else:
+            folded = min(HISTORY_LIMIT, folded + len(entries))
+        self._count_lines(username, path, lines + len(entries), folded)
+
+    def _count_lines(self, username, path, lines, folded):
+        # Called with the user's lock held
+        if lines - folded >= COMPACT_THRESHOLD:
+            lines = folded  # what the compaction leaves; don't start another meanwhile
+            compactor = threading.Thread(target=self._compact, args=(username, path), daemon=True)
+            self._compactors = [t for t in self._compactors if t.is_alive()] + [compactor]
+            compactor.start()
+        self._lines[path] = (lines, folded)
+
+    def _compact(self, username, path):
+        with self._lock(username):
+            entries = _read_journal(path)
+            if path.endswith("notes.jsonl"):
+                entries = [{"op": "add", "text": text} for text in _fold_notes(entries)]
+            else:
+                entries = entries[-HISTORY_LIMIT:]
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+            os.replace(tmp_path, path)
+            self._lines[path] = (len(entries), len(entries))
+
+    def close(self):
+        for compactor in self._compactors:
+            compactor.join()
+        self._compactors = []
+
+
+class SQLiteStore(UserStore):
+    """User data in SQLite with one row per user, history value and note.
+
+    Writes run in BEGIN IMMEDIATE transactions, which SQLite serializes
+    across processes, and bump the version column of every user they touch.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            language INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            text TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS history_user ON history(user_id, id);
+        CREATE INDEX IF NOT EXISTS notes_user ON notes(user_id, id);
+    """
+
+    def __init__(self, path=None):
+        path = path or DB_FILE
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        # Transactions are opened explicitly, see append()
+        import sqlite3  # only this backend needs it
+
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(users)")]
+        if "version" not in columns:  # databases created before versioning
+            self._db.execute("ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    def _user_id(self, username):
+        row = self._db.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def get_profile(self, username):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT password, language, version FROM users WHERE username = ?", (username,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"password": row[0], "language": row[1], "version": row[2]}
+
+    def load_history(self, username):
+        with self._lock:
+            return [json.loads(value) for (value,) in self._db.execute(
+                "SELECT value FROM history WHERE user_id = (SELECT id FROM users WHERE username = ?) "
+                "ORDER BY id", (username,))]
+
+    def load_notes(self, username):
+        with self._lock:
+            return [text for (text,) in self._db.execute(
+                "SELECT text FROM notes WHERE user_id = (SELECT id FROM users WHERE username = ?) "
+                "ORDER BY id", (username,))]
+
+    def append(self, records):
+        versions = {}
+        if not records:
+            return versions
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for record in records:
+                    self._apply(record)
+                for username in {record["user"] for record in records}:
+                    self._db.execute("UPDATE users SET version = version + 1 WHERE username = ?", (username,))
+                    row = self._db.execute("SELECT version FROM users WHERE username = ?", (username,)).fetchone()
+                    if row is not None:
+                        versions[username] = (row[0] - 1, row[0])
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return versions
+
+    def _apply(self, record):
+        op = record["op"]
+        if op == "create":
+            self._db.execute(
+                "INSERT OR IGNORE INTO users (username, password, language) VALUES (?, ?, ?)",
+                (record["user"], record["password"], record.get("language", 0))
+            )
+            return
+        user_id = self._user_id(record["user"])
+        if user_id is None:
+            return
+        if op == "language":
+            self._db.execute("UPDATE users SET language = ? WHERE id = ?", (record["value"], user_id))
+        elif op == "history":
+            self._db.executemany(
+                "INSERT INTO history (user_id, value) VALUES (?, ?)",
+                [(user_id, json.dumps(value)) for value in record["values"]]
+            )
+            self._db.execute(
+                "DELETE FROM history WHERE user_id = ? AND id <= ("
+                "SELECT id FROM history WHERE user_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (user_id, user_id, HISTORY_LIMIT)
+            )
+        elif op == "note_add":
+            self._db.execute("INSERT INTO notes (user_id, text) VALUES (?, ?)", (user_id, record["text"]))
+        elif op == "note_delete":
+            # Same rule as delete_note(): by position, or by text if it moved
+            row = self._db.execute(
+                "SELECT id, text FROM notes WHERE user_id = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (user_id, record["index"])
+            ).fetchone()
+            text = record.get("text")
+            if row is not None and (text is None or row[1] == text):
+                self._db.execute("DELETE FROM notes WHERE id = ?", (row[0],))
+            elif text is not None:
+                self._db.execute(
+                    "DELETE FROM notes WHERE id = ("
+                    "SELECT id FROM notes WHERE user_id = ? AND text = ? ORDER BY id LIMIT 1)",
+                    (user_id, text)
+                )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class UserDataWriter:
+    """Apply one user's changes to its UserRecord and save them in the background.
+
+    Changes update the record in memory and mark fields dirty instead of
+    touching the disk. The first change starts a debounce window; everything
+    that arrives within it goes out as a single store.append() call. Nothing
+    is written while nothing is dirty. If the store reports that another
+    session wrote the same user in between, the loaded parts of the record
+    are re-read so this session sees the merged result.
+
+    A write that fails (a full disk, a locked file) is reported to stderr
+    and to on_error, and its changes go back in front of the dirty ones, to
+    be tried again after RETRY_DELAY seconds.
+    """
+
+    def __init__(self, record, debounce=WRITE_DEBOUNCE, on_write=None, on_error=None):
+        self.record = record
+        self.store = record.store
+        self.username = record.username
+        self.debounce = debounce
+        self.on_write = on_write
+        self.on_error = on_error
+        self._failing = False
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._reset_dirty()
+        self._held = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"writer-{self.username}", daemon=True)
+        self._thread.start()
+
+    def _reset_dirty(self):
+        self._language = None
+        self._history = []
+        self._note_ops = []
+
+    def _has_dirty(self):
+        return self._language is not None or self._history or self._note_ops
+
+    def set_language(self, language):
+        with self._cond:
+            self.record.language = language
+            self._language = language
+            self._cond.notify()
+
+    def add_history(self, values):
+        with self._cond:
+            history = self.record.history
+            history.extend(values)
+            del history[:-HISTORY_LIMIT]
+            self._history.extend(values)
+            del self._history[:-HISTORY_LIMIT]
+            self._cond.notify()
+
+    def add_note(self, text):
+        with self._cond:
+            self.record.notes.append(text)
+            self._note_ops.append({"op": "note_add", "user": self.username, "text": text})
+            self._cond.notify()
+
+    def delete_note(self, index):
+        """Delete the note at index and return its text"""
+        with self._cond:
+            text = self.record.notes.pop(index)
+            self._note_ops.append({"op": "note_delete", "user": self.username, "index": index, "text": text})
+            self._cond.notify()
+            return text
+
+    def _take_records(self):
+        # Called with self._cond held
+        records = []
+        if self._language is not None:
+            records.append({"op": "language", "user": self.username, "value": self._language})
+        if self._history:
+            records.append({"op": "history", "user": self.username, "values": self._history})
+        records.extend(self._note_ops)
+        self._reset_dirty()
+        return records
+
+    def _requeue(self, records):
+        # Called with self._cond held. Changes made since the failed write are newer, so they stay on top.
+        note_ops = []
+        for record in records:
+            if record["op"] == "language":
+                if self._language is None:
+                    self._language = record["value"]
+            elif record["op"] == "history":
+                self._history[:0] = record["values"]
+                del self._history[:-HISTORY_LIMIT]
+            else:
+                note_ops.append(record)
+        self._note_ops[:0] = note_ops
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while (not self._has_dirty() or self._held) and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + self.debounce
+                while not self._closed and (remaining := deadline - time.monotonic()) > 0:
+                    self._cond.wait(remaining)
+                if self._held and not self._closed:
+                    continue  # batch() writes it when the batch ends
+            if not self.flush():
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed, RETRY_DELAY)
+
+    def flush(self):
+        """Write everything that is dirty right now, in the calling thread.
+
+        Returns False if the store failed; the changes are then kept for the next try.
+        """
+        # Taking the write lock before the dirty state is handed over keeps
+        # batches from overtaking each other between this and the worker.
+        with self._write_lock:
+            with self._cond:
+                records = self._take_records()
+            if not records:
+                return True
+            try:
+                versions = self.store.append(records)
+            except Exception as e:
+                with self._cond:
+                    self._requeue(records)
+                self._report(e)
+                return False
+            if self._failing:
+                self._failing = False
+                print(f"Saving {self.username}'s data works again.", file=sys.stderr)
+            old_version, new_version = versions.get(self.username, (None, None))
+            if old_version is not None and old_version != self.record.version:
+                with self._cond:
+                    self.record.refresh(self._history, self._note_ops)
+            if new_version is not None:
+                self.record.version = new_version
+            if self.on_write:
+                self.on_write(records)
+            return True
+
+    def _report(self, error):
+        # Once per run of failures, not on every retry
+        if self._failing:
+            return
+        self._failing = True
+        print(f"Saving {self.username}'s data failed, retrying in {RETRY_DELAY} s: {error!r}", file=sys.stderr)
+        if self.on_error:
+            self.on_error(error)
+
+    @contextmanager
+    def batch(self):
+        """Hold background writes until the block ends, then write everything at once"""
+        with self._cond:
+            self._held += 1
+        try:
+            yield self
+        finally:
+            with self._cond:
+                self._held -= 1
+                held = self._held
+            if not held:
+                self.flush()
+
+    def close(self):
+        """Flush pending changes and stop the background thread"""
+        if not self._closed:
+            with self._cond:
+                self._closed = True
+                self._cond.notify()
+            self._thread.join()
+        self.flush()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide user data store for STORE_BACKEND"""
+    global _store
+    with _store_lock:  # the boot screen opens it on a worker thread
+        if _store is None:
+            _store = SQLiteStore() if STORE_BACKEND == "sqlite" else JournalStore()
+    return _store
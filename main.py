@@ -1,9 +1,110 @@
-from PyQt6.QtWidgets import QApplication
-from core.loader import BootLoader
+import argparse
 import sys
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="BetterC OS terminal")
+    parser.add_argument("--headless", action="store_true", help="run in the console, without Qt (needs --user)")
+    parser.add_argument("--script", metavar="FILE", help="run the commands in FILE as --user")
+    parser.add_argument("--user", help="account the session runs as")
+    parser.add_argument("--password", help="create the account with this password if it does not exist")
+    parser.add_argument("--quiet", action="store_true", help="do not draw output; exit when the script ends")
+    parser.add_argument("--import-report", action="store_true",
+                        help="show how long startup spends importing each module (with --headless: the console path)")
+    args = parser.parse_args()
+    if args.import_report:
+        return args
+    if (args.script or args.headless) and not args.user:
+        parser.error("--script and --headless need --user")
+    return args
+
+
+def open_user(args):
+    """The UserRecord for --user, created with --password if missing"""
+    from core.utils import get_store
+
+    store = get_store()
+    record = store.get_user(args.user)
+    if record is None:
+        if not args.password:
+            print(f"No user '{args.user}'; pass --password to create it.", file=sys.stderr)
+            return None
+        store.create_user(args.user, args.password)
+        record = store.get_user(args.user)
+    return record
+
+
+def run_headless(args):
+    from core import headless
+
+    record = open_user(args)
+    if record is None:
+        return 1
+    try:
+        return headless.run(args.user, record, script=args.script, quiet=args.quiet)
+    except (OSError, RecursionError) as e:
+        print(f"Cannot run script: {e}", file=sys.stderr)
+        return 1
+
+
+def run_script(app, args):
+    from core import startup_probe
+    from core.processes import BlockingProcesses, script_exit_code
+    from core.terminal import TerminalScreen
+
+    record = open_user(args)
+    if record is None:
+        return 1
+    terminal = TerminalScreen(args.user, record, quiet=args.quiet)
+    if args.quiet:
+        # No event loop runs after a quiet script, so its processes and
+        # background results have to finish while it runs
+        terminal.session.processes = BlockingProcesses()
+        terminal.session.post = None
+    startup_probe.mark("first_prompt")
+    try:
+        count, seconds = terminal.run_script(args.script)
+    except (OSError, RecursionError) as e:
+        print(f"Cannot run script: {e}", file=sys.stderr)
+        terminal.shutdown()
+        return 1
+    rate = count / seconds if seconds else 0
+    print(f"Ran {count} commands in {seconds:.3f}s ({rate:.0f} commands/s).")
+    if args.quiet or terminal.ended:
+        # No event loop runs after this: shutdown() unhooks post and cancels
+        # the background work that hasn't started, what is running is waited for
+        terminal.shutdown()
+        terminal.session.wait_background()
+        return script_exit_code(terminal.session.processes)
+    terminal.show()
+    return app.exec()
+
+
 def main():
+    if sys.argv[1:2] == ["--code-worker"]:
+        # A code editor worker (see core.code_runner); frozen builds have no other interpreter to start
+        from core import code_worker
+
+        code_worker.main()
+        return
+    args = parse_args()
+    if args.import_report:
+        from core.import_report import report
+
+        try:
+            print(report("headless" if args.headless else "gui"))
+        except RuntimeError as e:
+            sys.exit(f"Cannot measure imports: {e}")
+        return
+    if args.headless:
+        sys.exit(run_headless(args))  # PyQt6 is never imported on this path
+
+    from PyQt6.QtWidgets import QApplication
+    from core.loader import BootLoader
+
     app = QApplication(sys.argv)
+    if args.script:
+        sys.exit(run_script(app, args))
     window = BootLoader()
     window.show()
     sys.exit(app.exec())
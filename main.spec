@@ -1,4 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+from PyInstaller.utils.hooks import collect_submodules
+
+sys.path.insert(0, SPECPATH)  # so collect_submodules can import core.commands
 
 
 a = Analysis(
@@ -6,7 +11,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=collect_submodules('core.commands'),  # imported lazily by the command registry
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
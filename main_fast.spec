@@ -0,0 +1,76 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Startup-optimized build:  pyinstaller main_fast.spec  ->  dist/main_fast/main_fast
+#
+# Unlike main.spec this is a one-folder build: nothing is unpacked to a
+# temporary directory on each launch, and nothing is UPX-compressed, so
+# nothing has to be decompressed either. Bytecode is compiled with -OO, and
+# Qt modules the terminal never imports are left out. Compare the two with
+# benchmarks/startup.py.
+#
+# The code editor runs snippets with this same executable (main.py
+# --code-worker), so a snippet can only import what is bundled: the modules
+# the terminal itself uses plus SNIPPET_MODULES. Other stdlib modules and
+# anything installed with pip_install are not available in a frozen build.
+import sys
+
+from PyInstaller.utils.hooks import collect_submodules
+
+sys.path.insert(0, SPECPATH)  # so collect_submodules can import core.commands
+
+# Bundled for code editor snippets although the terminal doesn't import them
+SNIPPET_MODULES = ['unittest', 'doctest']
+
+# Only QtCore, QtGui and QtWidgets are used
+QT_EXCLUDES = [
+    'PyQt6.' + module for module in (
+        'QtBluetooth', 'QtDBus', 'QtDesigner', 'QtHelp', 'QtMultimedia', 'QtMultimediaWidgets',
+        'QtNetwork', 'QtNfc', 'QtOpenGL', 'QtOpenGLWidgets', 'QtPdf', 'QtPdfWidgets', 'QtPositioning',
+        'QtPrintSupport', 'QtQml', 'QtQuick', 'QtQuick3D', 'QtQuickWidgets', 'QtRemoteObjects',
+        'QtSensors', 'QtSerialPort', 'QtSpatialAudio', 'QtSql', 'QtSvg', 'QtSvgWidgets', 'QtTest',
+        'QtTextToSpeech', 'QtWebChannel', 'QtWebSockets', 'QtXml', 'uic', 'lupdate',
+    )
+]
+
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    # core.commands modules are imported lazily by the command registry
+    hiddenimports=collect_submodules('core.commands') + SNIPPET_MODULES,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=QT_EXCLUDES + ['tkinter'],
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='main_fast',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='main_fast',
+)
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import activity_log, command_history, utils  # noqa: E402
+from core.engine import OutputSink, ScriptInput, Session  # noqa: E402
+
+
+class ListOutput(OutputSink):
+    def __init__(self):
+        self.lines = []
+
+    def write_line(self, text, color="white", bold=False):
+        self.lines.append(text)
+        return len(self.lines) - 1
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point every store and log at a fresh directory"""
+    monkeypatch.setattr(utils, "USERS_FILE", str(tmp_path / "users.json"))
+    monkeypatch.setattr(utils, "USERS_DIR", str(tmp_path / "users"))
+    monkeypatch.setattr(activity_log, "LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setattr(command_history, "COMMAND_HISTORY_DIR", str(tmp_path / "history"))
+    return tmp_path
+
+
+@pytest.fixture
+def session(data_dir):
+    store = utils.JournalStore(str(data_dir / "users"))
+    store.create_user("tester", "secret")
+    session = Session("tester", store.get_user("tester"), ListOutput(), ScriptInput(iter([])))
+    yield session
+    session.shutdown()
+    store.close()
@@ -0,0 +1,15 @@
+import os
+
+from core.activity_log import ActivityLog
+
+
+def test_old_logs_are_kept_by_default(data_dir):
+    log = ActivityLog("tester", log_dir=str(data_dir / "logs"))
+    old = os.path.join(log.directory, "activity-2001-01-01.jsonl")
+    os.makedirs(log.directory, exist_ok=True)
+    with open(old, "w", encoding="utf-8") as f:
+        f.write('{"ts": 978307200, "event": "login"}\n')
+    log.log("command", command="help")
+    log.close()
+    assert os.path.exists(old)
+    assert [entry["event"] for entry in log.query()] == ["login", "command"]
@@ -0,0 +1,8 @@
+def test_log_option_without_value(session):
+    session.execute("log --limit", echo=False)
+    assert "missing value for --limit" in session.output.lines[-1]
+
+
+def test_ascii_option_without_value(session):
+    session.execute("ascii --width", echo=False)
+    assert "missing value for --width" in session.output.lines[-1]
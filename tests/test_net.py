@@ -0,0 +1,44 @@
+import threading
+from concurrent.futures import wait
+
+from core import net
+
+
+class BlockingClient(net.HttpClient):
+    """Answers every request once `release` is set; one worker, so later fetches queue"""
+
+    def __init__(self):
+        super().__init__(workers=1)
+        self.release = threading.Event()
+        self.submitted = []
+
+    def get_json(self, url, timeout=net.TIMEOUT):
+        self.release.wait(5)
+        return {"joke": "late joke"}
+
+    def submit(self, function, *args):
+        future = super().submit(function, *args)
+        self.submitted.append(future)
+        return future
+
+
+def test_ending_a_session_with_a_fetch_pending(session, data_dir, monkeypatch):
+    client = BlockingClient()
+    feed = net.JokeFeed(client, cache_file=str(data_dir / "jokes.json"))
+    monkeypatch.setattr(net, "_client", client)
+    monkeypatch.setattr(net, "_feed", feed)
+    posted = []
+    session.post = posted.append
+
+    session.execute("random_joke", echo=False)
+    feed.refill()  # prefetches queued behind the fetch
+    session.shutdown()
+    client.release.set()
+    wait(client.submitted, timeout=5)
+
+    fetch, *prefetches = client.submitted
+    assert fetch.result() == "late joke"
+    assert prefetches and all(future.cancelled() for future in prefetches)
+    assert len(client.submitted) == 1 + len(prefetches)  # nothing refilled after the session ended
+    assert posted == []
+    assert feed.closed and net._feed is None